@@ -7,22 +7,42 @@ __version__ = "0.2.0"
 __author__: str = "Corey Rayburn Yung"
 
 __all__: list[str] = [
+    "Arbiter",
     "Assembler",
+    "Cacher",
     "Classer",
+    "Deadline",
+    "Deferrer",
     "Delegate",
+    "DiskCache",
     "Factory",
     "Flexer",
+    "Histogram",
+    "Injector",
     "Instancer",
+    "Layout",
     "Manager",
     "Manufacturer",
     "Producer",
+    "Profile",
     "Registrar",
+    "Rule",
     "Scribe",
     "Sourcerer",
     "Subclasser",
+    "TrackedDict",
+    "TrackedList",
+    "WarmPool",
     "finalize",
+    "finalize_columns",
+    "hot_reload",
     "inject_attributes",
+    "inject_attributes_many",
+    "instantiate",
+    "instantiate_columns",
     "is_constructor",
+    "load_recipes",
+    "profile",
     "set_compatibility_rule",
     "set_keyer",
     "set_method_namer",
@@ -32,9 +52,12 @@ __all__: list[str] = [
 
 
 from .base import Factory, Manager, Producer
+from .caches import Cacher, DiskCache
 from .clusters import Manufacturer
-from .dispatchers import Delegate, Sourcerer
-from .managers import Assembler
+from .dispatchers import Arbiter, Delegate, Layout, Rule, Sourcerer
+from .injectors import Injector
+from .loaders import load_recipes
+from .managers import Assembler, Deadline, Histogram
 from .options import (
     set_compatibility_rule,
     set_keyer,
@@ -42,7 +65,18 @@ from .options import (
     set_overwrite_rule,
     set_verbose_rule,
 )
-from .producers import Classer, Flexer, Instancer
+from .pools import WarmPool
+from .producers import Classer, Deferrer, Flexer, Instancer
+from .profilers import Profile, profile
 from .prototypers import Scribe
 from .registries import Registrar, Subclasser
-from .shared import finalize, inject_attributes, is_constructor
+from .shared import (
+    finalize,
+    finalize_columns,
+    inject_attributes,
+    inject_attributes_many,
+    instantiate,
+    instantiate_columns,
+    is_constructor,
+)
+from .trackers import TrackedDict, TrackedList, hot_reload
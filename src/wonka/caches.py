@@ -0,0 +1,300 @@
+"""Persistent caches for created items.
+
+Contents:
+    Cacher: mixin for `base.Factory` subclasses that stores the
+        results of the `create` class method in a `DiskCache`.
+    DiskCache: content-addressed store of created items in a local folder
+        that is shared between processes and evicts the least recently used
+        items when it exceeds a size limit.
+
+"""
+
+from __future__ import annotations
+
+import contextlib
+import dataclasses
+import hashlib
+import mmap
+import os
+import pathlib
+import pickle
+import threading
+from typing import Any, ClassVar
+
+from . import base, utilities
+
+
+@dataclasses.dataclass
+class DiskCache:
+    """Content-addressed store of created items in a local folder.
+
+    Each item is stored in its own file named by a hash of the factory that
+    created it and the arguments passed to that factory. Files are written to a
+    temporary name and then renamed, so readers in other processes never see a
+    partially written item. Stored items are read through a memory-mapped
+    file. Each hit refreshes the file's modification time, and when the total
+    size of the folder exceeds `max_bytes`, the least recently used files are
+    deleted.
+
+    Args:
+        folder: folder in which to store items.
+        max_bytes: total size of stored items above which the least recently
+            used items are deleted. Defaults to 1 GiB.
+        codec: object with `dumps` and `loads` functions used to convert items
+            to and from `bytes`. Defaults to the `pickle` module.
+
+    """
+
+    folder: str | pathlib.Path
+    max_bytes: int = 2**30
+    codec: Any = pickle
+    _size: int | None = dataclasses.field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _lock: threading.Lock = dataclasses.field(
+        default_factory=threading.Lock, init=False, repr=False, compare=False
+    )
+
+    """ Initialization Methods """
+
+    def __post_init__(self) -> None:
+        """Converts `folder` to a `pathlib.Path` and creates it."""
+        self.folder = utilities._pathlibify(self.folder)
+        self.folder.mkdir(parents=True, exist_ok=True)
+
+    """ Instance Methods """
+
+    def clear(self) -> None:
+        """Deletes every stored item."""
+        for path in self.folder.glob("*.cache"):
+            with contextlib.suppress(FileNotFoundError):
+                path.unlink()
+        with self._lock:
+            self._size = 0
+
+    def get(self, key: str) -> tuple[bool, Any]:
+        """Returns whether `key` is stored and, if so, its item.
+
+        Args:
+            key: key returned by the `key` method.
+
+        Returns:
+            `True` and the stored item if `key` is stored and can be read.
+                Otherwise (including if the stored file is truncated or
+                corrupt), `False` and `None`.
+
+        """
+        path = self._get_path(key)
+        try:
+            with (
+                open(path, "rb") as file,
+                mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as view,
+            ):
+                item = self.codec.loads(view)
+        except (
+            AttributeError,
+            EOFError,
+            ImportError,
+            IndexError,
+            KeyError,
+            OSError,
+            TypeError,
+            ValueError,
+            pickle.UnpicklingError,
+        ):
+            return False, None
+        with contextlib.suppress(FileNotFoundError):
+            os.utime(path)
+        return True, item
+
+    def key(
+        self,
+        factory: type[base.Factory] | base.Factory,
+        item: Any,
+        parameters: base.GenericDict | None = None,
+        **kwargs: Any,
+    ) -> str | None:
+        """Returns a stable key for a call to `create` on `factory`.
+
+        Arguments are encoded canonically (`dict`s and `set`s are sorted), so
+        the same arguments give the same key in every process, regardless of
+        `PYTHONHASHSEED`. Objects other than built-in scalars and containers
+        and dataclass instances are encoded with `pickle`.
+
+        Args:
+            factory: factory class or instance.
+            item: item passed to `create`.
+            parameters: parameters passed to `create`. Defaults to `None`.
+            kwargs: other keyword arguments passed to `create`.
+
+        Returns:
+            Hexadecimal hash of the factory's qualified name and the arguments,
+                or `None` if the arguments cannot be converted to `bytes`.
+
+        """
+        kind = factory if isinstance(factory, type) else type(factory)
+        name = f"{kind.__module__}.{kind.__qualname__}"
+        try:
+            data = _encode((item, parameters, kwargs))
+        except (pickle.PicklingError, TypeError, AttributeError):
+            return None
+        return hashlib.sha256(name.encode() + b"\0" + data).hexdigest()
+
+    def set(self, key: str, item: Any) -> None:
+        """Stores `item` under `key`, evicting old items if necessary.
+
+        Args:
+            key: key returned by the `key` method.
+            item: item to store.
+
+        """
+        data = self.codec.dumps(item)
+        path = self._get_path(key)
+        temporary = path.with_suffix(
+            f".{os.getpid()}.{threading.get_ident()}.tmp"
+        )
+        temporary.write_bytes(data)
+        try:
+            replaced = path.stat().st_size
+        except FileNotFoundError:
+            replaced = 0
+        temporary.replace(path)
+        with self._lock:
+            if self._size is not None:
+                self._size += len(data) - replaced
+        if self._get_size() > self.max_bytes:
+            self._evict()
+
+    """ Private Methods """
+
+    def _evict(self) -> None:
+        """Deletes the least recently used items until under `max_bytes`."""
+        entries = []
+        for path in self.folder.glob("*.cache"):
+            with contextlib.suppress(FileNotFoundError):
+                status = path.stat()
+                entries.append((status.st_mtime, status.st_size, path))
+        entries.sort()
+        size = sum(e[1] for e in entries)
+        for _, length, path in entries:
+            if size <= self.max_bytes:
+                break
+            with contextlib.suppress(FileNotFoundError):
+                path.unlink()
+            size -= length
+        with self._lock:
+            self._size = size
+
+    def _get_path(self, key: str) -> pathlib.Path:
+        """Returns the path of the file storing `key`."""
+        return self.folder / f"{key}.cache"
+
+    def _get_size(self) -> int:
+        """Returns the total size of stored items, scanning once if unknown."""
+        if self._size is None:
+            size = 0
+            for path in self.folder.glob("*.cache"):
+                with contextlib.suppress(FileNotFoundError):
+                    size += path.stat().st_size
+            with self._lock:
+                self._size = size
+        return self._size
+
+
+@dataclasses.dataclass
+class Cacher:
+    """Mixin that stores the results of `create` in a `DiskCache`.
+
+    `Cacher` should be listed before the `base.Factory` subclass it is mixed
+    into so that its `create` method is called first:
+
+    ```python
+    class Parser(wonka.Cacher, wonka.Delegate):
+        cache = wonka.DiskCache("~/.cache/parser")
+    ```
+
+    Calls whose arguments or results cannot be converted to `bytes` by the
+    cache's codec are passed through without being stored.
+
+    Attributes:
+        cache: store for created items. Defaults to `None`, which disables
+            caching.
+
+    """
+
+    cache: ClassVar[DiskCache | None] = None
+
+    """ Class Methods """
+
+    @classmethod
+    def create(
+        cls,
+        item: Any,
+        parameters: base.GenericDict | None = None,
+        **kwargs: base.Kwargs,
+    ) -> Any:
+        """Returns a stored item or creates and stores a new one.
+
+        Args:
+            item: data for construction of the returned item.
+            parameters: keyword arguments to pass or add to a created instance.
+                Defaults to `None`.
+            kwargs: allows subclass to take kwargs.
+
+        Returns:
+            Created item.
+
+        """
+        cache = cls.cache
+        key = (
+            None
+            if cache is None
+            else cache.key(cls, item, parameters, **kwargs)
+        )
+        if key is None:
+            return super().create(item, parameters=parameters, **kwargs)
+        found, value = cache.get(key)
+        if found:
+            return value
+        value = super().create(item, parameters=parameters, **kwargs)
+        with contextlib.suppress(
+            pickle.PicklingError, TypeError, AttributeError
+        ):
+            cache.set(key, value)
+        return value
+
+
+def _encode(value: Any) -> bytes:
+    """Returns bytes that identify `value` the same way in every process.
+
+    Args:
+        value: value to encode.
+
+    Raises:
+        TypeError: if `value` contains an object that cannot be pickled.
+
+    Returns:
+        Canonical encoding of `value`.
+
+    """
+    if value is None or isinstance(value, bool | int | float | complex | str):
+        return f"{type(value).__name__}:{value!r}".encode()
+    elif isinstance(value, bytes | bytearray):
+        return b"bytes:" + bytes(value).hex().encode()
+    elif isinstance(value, list | tuple):
+        inner = b",".join(_encode(v) for v in value)
+        return f"{type(value).__name__}(".encode() + inner + b")"
+    elif isinstance(value, set | frozenset):
+        inner = b",".join(sorted(_encode(v) for v in value))
+        return b"set{" + inner + b"}"
+    elif isinstance(value, dict):
+        pairs = sorted(_encode(k) + b":" + _encode(v) for k, v in value.items())
+        return b"dict{" + b",".join(pairs) + b"}"
+    elif dataclasses.is_dataclass(value) and not isinstance(value, type):
+        kind = type(value)
+        fields = {
+            f.name: getattr(value, f.name) for f in dataclasses.fields(value)
+        }
+        name = f"{kind.__module__}.{kind.__qualname__}"
+        return name.encode() + _encode(fields)
+    return b"pickle:" + pickle.dumps(value, protocol=4)
@@ -9,14 +9,29 @@ Contents:
 from __future__ import annotations
 
 import abc
+import concurrent.futures
 import contextlib
 import dataclasses
+import functools
+import graphlib
 import inspect
-from collections.abc import Hashable, MutableMapping
-from types import SimpleNamespace
+import types
+import weakref
+from collections.abc import (
+    Callable,
+    Hashable,
+    ItemsView,
+    Iterable,
+    Iterator,
+    KeysView,
+    Mapping,
+    MutableMapping,
+    Sequence,
+    ValuesView,
+)
 from typing import Any, ClassVar
 
-from . import base, options, registries, shared, utilities
+from . import base, options, registries, shared, trackers, utilities
 
 
 @dataclasses.dataclass
@@ -39,7 +54,9 @@ class Manufacturer(base.Cluster):
 
     """
 
-    contents: base.ConstructorDict = dataclasses.field(default_factory=dict)
+    contents: base.ConstructorDict = dataclasses.field(
+        default_factory=trackers.TrackedDict
+    )
 
     """ Instance Methods """
 
@@ -51,10 +68,12 @@ class Manufacturer(base.Cluster):
 
         Raises:
             TypeError: if all of the values of `item` are not `wonka`-compatible
-                factories or if `item` itself is not a `wonka`-compatible
-                factory.
+                factories, if `item` itself is not a `wonka`-compatible
+                factory, or if `contents` is frozen or a `subset` view.
 
         """
+        if not isinstance(self.contents, MutableMapping):
+            raise TypeError("contents is read-only and cannot be added to")
         if isinstance(item, MutableMapping):
             if all(shared.is_constructor(v) for v in item.values()):
                 self.contents.update(item)
@@ -64,7 +83,7 @@ class Manufacturer(base.Cluster):
                 )
                 raise TypeError(message)
         elif shared.is_constructor(item):
-            key = options._KEY_NAMER(item)
+            key = options._get_key(item)
             self.contents.update({key: item})
         else:
             message = (
@@ -73,6 +92,62 @@ class Manufacturer(base.Cluster):
             )
             raise TypeError(message)
 
+    def create_many(
+        self,
+        requests: Iterable[tuple[Hashable, Any, base.GenericDict | None]]
+        | Mapping[Hashable, Iterable[Any]],
+        executor: concurrent.futures.Executor | None = None,
+    ) -> list[Any]:
+        """Creates items with the stored constructors named in `requests`.
+
+        Requests are grouped by constructor so that each constructor is looked
+        up once and each group is created as a single batch. If a constructor
+        has a `create_many` method, the items in its group that share equal
+        parameters are passed to it in one call. If `executor` is passed, each
+        group is submitted to it as a separate task.
+
+        Args:
+            requests: either an iterable of (constructor name, item, parameters)
+                tuples or a mapping with keys that are constructor names and
+                values that are iterables of items to pass to that constructor
+                without parameters.
+            executor: executor used to create groups concurrently. Defaults to
+                `None`. If it is `None`, groups are created sequentially.
+
+        Raises:
+            KeyError: if a constructor name in `requests` is not in `contents`.
+
+        Returns:
+            Created items in the same order as `requests`.
+
+        """
+        if isinstance(requests, Mapping):
+            requests = (
+                (name, item, None)
+                for name, items in requests.items()
+                for item in items
+            )
+        groups: dict[Hashable, list[tuple[int, Any, Any]]] = {}
+        for index, (name, item, parameters) in enumerate(requests):
+            groups.setdefault(name, []).append((index, item, parameters))
+        constructors = {name: self.contents[name] for name in groups}
+        if executor is None:
+            batches = [
+                _create_group(constructors[name], group)
+                for name, group in groups.items()
+            ]
+        else:
+            futures = [
+                executor.submit(_create_group, constructors[name], group)
+                for name, group in groups.items()
+            ]
+            batches = [future.result() for future in futures]
+        results = [None] * sum(len(group) for group in groups.values())
+        for batch in batches:
+            for index, result in batch:
+                results[index] = result
+        return results
+
     def delete(self, item: Hashable) -> None:
         """Deletes `item` in `contents`.
 
@@ -83,70 +158,179 @@ class Manufacturer(base.Cluster):
         del self.contents[item]
         return
 
-    def items(self) -> tuple[tuple[Hashable, Any], ...]:
+    def freeze(self) -> None:
+        """Replaces `contents` with an immutable copy.
+
+        Frozen `contents` may be read safely from many threads without locks.
+        Any later attempt to add, change, or delete a constructor raises a
+        `TypeError`.
+
+        """
+        self.contents = types.MappingProxyType(dict(self.contents))
+        return
+
+    def items(self) -> ItemsView[Hashable, Any]:
         """Emulates Python `dict` `items` method.
 
         Returns:
-            A `tuple` equivalent to `dict.items()`.
+            A live view of the key/value pairs in `contents`.
 
         """
-        return tuple(zip(self.keys(), self.values(), strict=True))
+        return self.contents.items()
 
-    def keys(self) -> tuple[Hashable, ...]:
-        """Returns `contents` keys as a `tuple`.
+    def keys(self) -> KeysView[Hashable]:
+        """Emulates Python `dict` `keys` method.
 
         Returns:
-            A `tuple` equivalent to `dict.keys()`.
+            A live view of the keys in `contents`.
 
         """
-        return tuple(self.contents.keys())
-
-    # def subset(
-    #     self,
-    #     include: Hashable | Sequence[Hashable] | None = None,
-    #     exclude: Hashable | Sequence[Hashable] | None = None) -> Manufacturer:
-    #     """Returns a new instance with a subset of `contents`.
-
-    #     This method applies `include` before `exclude` if both are passed. If
-    #     `include` is None, all existing items will be added to the new subset
-    #     class instance before `exclude` is applied.
-
-    #     Args:
-    #         include: key(s) to include in the new `Manufacturer` instance.
-    #         exclude: key(s) to exclude from the new `Manufacturer` instance.
-
-    #     Raises:
-    #         ValueError: if `include` and `exclude` are both None.
-
-    #     Returns:
-    #         New instance with only keys from `include` and no keys in `exclude`.
-
-    #     """
-    #     if include is None and exclude is None:
-    #         message = 'either the include or exclude argument must not be None'
-    #         raise ValueError(message)
-    #     if include is None:
-    #         contents = copy.deepcopy(self.contents)
-    #     else:
-    #         include = list(utilities._iterify(include))
-    #         contents = {k: self.contents[k] for k in include}
-    #     if exclude is not None:
-    #         exclude = list(utilities._iterify(exclude))
-    #         contents = {
-    #             k: v for k, v in contents.items()
-    #             if k not in exclude}
-    #     new_dictionary = copy.deepcopy(self)
-    #     new_dictionary.contents = contents
-    #     return new_dictionary
-
-    def values(self) -> tuple[Any, ...]:
-        """Returns `contents` values as a `tuple`.
+        return self.contents.keys()
+
+    def subset(
+        self,
+        include: Hashable | Sequence[Hashable] | None = None,
+        exclude: Hashable | Sequence[Hashable] | None = None,
+    ) -> Manufacturer:
+        """Returns a new instance with a filtered view of `contents`.
+
+        This method applies `include` before `exclude` if both are passed. If
+        `include` is None, all existing items will be in the new subset class
+        instance before `exclude` is applied.
+
+        The `contents` of the returned instance is a live, read-only view. So,
+        later changes to this instance are reflected in the subset, but nothing
+        may be added to or deleted from the subset itself.
+
+        Args:
+            include: key(s) to include in the new `Manufacturer` instance.
+            exclude: key(s) to exclude from the new `Manufacturer` instance.
+
+        Raises:
+            ValueError: if `include` and `exclude` are both None.
 
         Returns:
-            A tuple equivalent to `dict.values()`.
+            New instance with only keys from `include` and no keys in `exclude`.
 
         """
-        return tuple(self.contents.values())
+        if include is None and exclude is None:
+            message = "either the include or exclude argument must not be None"
+            raise ValueError(message)
+        if include is not None:
+            include = frozenset(utilities._iterify(include))
+        exclude = frozenset(utilities._iterify(exclude))
+        contents = _Subset(
+            source=self.contents, include=include, exclude=exclude
+        )
+        return dataclasses.replace(self, contents=contents)
+
+    def values(self) -> ValuesView[Any]:
+        """Emulates Python `dict` `values` method.
+
+        Returns:
+            A live view of the values in `contents`.
+
+        """
+        return self.contents.values()
+
+
+def _create_group(
+    constructor: base.Constructor,
+    group: Iterable[tuple[int, Any, base.GenericDict | None]],
+) -> list[tuple[int, Any]]:
+    """Returns items created by `constructor` paired with their request index.
+
+    Args:
+        constructor: constructor to create each item in `group`.
+        group: (request index, item, parameters) tuples.
+
+    Returns:
+        (request index, created item) tuples.
+
+    """
+    create_many = getattr(constructor, "create_many", None)
+    if callable(create_many):
+        batches: list[tuple[base.GenericDict | None, list[int], list[Any]]] = []
+        for index, item, parameters in group:
+            batch = next((b for b in batches if b[0] == parameters), None)
+            if batch is None:
+                batch = (parameters, [], [])
+                batches.append(batch)
+            batch[1].append(index)
+            batch[2].append(item)
+        return [
+            pair
+            for parameters, indices, items in batches
+            for pair in zip(
+                indices, create_many(items, parameters=parameters), strict=True
+            )
+        ]
+    create = constructor.create
+    return [
+        (
+            index,
+            create(item)
+            if parameters is None
+            else create(item, parameters=parameters),
+        )
+        for index, item, parameters in group
+    ]
+
+
+@dataclasses.dataclass(eq=False, repr=False)
+class _Subset(Mapping):
+    """Live, read-only view of a filtered `Mapping`.
+
+    It compares equal to any `Mapping` with the same items, like a `dict`.
+
+    Args:
+        source: mapping to view.
+        include: keys in `source` to include. Defaults to `None`. If it is
+            `None`, all keys in `source` are included.
+        exclude: keys in `source` to exclude. Defaults to an empty `frozenset`.
+
+    """
+
+    source: Mapping[Hashable, Any]
+    include: frozenset[Hashable] | None = None
+    exclude: frozenset[Hashable] = frozenset()
+
+    """ Dunder Methods """
+
+    def __contains__(self, key: object) -> bool:
+        return self._allows(key) and key in self.source
+
+    def __getitem__(self, key: Hashable) -> Any:
+        if self._allows(key):
+            return self.source[key]
+        raise KeyError(key)
+
+    def __iter__(self) -> Iterator[Hashable]:
+        return (k for k in self.source if self._allows(k))
+
+    def __len__(self) -> int:
+        # Only the filter keys are counted, so the length stays live without
+        # scanning `source`.
+        if self.include is not None:
+            return sum(
+                1
+                for k in self.include
+                if k in self.source and k not in self.exclude
+            )
+        return len(self.source) - sum(
+            1 for k in self.exclude if k in self.source
+        )
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({dict(self)!r})"
+
+    """ Private Methods """
+
+    def _allows(self, key: object) -> bool:
+        """Returns whether `key` passes the `include` and `exclude` filters."""
+        return (
+            self.include is None or key in self.include
+        ) and key not in self.exclude
 
 
 @dataclasses.dataclass
@@ -157,23 +341,63 @@ class Hub(base.Cluster):
         contents: dictionary of all direct Keystone
             subclasses. Keys are snakecase names of the Keystone subclass and
             values are the base Keystone subclasses.
+        bases: dictionary of all direct Keystone subclasses. Keys are snakecase
+            names of the base type and values are the base Keystone subclasses.
         defaults: dictionary of the default class
             for each of the Keystone subclasses. Keys are snakecase names of the
             base type and values are Keystone subclasses.
+        default_factory: callable used to create the registry for each
+            direct Keystone subclass. Defaults to `trackers.TrackedDict`.
         All direct Keystone subclasses will have an attribute name added
         dynamically.
 
     """
 
     contents: base.ConstructorDict = dataclasses.field(default_factory=dict)
-    defaults: base.GenericDict = dataclasses.field(default_factory=dict)
+    bases: ClassVar[base.GenericDict] = trackers.TrackedDict()
+    defaults: ClassVar[base.GenericDict] = trackers.TrackedDict()
+    default_factory: ClassVar[Callable[[], base.GenericDict]] = (
+        trackers.TrackedDict
+    )
+    _lookups: ClassVar[
+        MutableMapping[tuple[str, str | None], type[Keystone]]
+    ] = weakref.WeakValueDictionary()
+    _lookups_generation: ClassVar[int] = 0
+    _parameters: ClassVar[MutableMapping[type[Keystone], frozenset[str]]] = (
+        weakref.WeakKeyDictionary()
+    )
+
+    """ Initialization Methods """
+
+    @classmethod
+    def __init_subclass__(cls, *args: Any, **kwargs: Any):
+        """Gives each subclass its own cache of lookups and its own registries.
+
+        Unless a subclass declares them itself, `bases`, `defaults`, and the
+        registry for each of `bases` start as copies of those in the parent
+        class, so later changes to a subclass do not change its parent.
+
+        Args:
+            args: positional arguments passed to other `__init_subclass__`
+                methods.
+            kwargs: keyword arguments passed to other `__init_subclass__`
+                methods.
+
+        """
+        with contextlib.suppress(AttributeError):
+            super().__init_subclass__(*args, **kwargs)
+        for name in ("bases", "defaults", *cls.bases):
+            if name not in vars(cls):
+                setattr(cls, name, trackers.TrackedDict(getattr(cls, name)))
+        cls._lookups = weakref.WeakValueDictionary()
+        cls._lookups_generation = 0
 
     """ Properties """
 
     @property
-    def registry(self) -> SimpleNamespace:
+    def registry(self) -> types.SimpleNamespace:
         """Returns an object of `contents` supporting dot access."""
-        return SimpleNamespace(self.contents)
+        return types.SimpleNamespace(self.contents)
 
     """ Public Methods """
 
@@ -189,6 +413,7 @@ class Hub(base.Cluster):
         name = cls._get_name(item=item)
         cls.bases[name] = item
         setattr(cls, name, cls.default_factory())
+        cls._lookups.clear()
         # Automatically sets cls to the default option if it is concrete.
         if abc.ABC not in item.__bases__:
             cls.set_default(item=item, base=name)
@@ -246,6 +471,7 @@ class Hub(base.Cluster):
         name = name or cls._get_name(item=item, name=name)
         keystone = cls.classify(item)
         getattr(cls, keystone)[name] = item
+        cls._lookups.clear()
         if cls.defaults[keystone] is None and abc.ABC not in item.__bases__:
             cls.set_default(item=item, base=keystone)
         return
@@ -273,6 +499,7 @@ class Hub(base.Cluster):
         key = base or cls.classify(item)
         name = cls._get_name(item=item, name=name)
         cls.defaults[key] = name
+        cls._lookups.clear()
         return
 
     @classmethod
@@ -302,55 +529,196 @@ class Hub(base.Cluster):
         Returns:
             Completed, linked instance.
 
+        """
+        instance = cls._build(
+            value=getattr(item, attribute),
+            attribute=attribute,
+            parameters=parameters,
+        )
+        setattr(item, attribute, instance)
+        return item
+
+    @classmethod
+    def validate_all(
+        cls,
+        item: object,
+        attributes: Sequence[str] | None = None,
+        parameters: MutableMapping[str, base.GenericDict] | None = None,
+    ) -> object:
+        """Creates or validates each of `attributes` in `item` in order.
+
+        Registry and default lookups are cached on the class, so calling this
+        method on a batch of items only resolves each distinct value once.
+
+        Args:
+            item: object of which Keystones in `attributes` need to be validated
+                or created.
+            attributes: names of the attributes in `item` to validate. Defaults
+                to `None`. If it is `None`, every attribute in `item` matching a
+                key in `bases` is validated.
+            parameters: `dict` with keys that are attribute names and values
+                that are parameters to pass to or inject in the Keystone
+                subclass instance for that attribute. Defaults to `None`.
+
+        Raises:
+            ValueError: if the value of an attribute in `item` does match any
+                known subclass or subclass instance of that Keystone subtype.
+
+        Returns:
+            Completed, linked instance.
+
         """
         parameters = parameters or {}
-        instance = None
-        # Get current value of 'attribute' in `item`.
-        value = getattr(item, attribute)
-        # Get the corresponding base class.
-        base = cls.bases[attribute]
-        # Gets the relevant registry for 'attribute'.
-        registry = getattr(cls, attribute)
-        # Adds parameters to 'value' is already an instance of the appropriate
-        # base type.
-        if isinstance(value, base):
-            for parameter, argument in parameters.items():
-                setattr(value, parameter, argument)
-            instance = value
-        # Selects default class for 'attribute' if none exists.
-        elif value is None:
-            name = cls.defaults[attribute]
-            if name:
-                value = registry[name]
+        for attribute in cls._get_attributes(item, attributes):
+            cls.validate(
+                item=item,
+                attribute=attribute,
+                parameters=parameters.get(attribute),
+            )
+        return item
+
+    @classmethod
+    def validate_graph(
+        cls,
+        item: object,
+        attributes: Sequence[str] | None = None,
+        parameters: MutableMapping[str, base.GenericDict] | None = None,
+        executor: concurrent.futures.Executor | None = None,
+    ) -> object:
+        """Creates or validates `attributes` in `item` in dependency order.
+
+        A Keystone subclass depends upon another attribute in `attributes` if
+        that attribute's name is also the name of one of its constructor
+        parameters. Dependencies are created first and passed to the dependent
+        Keystone subclass (unless a value for it is already in `parameters`).
+        Each attribute is resolved once. If `executor` is passed, attributes
+        without outstanding dependencies are created concurrently with it.
+
+        Args:
+            item: object of which Keystones in `attributes` need to be validated
+                or created.
+            attributes: names of the attributes in `item` to validate. Defaults
+                to `None`. If it is `None`, every attribute in `item` matching a
+                key in `bases` is validated.
+            parameters: `dict` with keys that are attribute names and values
+                that are parameters to pass to or inject in the Keystone
+                subclass instance for that attribute. Defaults to `None`.
+            executor: executor used to create independent attributes
+                concurrently. Defaults to `None`. If it is `None`, attributes
+                are created one at a time in the calling thread.
+
+        Raises:
+            graphlib.CycleError: if the dependencies between `attributes` are
+                circular.
+            ValueError: if the value of an attribute in `item` does match any
+                known subclass or subclass instance of that Keystone subtype.
+
+        Returns:
+            Completed, linked instance.
+
+        """
+        parameters = parameters or {}
+        attributes = cls._get_attributes(item, attributes)
+        values = {a: getattr(item, a) for a in attributes}
+        builders: dict[str, Callable[..., Keystone]] = {}
+        graph = {}
+        for attribute, value in values.items():
+            if isinstance(value, cls.bases[attribute]):
+                builders[attribute] = functools.partial(
+                    shared.inject_attributes, value, overwrite=True
+                )
+                graph[attribute] = set()
             else:
-                raise ValueError(
-                    f"Neither a value for {attribute} nor a default class "
-                    f"exists"
+                keystone = cls._resolve(attribute=attribute, value=value)
+                builders[attribute] = functools.partial(
+                    shared.finalize, keystone
                 )
-        # Uses str value to select appropriate subclass.
-        elif isinstance(value, str):
-            name = getattr(item, attribute)
-            value = registry[name]
-        # Gets name of class if it is already an appropriate subclass.
-        elif inspect.issubclass(value, base):
-            name = utilities._namify(value)
-        else:
-            raise ValueError(f"{value} is not a recognized keystone")
-        # Creates a subclass instance.
-        if instance is None:
-            instance = value.create(name=name, **parameters)
-        setattr(item, attribute, instance)
+                names = cls._get_parameters(keystone)
+                graph[attribute] = names.intersection(values) - {attribute}
+
+        def build(attribute: str) -> Keystone:
+            arguments = {d: getattr(item, d) for d in graph[attribute]}
+            arguments.update(parameters.get(attribute) or {})
+            return builders[attribute](parameters=arguments)
+
+        sorter = graphlib.TopologicalSorter(graph)
+        sorter.prepare()
+        pending: dict[concurrent.futures.Future, str] = {}
+        while sorter.is_active():
+            for attribute in sorter.get_ready():
+                if executor is None:
+                    setattr(item, attribute, build(attribute))
+                    sorter.done(attribute)
+                else:
+                    pending[executor.submit(build, attribute)] = attribute
+            if pending:
+                done, _ = concurrent.futures.wait(
+                    pending, return_when=concurrent.futures.FIRST_COMPLETED
+                )
+                for future in done:
+                    attribute = pending.pop(future)
+                    setattr(item, attribute, future.result())
+                    sorter.done(attribute)
         return item
 
     """ Private Methods """
 
+    @classmethod
+    def _build(
+        cls,
+        value: Any,
+        attribute: str,
+        parameters: base.GenericDict | None = None,
+    ) -> Keystone:
+        """Returns a Keystone subclass instance for `value` of `attribute`.
+
+        Args:
+            value: current value of `attribute`.
+            attribute: name of the Keystone attribute being validated.
+            parameters: parameters to pass to or inject in the Keystone subclass
+                instance. Defaults to `None`.
+
+        Raises:
+            ValueError: if `value` does match any known subclass or subclass
+                instance of the Keystone subtype for `attribute`.
+
+        Returns:
+            Keystone subclass instance.
+
+        """
+        parameters = parameters or {}
+        if isinstance(value, cls.bases[attribute]):
+            return shared.inject_attributes(value, parameters, overwrite=True)
+        keystone = cls._resolve(attribute=attribute, value=value)
+        return shared.finalize(item=keystone, parameters=parameters)
+
+    @classmethod
+    def _get_attributes(
+        cls, item: object, attributes: Sequence[str] | None = None
+    ) -> list[str]:
+        """Returns names of Keystone attributes to validate in `item`.
+
+        Args:
+            item: object with Keystone attributes.
+            attributes: names of attributes to validate. Defaults to `None`. If
+                it is `None`, every attribute in `item` matching a key in
+                `bases` is returned.
+
+        Returns:
+            Names of attributes to validate.
+
+        """
+        if attributes is None:
+            return [a for a in cls.bases if hasattr(item, a)]
+        return list(utilities._iterify(attributes))
+
     @classmethod
     def _get_name(cls, item: type[Keystone], name: str | None = None) -> None:
         """Returns 'name' or str name of item.
 
-        By default, the method uses utilities._namify to create a snakecase
-        name. If the resultant name begins with 'project_', that substring is
-        removed.
+        By default, the method uses the key from the global key namer (which
+        creates a snakecase name unless changed with `set_keyer`). If the
+        resultant name begins with 'project_', that substring is removed.
 
         If you want to use another naming convention, just subclass and override
         this method. All other methods will call this method for naming.
@@ -364,11 +732,80 @@ class Hub(base.Cluster):
             str: name of `item` or 'name' (with the 'project' prefix removed).
 
         """
-        name = name or utilities._namify(item)
+        name = name or options._get_key(item)
         if name.startswith("project_"):
             name = name[8:]
         return name
 
+    @classmethod
+    def _get_parameters(cls, item: type[Keystone]) -> frozenset[str]:
+        """Returns the constructor parameter names of `item`.
+
+        Args:
+            item: Keystone subclass to examine.
+
+        Returns:
+            Names of parameters accepted by the constructor of `item`.
+
+        """
+        try:
+            return cls._parameters[item]
+        except KeyError:
+            if dataclasses.is_dataclass(item):
+                names = frozenset(f.name for f in dataclasses.fields(item))
+            else:
+                names = frozenset(inspect.signature(item).parameters)
+            cls._parameters[item] = names
+            return names
+
+    @classmethod
+    def _resolve(cls, attribute: str, value: Any) -> type[Keystone]:
+        """Returns the Keystone subclass described by `value` of `attribute`.
+
+        Registry and default lookups for `str` and `None` values are cached
+        until `bases`, `defaults`, or the registry for `attribute` changes
+        (including by direct mutation of a `trackers.TrackedDict`), until the
+        next call to `add`, `register`, or `set_default`, or until the cached
+        subclass is garbage collected.
+
+        Args:
+            attribute: name of the Keystone attribute being validated.
+            value: `str` name of a registered subclass, a subclass, or `None`
+                (in which case the default subclass is used).
+
+        Raises:
+            ValueError: if `value` does match any known subclass of the Keystone
+                subtype for `attribute`.
+
+        Returns:
+            Keystone subclass.
+
+        """
+        if inspect.isclass(value):
+            if issubclass(value, cls.bases[attribute]):
+                return value
+        elif value is None or isinstance(value, str):
+            latest = trackers.generation(
+                cls.bases, cls.defaults, getattr(cls, attribute, None)
+            )
+            if latest > cls._lookups_generation:
+                cls._lookups.clear()
+                cls._lookups_generation = trackers._next_generation()
+            try:
+                return cls._lookups[attribute, value]
+            except KeyError:
+                pass
+            name = value or cls.defaults.get(attribute)
+            if not name:
+                raise ValueError(
+                    f"Neither a value for {attribute} nor a default class "
+                    f"exists"
+                )
+            keystone = getattr(cls, attribute)[name]
+            cls._lookups[attribute, value] = keystone
+            return keystone
+        raise ValueError(f"{value} is not a recognized keystone")
+
 
 @dataclasses.dataclass
 class Keystone(registries.AutoRegistrar):
@@ -390,6 +827,4 @@ class Keystone(registries.AutoRegistrar):
         """Automatically registers subclasses."""
         with contextlib.suppress(AttributeError):
             super().__init_subclass__(*args, **kwargs)
-        keyer = options._KEY_NAMER
-        key = keyer(cls)
-        cls.registry[key] = cls
+        cls.registry[options._get_key(cls)] = cls
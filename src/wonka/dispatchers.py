@@ -1,26 +1,140 @@
 """Dispatchers: factory classes that call other constructors.
 
 Contents:
+    Arbiter (`base.Factory`): builds classes and/or instances using methods
+        that follow a naming convention and the first of the `Rule`s in the
+        `rules` class attribute matched by the first argument passed to the
+        `create` class method.
     Delegate (`base.Factory`): builds classes and/or instances using methods
         that follow a naming convention and the `str` names of the types of the
         first argument passed to the `create` class method.
     Sourcerer (`base.Factory`): builds classes and/or instances using methods
         that follow a naming convention (set at `configuration._METHOD_NAMER`)
         and a `dict` of types stored in the `sources` class attribute.
+    Layout: format code, item size, and number of dimensions of the buffers
+        routed by `Sourcerer`.
+    Rule: predicates on the type, attribute values, length, or keys of an
+        item, used by `Arbiter`.
 
 """
 
 from __future__ import annotations
 
 import abc
+import contextlib
 import dataclasses
 import inspect
+import keyword
+import sys
+import types
+import weakref
 from typing import TYPE_CHECKING, Any, ClassVar
 
-from . import base, options, shared
+from . import base, options, producers, shared, trackers, utilities
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, MutableMapping
+    from collections.abc import (
+        Callable,
+        Hashable,
+        Iterable,
+        Mapping,
+        MutableMapping,
+        Sequence,
+    )
+
+# Sentinel for attributes that an item does not have.
+_MISSING = object()
+
+
+@dataclasses.dataclass
+class Arbiter(base.Factory, abc.ABC):
+    """Builds based on the first rule in the `rules` class attribute matched.
+
+    This factory acts as a dispatcher like `Sourcerer`, but each rule may test
+    the attribute values, length, or keys of `item` in addition to its type.
+    Rules are compiled into a jump table keyed by type, so only rules that can
+    match the type of `item` are tested. Within each table, rules are tested in
+    order of how often they have matched, except that a rule is never tested
+    before an earlier rule that could match the same item. So, the first
+    matching rule in `rules` always wins.
+
+    ```python
+    class Shape(wonka.Arbiter):
+        rules = [
+            (wonka.Rule(kind=dict, keys=frozenset({"radius"})), "circle"),
+            (wonka.Rule(kind=Sequence, length=(3, 3)), "triangle"),
+        ]
+    ```
+
+    Attributes:
+        rules: `Sequence` of (`Rule`, str) pairs. The `str` is a substring of
+            the name of the method to call when the `Rule` is the first to
+            match the item passed to the `create` method. Defaults to an empty
+            `tuple`. `compile` must be called after changing `rules` in place.
+        reorder_every: number of matches after which tested rules are
+            reordered by how often they have matched. Defaults to 1024.
+
+    """
+
+    rules: ClassVar[Sequence[tuple[Rule, str]]] = ()
+    reorder_every: ClassVar[int] = 1024
+    _decisions: ClassVar[_Decisions | None] = None
+
+    """ Class Methods """
+
+    @classmethod
+    def compile(cls) -> _Decisions:
+        """Compiles `rules` into a jump table.
+
+        This is called automatically by `create` when `rules` has not been
+        compiled or has been replaced with a different object.
+
+        Returns:
+            Compiled rules.
+
+        """
+        cls._decisions = _Decisions(
+            source=cls.rules,
+            rules=tuple(rule for rule, _ in cls.rules),
+            methods=tuple(
+                _get_creation_method_name(name) for _, name in cls.rules
+            ),
+            reorder_every=cls.reorder_every,
+        )
+        return cls._decisions
+
+    @classmethod
+    def create(
+        cls,
+        item: Any,
+        parameters: base.GenericDict | None = None,
+        **kwargs: base.Kwargs,
+    ) -> Any:
+        """Creates an item based on `item` and possibly `parameters`.
+
+        Args:
+            item: data for construction of the returned item.
+            parameters: keyword arguments to pass or add to a created instance.
+            kwargs: allows subclass to add additional parameters.
+
+        Raises:
+            AttributeError: if the value matching the first rule matched by
+                `item` does not correspond to a method in the `Arbiter`
+                subclass.
+            KeyError: if no rule in `rules` matches `item`.
+
+        Returns:
+            Created item.
+
+        """
+        decisions = vars(cls).get("_decisions")
+        if decisions is None or decisions.source is not cls.rules:
+            decisions = cls.compile()
+        builder = decisions.find(item)
+        item = _get_from_builder_method(
+            factory=cls, method=builder, source=item, **kwargs
+        )
+        return shared.finalize(item=item, parameters=parameters)
 
 
 @dataclasses.dataclass
@@ -37,6 +151,56 @@ class Delegate(base.Factory):
 
     """ Class Methods """
 
+    @classmethod
+    def compile(cls) -> None:
+        """Replaces `create` with generated code specialized for the class.
+
+        The generated `create` caches the builder method name for each type,
+        calls each builder method directly by name, and inlines the common
+        case of the class's `produce` method. It is regenerated automatically
+        when the global key or method namer changes. Subclasses (including
+        those that override `create` and call it with `super`) use the usual
+        dispatch unless they are compiled themselves. Builder methods that are
+        added later are found by the usual dispatch.
+
+        Raises:
+            TypeError: if the class overrides `create`.
+
+        """
+        prefix = options._METHOD_NAMER("")
+        names = [
+            n
+            for n in dir(cls)
+            if prefix and n.startswith(prefix) and n != prefix
+        ]
+        lookup = (
+            "    if isinstance(item, str):\n"
+            "        name = _namer(item)\n"
+            "    else:\n"
+            "        key = _get_name_key(item)\n"
+            "        name = None if key is None else _memo.get(key)\n"
+            "        if name is None:\n"
+            "            name = _get_creation_method_name(item)\n"
+            "            if key is not None:\n"
+            "                _memo[key] = name\n"
+        )
+        _install_create(
+            factory=cls,
+            generic=Delegate.create.__func__,
+            guard=(
+                "options._KEY_NAMER is not _keyer "
+                "or options._METHOD_NAMER is not _namer"
+            ),
+            lookup=lookup,
+            names=names,
+            namespace={
+                "_get_creation_method_name": _get_creation_method_name,
+                "_get_name_key": _get_name_key,
+                "_memo": weakref.WeakKeyDictionary(),
+            },
+        )
+        return
+
     @classmethod
     def create(
         cls,
@@ -66,6 +230,57 @@ class Delegate(base.Factory):
         )
         return shared.finalize(item=item, parameters=parameters)
 
+    @classmethod
+    def create_many(
+        cls,
+        items: Iterable[Any],
+        parameters: base.GenericDict | None = None,
+        **kwargs: base.Kwargs,
+    ) -> list[Any]:
+        """Creates an item from each of `items` and possibly `parameters`.
+
+        Items are grouped by the builder method their type resolves to, so the
+        method name is computed once per type rather than once per item. If the
+        factory has a method with the builder's name followed by "_batch", it
+        is called once with each group's items as a `list`. The items built
+        for each group are then passed together to the `produce_many` method
+        of their class, if it has one.
+
+        Args:
+            items: data for construction of the returned items.
+            parameters: keyword arguments to pass or add to each created
+                instance. Defaults to `None`.
+            kwargs: allows subclass to take kwargs.
+
+        Raises:
+            AttributeError: If an appropriate method does not exist for the
+                data type of an item in `items`.
+
+        Returns:
+            Created items in the same order as `items`.
+
+        """
+        items = list(items)
+        names: dict[Hashable, str] = {}
+        groups: dict[str, list[int]] = {}
+        for index, item in enumerate(items):
+            key = _get_name_key(item)
+            if key is None:
+                builder = _get_creation_method_name(item)
+            else:
+                try:
+                    builder = names[key]
+                except KeyError:
+                    builder = names[key] = _get_creation_method_name(item)
+            groups.setdefault(builder, []).append(index)
+        return _build_groups(
+            factory=cls,
+            items=items,
+            groups=groups,
+            parameters=parameters,
+            **kwargs,
+        )
+
 
 @dataclasses.dataclass
 class Sourcerer(base.Factory, abc.ABC):
@@ -82,17 +297,112 @@ class Sourcerer(base.Factory, abc.ABC):
     they may manipulate the magical energy known as "source".
     https://divinity.fandom.com/wiki/Sourcerer
 
+    Items that support the buffer protocol (such as `bytes`, `memoryview`,
+    `array.array`, and NumPy arrays) are first matched against the `Layout`
+    keys in the `layouts` class attribute by their format code, item size, and
+    number of dimensions. If one matches, its builder method is passed a
+    `memoryview` of the item, so the underlying buffer is never copied.
+
     Attributes:
         sources: `dict` with keys that are types and values are substrings of
             the names of methods to call when the key type is passed to the
             `create` method. Defaults to an empty `dict`.
+        layouts: `dict` with keys that are `Layout`s and values are substrings
+            of the names of methods to call when an item with a matching buffer
+            is passed to the `create` method. Defaults to an empty `dict`.
 
     """
 
-    sources: ClassVar[MutableMapping[type[Any], str]] = {}
+    sources: ClassVar[MutableMapping[type[Any], str]] = trackers.TrackedDict()
+    layouts: ClassVar[MutableMapping[Layout, str]] = trackers.TrackedDict()
+    _dispatch: ClassVar[
+        tuple[MutableMapping[type[Any], str], MutableMapping[type[Any], str]]
+        | None
+    ] = None
+    _layout_dispatch: ClassVar[
+        MutableMapping[tuple[str, int, int], str | None] | None
+    ] = None
 
     """ Class Methods """
 
+    @classmethod
+    def compile(cls) -> None:
+        """Replaces `create` with generated code specialized for the class.
+
+        The generated `create` looks up the builder method name for each type
+        in a table that is precomputed for the types in `sources` and extended
+        with each other type passed, calls each builder method directly by
+        name, and inlines the common case of the class's `produce` method. It
+        is regenerated automatically when `sources` or `layouts` is replaced
+        or changed, or when the global key or method namer changes. Changes to
+        an untracked `sources` or `layouts` (one that is not a
+        `trackers.TrackedDict`) are only detected if they change its size.
+        Subclasses (including those that override `create` and call it with
+        `super`) use the usual dispatch unless they are compiled themselves.
+
+        Raises:
+            TypeError: if the class overrides `create`.
+
+        """
+        sources = cls.sources
+        table = {}
+        for kind in sources:
+            if inspect.isclass(kind):
+                table[kind] = next(
+                    _get_creation_method_name(v)
+                    for k, v in sources.items()
+                    if inspect.isclass(k) and issubclass(kind, k)
+                )
+        names = [
+            *table.values(),
+            *(_get_creation_method_name(v) for v in cls.layouts.values()),
+        ]
+        # Classes passed as items are matched differently from instances, so
+        # they are looked up in their own table.
+        lookup = (
+            "    if isinstance(item, type):\n"
+            "        name = _classes.get(item)\n"
+            "        if name is None:\n"
+            "            name = _find_builder_name(item=item, sources=_sources)\n"
+            "            _classes[item] = name\n"
+            "    else:\n"
+            "        name = _table.get(type(item))\n"
+            "        if name is None:\n"
+            "            name = _find_builder_name(item=item, sources=_sources)\n"
+            "            _table[type(item)] = name\n"
+        )
+        if cls.layouts:
+            lookup = (
+                "    match = _find_layout_builder(factory=cls, item=item)\n"
+                "    if match is not None:\n"
+                "        name, item = match\n"
+                "    else:\n"
+                + "".join(f"    {line}\n" for line in lookup.splitlines())
+            )
+        _install_create(
+            factory=cls,
+            generic=Sourcerer.create.__func__,
+            guard=(
+                "cls.sources is not _sources "
+                "or cls.layouts is not _layouts "
+                f"or {_get_stale_source('_sources', sources)} "
+                f"or {_get_stale_source('_layouts', cls.layouts)} "
+                "or options._KEY_NAMER is not _keyer "
+                "or options._METHOD_NAMER is not _namer"
+            ),
+            lookup=lookup,
+            names=names,
+            namespace={
+                "_classes": weakref.WeakKeyDictionary(),
+                "_find_builder_name": _find_builder_name,
+                "_find_layout_builder": _find_layout_builder,
+                "_layouts": cls.layouts,
+                "_sources": sources,
+                "_table": table,
+            },
+        )
+        return
+
     @classmethod
     def create(
         cls,
@@ -117,14 +427,506 @@ class Sourcerer(base.Factory, abc.ABC):
             Created item.
 
         """
-        for kind, substring in cls.sources.items():
-            if _is_kind(item, kind):
-                builder = _get_creation_method_name(substring)
-                item = _get_from_builder_method(
-                    factory=cls, method=builder, source=item, **kwargs
+        match = _find_layout_builder(factory=cls, item=item)
+        dispatch = vars(cls).get("_dispatch")
+        if match is not None:
+            builder, item = match
+        elif dispatch is None:
+            builder = _find_builder_name(item=item, sources=cls.sources)
+        else:
+            is_class = inspect.isclass(item)
+            table = dispatch[is_class]
+            key = item if is_class else type(item)
+            try:
+                builder = table[key]
+            except KeyError:
+                builder = _find_builder_name(item=item, sources=cls.sources)
+                table[key] = builder
+        item = _get_from_builder_method(
+            factory=cls, method=builder, source=item, **kwargs
+        )
+        return shared.finalize(item=item, parameters=parameters)
+
+    @classmethod
+    def create_many(
+        cls,
+        items: Iterable[Any],
+        parameters: base.GenericDict | None = None,
+        **kwargs: base.Kwargs,
+    ) -> list[Any]:
+        """Creates an item from each of `items` and possibly `parameters`.
+
+        Items are grouped by type, so `sources` is searched once per type
+        rather than once per item. If the factory has a method with the
+        builder's name followed by "_batch", it is called once with each
+        group's items as a `list`. The items built for each group are then
+        passed together to the `produce_many` method of their class, if it
+        has one.
+
+        Args:
+            items: data for construction of the returned items.
+            parameters: keyword arguments to pass or add to each created
+                instance. Defaults to `None`.
+            kwargs: allows subclass to add additional parameters.
+
+        Raises:
+            AttributeError: if the value matching the type of an item in
+                `items` does not correspond to a method in the `Sourcerer`
+                subclass.
+            KeyError: if there is no key in `sources` matching the type of an
+                item in `items`.
+
+        Returns:
+            Created items in the same order as `items`.
+
+        """
+        items = list(items)
+        dispatch = vars(cls).get("_dispatch")
+        # Classes and instances are matched differently, so their builders are
+        # cached separately.
+        names: tuple[
+            MutableMapping[type[Any], str], MutableMapping[type[Any], str]
+        ] = ({}, {}) if dispatch is None else dispatch
+        groups: dict[str, list[int]] = {}
+        for index, item in enumerate(items):
+            match = _find_layout_builder(factory=cls, item=item)
+            if match is not None:
+                builder, items[index] = match
+                groups.setdefault(builder, []).append(index)
+                continue
+            is_class = inspect.isclass(item)
+            key = item if is_class else type(item)
+            try:
+                builder = names[is_class][key]
+            except KeyError:
+                builder = _find_builder_name(item=item, sources=cls.sources)
+                names[is_class][key] = builder
+            groups.setdefault(builder, []).append(index)
+        return _build_groups(
+            factory=cls,
+            items=items,
+            groups=groups,
+            parameters=parameters,
+            **kwargs,
+        )
+
+    @classmethod
+    def freeze(cls) -> None:
+        """Replaces `sources` and `layouts` with immutable copies.
+
+        The builder method name for instances of each type in `sources` is
+        computed once and the builder found for any other type, or for a class
+        passed as an item, is cached on first use (without keeping that type
+        alive). Each cached builder is the one that unfrozen dispatch would
+        find, so freezing never changes the result of `create`. The builder
+        found for each buffer layout is also cached on first use. Any later
+        attempt to add, change, or delete a key in `sources` or `layouts`
+        raises a `TypeError`.
+
+        """
+        cls.sources = types.MappingProxyType(dict(cls.sources))
+        cls.layouts = types.MappingProxyType(dict(cls.layouts))
+        instances = weakref.WeakKeyDictionary()
+        for kind in cls.sources:
+            if inspect.isclass(kind):
+                instances[kind] = next(
+                    _get_creation_method_name(v)
+                    for k, v in cls.sources.items()
+                    if inspect.isclass(k) and issubclass(kind, k)
+                )
+        # Indexed by whether the item is a class.
+        cls._dispatch = (instances, weakref.WeakKeyDictionary())
+        cls._layout_dispatch = {}
+        return
+
+
+@dataclasses.dataclass(frozen=True)
+class Layout:
+    """Description of the buffers that an item may expose.
+
+    Args:
+        format: `struct` format code of each element, ignoring a native byte
+            order prefix. Defaults to `None`, which matches any format.
+        itemsize: size of each element in bytes. Defaults to `None`, which
+            matches any size.
+        ndim: number of dimensions. Defaults to `None`, which matches any
+            number of dimensions.
+
+    """
+
+    format: str | None = None
+    itemsize: int | None = None
+    ndim: int | None = None
+
+    """ Instance Methods """
+
+    def matches(self, code: str, itemsize: int, ndim: int) -> bool:
+        """Returns whether a buffer with the passed properties matches.
+
+        Args:
+            code: normalized `struct` format code of the buffer.
+            itemsize: size of each element of the buffer in bytes.
+            ndim: number of dimensions of the buffer.
+
+        Returns:
+            Whether the buffer matches.
+
+        """
+        return (
+            (self.format is None or _normalize_format(self.format) == code)
+            and (self.itemsize is None or self.itemsize == itemsize)
+            and (self.ndim is None or self.ndim == ndim)
+        )
+
+
+@dataclasses.dataclass(frozen=True)
+class Rule:
+    """Predicates that an item must satisfy to match.
+
+    Every predicate that is set must be satisfied for an item to match. A rule
+    with no predicates set matches every item.
+
+    Args:
+        kind: type that an item must be an instance or subclass of. Defaults
+            to `None`, which matches any type.
+        attributes: keys are attribute names and values are the values that an
+            item's attributes must equal. Defaults to an empty `dict`.
+        length: inclusive minimum and maximum lengths of an item. A maximum of
+            `None` means there is no maximum. Defaults to `None`, which matches
+            any item, with or without a length.
+        keys: keys that must all be in an item. Defaults to an empty
+            `frozenset`.
+        test: any other predicate an item must satisfy. Defaults to `None`.
+
+    """
+
+    kind: type[Any] | None = None
+    attributes: Mapping[str, Any] = dataclasses.field(default_factory=dict)
+    length: tuple[int, int | None] | None = None
+    keys: frozenset[Hashable] = frozenset()
+    test: Callable[[Any], bool] | None = None
+
+    """ Instance Methods """
+
+    def matches(self, item: Any) -> bool:
+        """Returns whether `item` satisfies every predicate of the rule.
+
+        Args:
+            item: item to test.
+
+        Returns:
+            Whether `item` matches.
+
+        """
+        return (
+            self.kind is None or _is_kind(item, self.kind)
+        ) and self._matches_values(item)
+
+    def overlaps(self, other: Rule) -> bool:
+        """Returns whether an item might match both the rule and `other`.
+
+        This is conservative: `True` is returned unless the rules require
+        different values for the same attribute or non-overlapping lengths.
+        Types are not compared because `Arbiter` only tests rules together
+        that can match the same type.
+
+        Args:
+            other: rule to compare.
+
+        Returns:
+            Whether the rules might match the same item.
+
+        """
+        for name, value in self.attributes.items():
+            if name in other.attributes:
+                with contextlib.suppress(TypeError, ValueError):
+                    if bool(other.attributes[name] != value):
+                        return False
+        if self.length is not None and other.length is not None:
+            low, high = self.length
+            other_low, other_high = other.length
+            if (high is not None and high < other_low) or (
+                other_high is not None and other_high < low
+            ):
+                return False
+        return True
+
+    """ Private Methods """
+
+    def _matches_values(self, item: Any) -> bool:
+        """Returns whether `item` satisfies every predicate except `kind`."""
+        if self.keys:
+            try:
+                if not all(key in item for key in self.keys):
+                    return False
+            except TypeError:
+                return False
+        if self.length is not None:
+            try:
+                size = len(item)
+            except TypeError:
+                return False
+            low, high = self.length
+            if size < low or (high is not None and size > high):
+                return False
+        for name, value in self.attributes.items():
+            if getattr(item, name, _MISSING) != value:
+                return False
+        return self.test is None or bool(self.test(item))
+
+
+@dataclasses.dataclass
+class _Decisions:
+    """Compiled rules of an `Arbiter`.
+
+    Args:
+        source: `rules` attribute that was compiled.
+        rules: compiled rules.
+        methods: builder method name for each rule.
+        reorder_every: number of matches after which tables are rebuilt.
+        hits: number of matches for each rule.
+        tables: pair of mappings, for items that are instances and items that
+            are classes, with keys that are types (of instances or the classes
+            themselves) and values that are the indices of the rules that might
+            match those items, in the order to test them.
+
+    """
+
+    source: Sequence[tuple[Rule, str]]
+    rules: tuple[Rule, ...]
+    methods: tuple[str, ...]
+    reorder_every: int = 1024
+    hits: list[int] = dataclasses.field(default_factory=list)
+    tables: tuple[
+        MutableMapping[type[Any], list[int]],
+        MutableMapping[type[Any], list[int]],
+    ] = dataclasses.field(init=False)
+    matches: int = 0
+    _before: list[frozenset[int]] = dataclasses.field(default_factory=list)
+
+    """ Initialization Methods """
+
+    def __post_init__(self) -> None:
+        """Finds the earlier rules that each rule must be tested after."""
+        self.hits = [0] * len(self.rules)
+        self.tables = self._new_tables()
+        self._before = [
+            frozenset(
+                j for j in range(i) if self.rules[j].overlaps(self.rules[i])
+            )
+            for i in range(len(self.rules))
+        ]
+
+    """ Instance Methods """
+
+    def find(self, item: Any) -> str:
+        """Returns the builder method name for the first rule `item` matches.
+
+        Args:
+            item: data for construction of an item.
+
+        Raises:
+            KeyError: if no rule matches `item`.
+
+        Returns:
+            Name of the builder method to use.
+
+        """
+        # A class and an instance of it match different rules, so they are
+        # kept in separate tables.
+        is_class = inspect.isclass(item)
+        tables = self.tables[is_class]
+        key = item if is_class else type(item)
+        try:
+            table = tables[key]
+        except KeyError:
+            table = tables[key] = self._order(
+                i
+                for i, rule in enumerate(self.rules)
+                if rule.kind is None or _is_kind(item, rule.kind)
+            )
+        rules = self.rules
+        for index in table:
+            if rules[index]._matches_values(item):
+                self.hits[index] += 1
+                self.matches += 1
+                if self.matches % self.reorder_every == 0:
+                    self.tables = self._new_tables()
+                return self.methods[index]
+        raise KeyError(f"{item} does not match any rules")
+
+    """ Private Methods """
+
+    @staticmethod
+    def _new_tables() -> tuple[
+        MutableMapping[type[Any], list[int]],
+        MutableMapping[type[Any], list[int]],
+    ]:
+        """Returns empty tables for instances and for classes."""
+        return weakref.WeakKeyDictionary(), weakref.WeakKeyDictionary()
+
+    def _order(self, candidates: Iterable[int]) -> list[int]:
+        """Returns `candidates` ordered by hits without breaking precedence."""
+        remaining = list(candidates)
+        order = []
+        while remaining:
+            ready = [
+                i for i in remaining if self._before[i].isdisjoint(remaining)
+            ]
+            chosen = max(ready, key=lambda i: (self.hits[i], -i))
+            order.append(chosen)
+            remaining.remove(chosen)
+        return order
+
+
+def _build_groups(
+    factory: Any,
+    items: Sequence[Any],
+    groups: Mapping[str, Sequence[int]],
+    parameters: base.GenericDict | None = None,
+    **kwargs: base.Kwargs,
+) -> list[Any]:
+    """Returns items built by each group's builder method in input order.
+
+    Args:
+        factory: factory class or instance.
+        items: data for construction of the returned items.
+        groups: keys are builder method names and values are the indices of
+            the items in `items` to pass to that method.
+        parameters: keyword arguments to pass or add to each created instance.
+            Defaults to `None`.
+        kwargs: allows subclass to take kwargs.
+
+    Raises:
+        AttributeError: if `factory` has no method for a key in `groups`.
+        ValueError: if a batch builder method does not return one item for
+            each item passed to it.
+
+    Returns:
+        Constructed items in the same order as `items`.
+
+    """
+    results = [None] * len(items)
+    for method, indices in groups.items():
+        sources = [items[i] for i in indices]
+        batch = getattr(factory, f"{method}_batch", None)
+        if callable(batch):
+            built = list(batch(sources, **kwargs))
+            if len(built) != len(sources):
+                raise ValueError(
+                    f"{method}_batch returned {len(built)} items for "
+                    f"{len(sources)} sources"
                 )
-                return shared.finalize(item=item, parameters=parameters)
-        raise KeyError(f"{item} does not match any recognized types")
+        else:
+            try:
+                builder = getattr(factory, method)
+            except AttributeError as e:
+                raise AttributeError(
+                    f"{method} does not exist in {factory}"
+                ) from e
+            built = [builder(source, **kwargs) for source in sources]
+        built = _finalize_many(built, parameters=parameters)
+        for index, item in zip(indices, built, strict=True):
+            results[index] = item
+    return results
+
+
+def _finalize_many(
+    items: list[Any], parameters: base.GenericDict | None = None
+) -> list[Any]:
+    """Returns `items` modified as `shared.finalize` would modify each one.
+
+    If every item is the same class or an instance of the same class and that
+    class has a `produce_many` method (as `producers.Flexer` and
+    `producers.Instancer` do), it is called once for all of `items`, unless
+    `produce` is overridden in a subclass of the class that defines
+    `produce_many`.
+
+    Args:
+        items: items built by the same builder method.
+        parameters: keyword arguments to pass or add to each created instance.
+            Defaults to `None`.
+
+    Returns:
+        Modified items in the same order as `items`.
+
+    """
+    owners = {item if inspect.isclass(item) else type(item) for item in items}
+    if len(owners) == 1:
+        owner = owners.pop()
+        produce_many = getattr(items[0], "produce_many", None)
+        if inspect.ismethod(produce_many) and issubclass(
+            shared._get_definer(owner, "produce_many"),
+            shared._get_definer(owner, "produce"),
+        ):
+            return list(produce_many(items, parameters))
+    return [shared.finalize(item=item, parameters=parameters) for item in items]
+
+
+def _find_builder_name(
+    item: Any, sources: MutableMapping[type[Any], str]
+) -> str:
+    """Returns the name of the builder method in `sources` matching `item`.
+
+    Args:
+        item: data for construction of the returned item.
+        sources: `dict` with keys that are types and values are substrings of
+            the names of builder methods.
+
+    Raises:
+        KeyError: if there is no key in `sources` matching the type for `item`.
+
+    Returns:
+        Name of the builder method to use.
+
+    """
+    for kind, substring in sources.items():
+        if _is_kind(item, kind):
+            return _get_creation_method_name(substring)
+    raise KeyError(f"{item} does not match any recognized types")
+
+
+def _find_layout_builder(
+    factory: type[Sourcerer], item: Any
+) -> tuple[str, memoryview] | None:
+    """Returns the builder method name and a view for a buffer `item`.
+
+    Args:
+        factory: `Sourcerer` subclass with `layouts` to match.
+        item: data for construction of an item.
+
+    Returns:
+        Name of the builder method for the first key in the `layouts` of
+            `factory` that matches the buffer of `item` and a `memoryview` of
+            that buffer, or `None` if `item` has no buffer or none match.
+
+    """
+    layouts = factory.layouts
+    if not layouts or isinstance(item, str) or inspect.isclass(item):
+        return None
+    try:
+        view = memoryview(item)
+    except TypeError:
+        return None
+    key = (_normalize_format(view.format), view.itemsize, view.ndim)
+    memo = vars(factory).get("_layout_dispatch")
+    if memo is not None and key in memo:
+        builder = memo[key]
+    else:
+        builder = next(
+            (
+                _get_creation_method_name(name)
+                for layout, name in layouts.items()
+                if layout.matches(*key)
+            ),
+            None,
+        )
+        if memo is not None:
+            memo[key] = builder
+    if builder is None:
+        view.release()
+        return None
+    return builder, view
 
 
 def _get_creation_method_name(
@@ -143,11 +945,169 @@ def _get_creation_method_name(
 
     """
     if not isinstance(source, str):
-        source = options._KEY_NAMER(source)
+        source = options._get_key(source)
     namer = method_namer or options._METHOD_NAMER
     return namer(source)
 
 
+def _get_name_key(item: Any) -> Hashable | None:
+    """Returns a key shared by items with the same creation method name.
+
+    Args:
+        item: data for construction of an item.
+
+    Returns:
+        `item` if it is a `str` or class, the type of `item` if the global
+            `options._KEY_NAMER` names it by its type (because it has neither
+            a `str` `name` nor a `__name__`, as functions and modules do), or
+            `None` if the name of `item` must be computed for each item.
+
+    """
+    if isinstance(item, str) or inspect.isclass(item):
+        return item
+    elif (
+        options._KEY_NAMER is utilities._namify
+        and not hasattr(item, "__name__")
+        and not isinstance(getattr(item, "name", None), str)
+    ):
+        return type(item)
+    else:
+        return None
+
+
+def _normalize_format(code: str) -> str:
+    """Returns a `struct` format code without a native byte order prefix.
+
+    Args:
+        code: `struct` format code.
+
+    Returns:
+        `code` without a leading "@", "=", or byte order character matching
+            the native byte order.
+
+    """
+    native = "<" if sys.byteorder == "little" else ">"
+    if code[:1] in ("@", "=", native):
+        return code[1:]
+    return code
+
+
+def _install_create(
+    factory: type[base.Factory],
+    *,
+    generic: Callable[..., Any],
+    guard: str,
+    lookup: str,
+    names: Iterable[str],
+    namespace: dict[str, Any],
+) -> None:
+    """Generates a specialized `create` class method and sets it on `factory`.
+
+    Args:
+        factory: dispatcher class to set the generated method on.
+        generic: unspecialized `create` function used for subclasses of
+            `factory` and for items whose builder method is not in `names`.
+        guard: expression that is true when the generated code is stale, in
+            which case it is regenerated before being called.
+        lookup: statements that set `name` to the builder method name for
+            `item` (and may replace `item`).
+        names: builder method names to call directly.
+        namespace: other globals used by `guard` and `lookup`.
+
+    Raises:
+        TypeError: if `factory` overrides `create`.
+
+    """
+    current = next(
+        vars(k)["create"] for k in factory.__mro__ if "create" in vars(k)
+    )
+    function = getattr(current, "__func__", current)
+    if function is not generic and not getattr(function, "_generated", False):
+        raise TypeError(f"{factory.__name__} overrides create")
+    branches = []
+    for name in dict.fromkeys(names):
+        if name.isidentifier() and not keyword.iskeyword(name):
+            branches.append(
+                f"    {'elif' if branches else 'if'} name == {name!r}:\n"
+                f"        item = cls.{name}(item, **kwargs)\n"
+            )
+    fallback = "return _generic(cls, item, parameters, **kwargs)\n"
+    source = (
+        "def create(cls, item, parameters=None, **kwargs):\n"
+        "    if cls is not _owner:\n"
+        f"        {fallback}"
+        f"    if {guard}:\n"
+        "        cls.compile()\n"
+        "        return cls.create(item, parameters, **kwargs)\n"
+        f"{lookup}"
+        + (
+            "".join(branches) + f"    else:\n        {fallback}"
+            if branches
+            else f"    {fallback}"
+        )
+        + _get_produce_source(factory)
+        + "    return _finalize(item=item, parameters=parameters)\n"
+    )
+    namespace = {
+        **namespace,
+        "_finalize": shared.finalize,
+        "_generic": generic,
+        "_keyer": options._KEY_NAMER,
+        "_namer": options._METHOD_NAMER,
+        "_owner": factory,
+        "options": options,
+    }
+    exec(source, namespace)  # noqa: S102
+    create = namespace["create"]
+    create._generated = True
+    create.__qualname__ = f"{factory.__qualname__}.create"
+    factory.create = classmethod(create)
+
+
+def _get_produce_source(factory: type[base.Factory]) -> str:
+    """Returns generated code that inlines the common case of `produce`.
+
+    Args:
+        factory: dispatcher class whose instances may be created.
+
+    Returns:
+        Statements that return early for an instance of `factory` when the
+            known `produce` method of `factory` would not change it, or an
+            empty `str` if the `produce` method is not known.
+
+    """
+    produce = inspect.getattr_static(factory, "produce", None)
+    if produce is None or any(
+        produce is vars(p)["produce"]
+        for p in (producers.Deferrer, producers.Flexer, producers.Instancer)
+    ):
+        return (
+            "    if parameters is None and type(item) is cls:\n"
+            "        return item\n"
+        )
+    elif produce is vars(producers.Classer)["produce"]:
+        return "    if type(item) is cls:\n        return cls\n"
+    else:
+        return ""
+
+
+def _get_stale_source(name: str, container: Any) -> str:
+    """Returns an expression that is true once `container` has changed.
+
+    Args:
+        name: name of `container` in the generated code.
+        container: mapping read by the generated code.
+
+    Returns:
+        Comparison of the `generation` of `container` if it is tracked, or of
+            its length if it is not.
+
+    """
+    if isinstance(container, trackers.TrackedDict):
+        return f"{name}.generation != {container.generation}"
+    return f"len({name}) != {len(container)}"
+
+
 def _is_kind(item: Any, kind: type[Any]) -> bool:
     """Returns if `item` is an instance or subclass of `kind`.
 
@@ -160,7 +1120,7 @@ def _is_kind(item: Any, kind: type[Any]) -> bool:
 
     """
     return isinstance(item, kind) or (
-        inspect.isclass(item and issubclass(item, kind))
+        inspect.isclass(item) and issubclass(item, kind)
     )
 
 
@@ -0,0 +1,454 @@
+"""Dependency injection built on a registry.
+
+Contents:
+    Injector (`registries.Registrar`): builds registered classes, creating the
+        arguments of their constructors from the registry based on their type
+        annotations.
+
+"""
+
+from __future__ import annotations
+
+import contextlib
+import contextvars
+import dataclasses
+import inspect
+import threading
+import types
+import typing
+from typing import TYPE_CHECKING, Any, ClassVar, Literal
+
+from . import base, options, registries, trackers
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable, Iterator, MutableMapping
+
+
+# Instances created with a "scoped" lifetime in the active `Injector.scope`.
+_SCOPE: contextvars.ContextVar[dict[tuple[type, Hashable], Any] | None] = (
+    contextvars.ContextVar("wonka_scope", default=None)
+)
+_LIFETIMES = frozenset({"scoped", "singleton", "transient"})
+
+
+@dataclasses.dataclass
+class Injector(registries.Registrar):
+    """Builds an item from a registry, creating its dependencies.
+
+    Each parameter of a registered class's constructor is filled with an item
+    created from the registry: the registered class (or instance) matching the
+    parameter's type annotation or, failing that, the item registered under
+    the parameter's name. Builtin annotations (such as `str`, `int`, or
+    `object`) are only matched by name. Parameters with default values are
+    skipped if no match is found. Dependencies are created the same way, so a whole object
+    graph is built by one call to `create`.
+
+    The steps needed to create each key are worked out once and cached as a
+    flat sequence of constructor calls. The cache is discarded whenever
+    `registry` or `lifetimes` is replaced, changes size, or (if it is a
+    `trackers.TrackedDict`) is changed in any other way. At the same time,
+    singletons whose key is no longer registered to the same class or
+    instance with a "singleton" lifetime are discarded.
+
+    Each registered key has one of three lifetimes:
+        "transient": a new instance is created every time it is needed.
+        "singleton": one instance is created for the class and then reused.
+        "scoped": one instance is created and reused within each `scope`.
+
+    Registered instances (rather than classes) are always returned as is.
+
+    ```python
+    class Services(wonka.Injector):
+        pass
+
+    Services.register(Database, lifetime="singleton")
+    Services.register(Repository)
+    repository = Services.create("repository")
+    ```
+
+    Attributes:
+        registry: stores classes and/or instances to be used in item
+            construction. Defaults to an empty `trackers.TrackedDict` for
+            each subclass.
+        lifetimes: keys are keys in `registry` and values are their lifetimes.
+            Keys that are not listed are "transient". Defaults to an empty
+            `trackers.TrackedDict` for each subclass.
+
+    """
+
+    registry: ClassVar[base.GenericDict] = trackers.TrackedDict()
+    lifetimes: ClassVar[MutableMapping[Hashable, str]] = trackers.TrackedDict()
+    _plans: ClassVar[dict[Hashable, tuple[_Step, ...]]] = {}
+    _plans_stamp: ClassVar[tuple[int, ...]] = ()
+    _singletons: ClassVar[dict[Hashable, Any]] = {}
+    _singleton_providers: ClassVar[dict[Hashable, Any]] = {}
+    _lock: ClassVar[threading.RLock] = threading.RLock()
+
+    """ Initialization Methods """
+
+    @classmethod
+    def __init_subclass__(cls, *args: Any, **kwargs: Any):
+        """Gives each subclass its own registry, plans, and singletons.
+
+        A `registry` or `lifetimes` declared by the subclass is used as is.
+
+        Args:
+            args: positional arguments passed to other `__init_subclass__`
+                methods.
+            kwargs: keyword arguments passed to other `__init_subclass__`
+                methods.
+
+        """
+        with contextlib.suppress(AttributeError):
+            super().__init_subclass__(*args, **kwargs)
+        for name in ("registry", "lifetimes"):
+            if name not in vars(cls):
+                setattr(cls, name, trackers.TrackedDict())
+        cls._plans = {}
+        cls._plans_stamp = ()
+        cls._singletons = {}
+        cls._singleton_providers = {}
+        cls._lock = threading.RLock()
+
+    """ Class Methods """
+
+    @classmethod
+    def create(
+        cls, item: Hashable, parameters: base.GenericDict | None = None
+    ) -> Any:
+        """Creates the item registered as `item` and its dependencies.
+
+        Args:
+            item: key in `registry` of the item to create.
+            parameters: keyword arguments to pass to the constructor of the
+                created item, in addition to (or in place of) its dependencies.
+                If passed, a new item is created regardless of its lifetime.
+                Defaults to `None`.
+
+        Raises:
+            KeyError: if `item`, or a dependency without a default value, is
+                not in `registry`.
+            ValueError: if the dependencies of `item` are circular or if an
+                item with a "scoped" lifetime is needed outside of a `scope`.
+
+        Returns:
+            Created item.
+
+        """
+        plan = cls._get_plan(item)
+        scope = _SCOPE.get()
+        values: list[Any] = []
+        for step in plan[:-1]:
+            values.append(cls._provide(step, values=values, scope=scope))
+        if parameters:
+            return _construct(plan[-1], values=values, parameters=parameters)
+        return cls._provide(plan[-1], values=values, scope=scope)
+
+    @classmethod
+    def register(
+        cls,
+        item: Any,
+        name: Hashable | None = None,
+        lifetime: Literal["scoped", "singleton", "transient"] = "transient",
+    ) -> None:
+        """Adds `item` to `registry` with `lifetime`.
+
+        A singleton already created for the same key is discarded.
+
+        Args:
+            item: class or instance to register.
+            name: key for `item` in `registry`. Defaults to `None`. If it is
+                `None`, the key is created by the global key namer.
+            lifetime: how long created instances of `item` are reused.
+                Defaults to "transient".
+
+        Raises:
+            ValueError: if `lifetime` is not "scoped", "singleton", or
+                "transient".
+
+        """
+        if lifetime not in _LIFETIMES:
+            raise ValueError(f"{lifetime} is not a recognized lifetime")
+        name = options._get_key(item) if name is None else name
+        with cls._lock:
+            cls.registry[name] = item
+            cls.lifetimes[name] = lifetime
+            cls._singletons.pop(name, None)
+            cls._singleton_providers.pop(name, None)
+            cls._plans.clear()
+        return
+
+    @classmethod
+    @contextlib.contextmanager
+    def scope(cls) -> Iterator[None]:
+        """Reuses each item with a "scoped" lifetime within the context.
+
+        Scopes are tracked with a `contextvars.ContextVar`, so `asyncio` tasks
+        started inside the context share the scope, while other threads and
+        tasks do not.
+
+        Yields:
+            Nothing.
+
+        """
+        token = _SCOPE.set({})
+        try:
+            yield
+        finally:
+            _SCOPE.reset(token)
+
+    """ Private Methods """
+
+    @classmethod
+    def _build_plan(cls, item: Hashable) -> tuple[_Step, ...]:
+        """Returns the steps to create `item` and its dependencies in order.
+
+        Args:
+            item: key in `registry` of the item to create.
+
+        Raises:
+            KeyError: if `item`, or a dependency without a default value, is
+                not in `registry`.
+            ValueError: if the dependencies of `item` are circular.
+
+        Returns:
+            Steps to take, ending with the step that creates `item`.
+
+        """
+        steps: list[_Step] = []
+        reused: dict[Hashable, int] = {}
+
+        def visit(key: Hashable, path: tuple[Hashable, ...]) -> int:
+            if key in path:
+                chain = " -> ".join(str(k) for k in (*path, key))
+                raise ValueError(f"circular dependencies: {chain}")
+            lifetime = cls.lifetimes.get(key, "transient")
+            if key in reused:
+                return reused[key]
+            try:
+                provider = cls.registry[key]
+            except KeyError as e:
+                raise KeyError(f"{key} was not found in the registry") from e
+            arguments = []
+            if inspect.isclass(provider) and key not in cls._singletons:
+                for name, hint, required in _get_dependencies(provider):
+                    dependency = cls._find_key(name=name, hint=hint)
+                    if dependency is not None:
+                        index = visit(dependency, (*path, key))
+                        arguments.append((name, index))
+                    elif required:
+                        raise KeyError(
+                            f"{name} of {provider.__name__} was not found in "
+                            f"the registry"
+                        )
+            steps.append(
+                _Step(
+                    key=key,
+                    provider=provider,
+                    lifetime=lifetime,
+                    arguments=tuple(arguments),
+                )
+            )
+            if lifetime != "transient":
+                reused[key] = len(steps) - 1
+            return len(steps) - 1
+
+        visit(item, ())
+        return tuple(steps)
+
+    @classmethod
+    def _find_key(cls, name: str, hint: Any) -> Hashable | None:
+        """Returns the key in `registry` to use for a constructor parameter.
+
+        Args:
+            name: name of the parameter.
+            hint: type annotation of the parameter.
+
+        Returns:
+            Key of the first registered item matching `hint` (or any type in
+                `hint` if it is a union) unless it is a builtin type, `name` if
+                it is a key in `registry`, or `None`.
+
+        """
+        if isinstance(hint, types.UnionType) or typing.get_origin(hint) is (
+            typing.Union
+        ):
+            kinds = [k for k in typing.get_args(hint) if k is not type(None)]
+        else:
+            kinds = [hint]
+        for kind in kinds:
+            if isinstance(kind, str):
+                for key, value in cls.registry.items():
+                    if inspect.isclass(value) and value.__name__ == kind:
+                        return key
+            elif (
+                inspect.isclass(kind)
+                and kind is not inspect.Parameter.empty
+                and kind.__module__ != "builtins"
+            ):
+                for key, value in cls.registry.items():
+                    if value is kind:
+                        return key
+                for key, value in cls.registry.items():
+                    if inspect.isclass(value):
+                        if issubclass(value, kind):
+                            return key
+                    elif isinstance(value, kind):
+                        return key
+        return name if name in cls.registry else None
+
+    @classmethod
+    def _discard_stale_singletons(cls) -> None:
+        """Discards singletons whose registry entry or lifetime has changed."""
+        for key, provider in list(cls._singleton_providers.items()):
+            if (
+                cls.registry.get(key) is not provider
+                or cls.lifetimes.get(key) != "singleton"
+            ):
+                del cls._singleton_providers[key]
+                cls._singletons.pop(key, None)
+
+    @classmethod
+    def _get_plan(cls, item: Hashable) -> tuple[_Step, ...]:
+        """Returns the cached steps to create `item`, building them if needed.
+
+        Args:
+            item: key in `registry` of the item to create.
+
+        Returns:
+            Steps to take, ending with the step that creates `item`.
+
+        """
+        stamp = trackers._stamp(cls.registry, cls.lifetimes)
+        if stamp != cls._plans_stamp:
+            with cls._lock:
+                cls._plans.clear()
+                cls._plans_stamp = stamp
+                cls._discard_stale_singletons()
+        try:
+            return cls._plans[item]
+        except KeyError:
+            plan = cls._plans[item] = cls._build_plan(item)
+            return plan
+
+    @classmethod
+    def _provide(
+        cls,
+        step: _Step,
+        values: list[Any],
+        scope: dict[tuple[type, Hashable], Any] | None,
+    ) -> Any:
+        """Returns the item for `step`, reusing it if its lifetime allows.
+
+        Args:
+            step: step to take.
+            values: items returned by earlier steps of the same plan.
+            scope: instances in the active `scope`, if any.
+
+        Raises:
+            ValueError: if `step` has a "scoped" lifetime and `scope` is
+                `None`.
+
+        Returns:
+            Item for `step`.
+
+        """
+        if step.lifetime == "transient":
+            return _construct(step, values=values)
+        elif step.lifetime == "singleton":
+            cache, key = cls._singletons, step.key
+        elif scope is None:
+            raise ValueError(f"{step.key} can only be created inside a scope")
+        else:
+            cache, key = scope, (cls, step.key)
+        try:
+            return cache[key]
+        except KeyError:
+            pass
+        with cls._lock:
+            if key not in cache:
+                cache[key] = _construct(step, values=values)
+                if cache is cls._singletons:
+                    cls._singleton_providers[key] = step.provider
+                    # Plans no longer need to create the singleton's
+                    # dependencies.
+                    cls._plans.clear()
+            return cache[key]
+
+
+@dataclasses.dataclass(frozen=True)
+class _Step:
+    """One constructor call in a plan made by `Injector`.
+
+    Args:
+        key: key of the item in the registry.
+        provider: registered class or instance.
+        lifetime: lifetime of the item.
+        arguments: pairs of each parameter name and the index of the earlier
+            step whose item is passed for it.
+
+    """
+
+    key: Hashable
+    provider: Any
+    lifetime: str
+    arguments: tuple[tuple[str, int], ...]
+
+
+def _construct(
+    step: _Step,
+    values: list[Any],
+    parameters: base.GenericDict | None = None,
+) -> Any:
+    """Returns a new item for `step`.
+
+    Args:
+        step: step to take.
+        values: items returned by earlier steps of the same plan.
+        parameters: other keyword arguments to pass to the constructor.
+            Defaults to `None`.
+
+    Returns:
+        Instance of the registered class or the registered instance itself.
+
+    """
+    if not inspect.isclass(step.provider):
+        return step.provider
+    kwargs = {name: values[index] for name, index in step.arguments}
+    if parameters:
+        kwargs.update(parameters)
+    return step.provider(**kwargs)
+
+
+def _get_dependencies(item: type[Any]) -> list[tuple[str, Any, bool]]:
+    """Returns the parameters of the constructor of `item`.
+
+    Args:
+        item: class to inspect.
+
+    Returns:
+        Name, type annotation, and whether it is required for each keyword
+            parameter. Annotations that cannot be resolved are left as `str`.
+
+    """
+    try:
+        signature = inspect.signature(item)
+    except (TypeError, ValueError):
+        return []
+    try:
+        hints = typing.get_type_hints(item.__init__)
+    except (AttributeError, NameError, TypeError):
+        hints = {}
+    return [
+        (
+            p.name,
+            hints.get(p.name, p.annotation),
+            p.default is inspect.Parameter.empty,
+        )
+        for p in signature.parameters.values()
+        if p.kind
+        in (
+            inspect.Parameter.POSITIONAL_OR_KEYWORD,
+            inspect.Parameter.KEYWORD_ONLY,
+        )
+    ]
@@ -0,0 +1,191 @@
+"""Construction from recipe files.
+
+Contents:
+    load_recipes: lazily creates an item for each line of a JSON Lines (also
+        known as NDJSON) file of construction recipes.
+
+"""
+
+from __future__ import annotations
+
+import collections
+import contextlib
+import json
+import mmap
+import pathlib
+from collections.abc import Mapping
+from typing import IO, TYPE_CHECKING, Any
+
+from . import base
+
+if TYPE_CHECKING:
+    import concurrent.futures
+    from collections.abc import Iterable, Iterator
+
+
+def load_recipes(
+    source: str | pathlib.Path | IO[Any] | Iterable[str | bytes],
+    target: base.Cluster | type[base.Factory] | base.Factory,
+    *,
+    memory_map: bool = False,
+    executor: concurrent.futures.Executor | None = None,
+    window: int | None = None,
+) -> Iterator[Any]:
+    """Yields an item created from each recipe in `source`, in order.
+
+    Each non-blank line of `source` is a JSON object such as:
+
+    ```json
+    {"factory": "settings", "item": {"path": "a.toml"}, "parameters": {}}
+    ```
+
+    If `target` is a `base.Cluster` (such as a `Manufacturer`), "factory" is
+    the key of the constructor in its `contents` that is passed "item" and
+    "parameters". Otherwise, "factory" is ignored and "item" and "parameters"
+    are passed to the `create` method of `target` (such as a `Registrar`
+    subclass). "parameters" is optional.
+
+    Lines are read and parsed one at a time, so only the recipes being worked
+    on are held in memory.
+
+    ```python
+    for item in wonka.load_recipes("recipes.jsonl", manufacturer):
+        ...
+    ```
+
+    Args:
+        source: path to a recipe file, an open file, or an iterable of lines.
+        target: cluster of constructors or constructor to create items with.
+        memory_map: whether to read a file at the `source` path through a
+            memory-mapped file instead of buffered reads. Defaults to `False`.
+        executor: executor used to create items concurrently. Defaults to
+            `None`. If it is `None`, items are created one at a time as they
+            are requested. Items are always yielded in the order of `source`.
+        window: maximum number of recipes submitted to `executor` but not yet
+            yielded. Defaults to `None`. If it is `None`, twice the number of
+            workers of `executor` (or 32 if that is unknown) is used.
+
+    Raises:
+        KeyError: if "factory" in a recipe is not in the `contents` of
+            `target`.
+        ValueError: if a line is not a JSON object with an "item" key. The
+            message includes the line number.
+
+    Yields:
+        Created items.
+
+    """
+    with _open_lines(source, memory_map=memory_map) as lines:
+        recipes = _parse(lines)
+        if executor is None:
+            for factory, item, parameters in recipes:
+                yield _build(target, factory, item, parameters)
+            return
+        window = window or 2 * (getattr(executor, "_max_workers", None) or 16)
+        pending: collections.deque[concurrent.futures.Future[Any]] = (
+            collections.deque()
+        )
+        try:
+            for recipe in recipes:
+                pending.append(executor.submit(_build, target, *recipe))
+                if len(pending) >= window:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+def _build(
+    target: base.Cluster | type[base.Factory] | base.Factory,
+    factory: Any,
+    item: Any,
+    parameters: base.GenericDict | None,
+) -> Any:
+    """Returns an item created from one recipe.
+
+    Args:
+        target: cluster of constructors or constructor to create items with.
+        factory: key of the constructor in the `contents` of `target`, if it is
+            a `base.Cluster`.
+        item: data for construction of the returned item.
+        parameters: keyword arguments to pass or add to a created instance.
+
+    Raises:
+        KeyError: if `factory` is not in the `contents` of `target`.
+
+    Returns:
+        Created item.
+
+    """
+    if isinstance(target, base.Cluster):
+        try:
+            constructor = target.contents[factory]
+        except KeyError as e:
+            raise KeyError(f"{factory} is not a stored constructor") from e
+    else:
+        constructor = target
+    if parameters is None:
+        return constructor.create(item)
+    return constructor.create(item, parameters=parameters)
+
+
+@contextlib.contextmanager
+def _open_lines(
+    source: str | pathlib.Path | IO[Any] | Iterable[str | bytes],
+    *,
+    memory_map: bool,
+) -> Iterator[Iterable[str | bytes]]:
+    """Yields an iterable of the lines of `source`, closing it afterwards.
+
+    Args:
+        source: path to a recipe file, an open file, or an iterable of lines.
+        memory_map: whether to read a file at the `source` path through a
+            memory-mapped file.
+
+    Yields:
+        Lines of `source`.
+
+    """
+    if not isinstance(source, str | pathlib.Path):
+        yield source
+    elif not memory_map:
+        with open(source, "rb") as file:
+            yield file
+    else:
+        with open(source, "rb") as file:
+            if pathlib.Path(source).stat().st_size == 0:
+                yield ()
+                return
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as view:
+                yield iter(view.readline, b"")
+
+
+def _parse(
+    lines: Iterable[str | bytes],
+) -> Iterator[tuple[Any, Any, base.GenericDict | None]]:
+    """Yields (factory, item, parameters) for each recipe in `lines`.
+
+    Args:
+        lines: lines of JSON objects. Blank lines are skipped.
+
+    Raises:
+        ValueError: if a line is not a JSON object with an "item" key.
+
+    Yields:
+        Factory key (or `None`), item, and parameters (or `None`).
+
+    """
+    for number, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        try:
+            recipe = json.loads(line)
+        except ValueError as e:
+            raise ValueError(f"line {number} is not valid JSON: {e}") from e
+        if not isinstance(recipe, Mapping) or "item" not in recipe:
+            raise ValueError(
+                f"line {number} is not a JSON object with an 'item' key"
+            )
+        yield recipe.get("factory"), recipe["item"], recipe.get("parameters")
@@ -3,19 +3,40 @@
 Contents:
     Assembler (`MutableSequence`, `base.Manager`): iterable that stores a list
         of constructors that build an item like an assembly line.
+    Deadline: time limits, expiry behavior, and latency histograms for the
+        stages of an `Assembler`.
+    Histogram: log-scale histogram of stage latencies.
 
 """
 
 from __future__ import annotations
 
+import concurrent.futures
 import copy
 import dataclasses
-from collections.abc import Iterator, MutableSequence, Sequence
-from typing import Any
+import hashlib
+import inspect
+import itertools
+import math
+import os
+import pathlib
+import pickle
+import threading
+import time
+import types
+import weakref
+from collections.abc import (
+    Callable,
+    Iterable,
+    Iterator,
+    MutableSequence,
+    Sequence,
+)
+from typing import Any, Literal
 
 from wonka import utilities
 
-from . import base, shared
+from . import base, caches, shared, trackers
 
 
 @dataclasses.dataclass
@@ -25,13 +46,74 @@ class Assembler(MutableSequence, base.Manager):
     Assembler stores a sequence of wonka constructors that are called by the
     `manage` (or `create`) method in order to construct an item.
 
+    The `manage` method runs a compiled pipeline (see `compile`) which is
+    rebuilt automatically after any change made through the methods of
+    `Assembler`, by replacing `contents`, or by mutating `contents` directly if
+    it is a `trackers.TrackedList` (as it is by default). If `contents` is
+    another kind of sequence (such as a plain `list` passed by the caller,
+    which is stored as is) and a stored constructor is replaced by directly
+    setting an index of it, `compile` should be called with `force=True`.
+    Changes to a nested `Assembler` are only seen by the pipelines it is
+    flattened into when they are made through its methods; after any other
+    change to it, `compile` should be called on them with `force=True`.
+
+    A stored constructor may also declare that it accepts a batch of items by
+    providing a `create_batch` method that takes a list of items and returns a
+    list of created items in the same order. The `manage_many` method passes
+    chunks of items to those constructors and passes items one at a time to
+    the `create` method of all other constructors. If `checkpoints` or
+    `deadline` is set, it instead passes each item to `manage`.
+
+    If `checkpoints` is set, `manage` stores the output of every stage in that
+    folder. Each checkpoint is named by a hash of the item originally passed
+    and of the name and code of every stage up to that point, and its contents
+    are verified with a hash when read. When `manage` is called again with the
+    same item, it resumes after the latest stage with a valid checkpoint. So,
+    after a failure or after changing only later stages, earlier stages are
+    not run again, even by another process. Each stage is identified by its
+    class (or function) name and the code of its own `create` method
+    (including its constants, the names it uses, and functions defined in
+    it). So, changes to helper or builder methods that it calls are not
+    detected, and neither are the attributes of a constructor instance. A
+    constructor may declare a `checkpoint_version` attribute, which is hashed
+    with its code, and change it whenever such code or its settings change.
+
     Args:
         contents: stored constructors. Defaults to an empty list.
+        chunk_size: number of items passed together to constructors with a
+            `create_batch` method by `manage_many`. Defaults to 256.
+        checkpoints: folder in which to store the output of each stage of
+            `manage`. Defaults to `None`, which disables checkpoints.
+        codec: object with `dumps` and `loads` functions used to convert the
+            item passed to `manage` and each checkpoint to and from `bytes`.
+            Defaults to the `pickle` module.
+        deadline: time limits for each stage and the whole pipeline run by
+            `manage`, which also records the latency of each stage. Defaults
+            to `None`, which sets no limits and records no latencies.
 
     """
 
     contents: MutableSequence[base.Constructor] = dataclasses.field(
-        default_factory=list
+        default_factory=trackers.TrackedList
+    )
+    chunk_size: int = 256
+    checkpoints: str | pathlib.Path | None = None
+    codec: Any = pickle
+    deadline: Deadline | None = None
+    _batches: tuple[tuple[Callable[[Any], Any], bool], ...] | None = (
+        dataclasses.field(default=None, init=False, repr=False, compare=False)
+    )
+    _stages: tuple[Callable[[Any], Any], ...] | None = dataclasses.field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _compiled: _Compilation | None = dataclasses.field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _parents: weakref.WeakValueDictionary[int, Assembler] = dataclasses.field(
+        default_factory=weakref.WeakValueDictionary,
+        init=False,
+        repr=False,
+        compare=False,
     )
 
     """ Instance Methods """
@@ -58,6 +140,35 @@ class Assembler(MutableSequence, base.Manager):
             raise TypeError(
                 "All values in item must be wonka-compatible constructors"
             )
+        self._invalidate()
+
+    def compile(self, *, force: bool = False) -> Callable[[Any], Any]:
+        """Returns a single callable that runs every stage of the pipeline.
+
+        Nested `Assembler` instances in `contents` are flattened into this
+        pipeline and the `create` method of every other constructor is bound
+        ahead of time. The flattened stages are cached until `contents`
+        changes or a nested `Assembler` is changed through its methods. The
+        returned callable does
+        not track later changes, so `compile` should be called again after
+        changing the pipeline (`manage` does this automatically).
+
+        Args:
+            force: whether to rebuild the pipeline even if the cached one
+                appears current. Defaults to `False`.
+
+        Returns:
+            Callable that takes an item and returns the constructed item.
+
+        """
+        stages = self._get_stages(force=force)
+
+        def pipeline(item: Any) -> Any:
+            for create in stages:
+                item = create(item)
+            return item
+
+        return pipeline
 
     def delete(self, item: int) -> None:
         """Deletes item at the index in `contents`.
@@ -67,6 +178,7 @@ class Assembler(MutableSequence, base.Manager):
 
         """
         del self.contents[item]
+        self._invalidate()
         return
 
     def insert(self, index: int, item: Any) -> None:
@@ -78,6 +190,7 @@ class Assembler(MutableSequence, base.Manager):
 
         """
         self.contents.insert(index, item)
+        self._invalidate()
         return
 
     def manage(self, item: Any) -> Any:
@@ -90,10 +203,63 @@ class Assembler(MutableSequence, base.Manager):
             Constructed item.
 
         """
-        for constructor in self.contents:
-            item = constructor.create(item)
+        if self.checkpoints is not None:
+            return self._manage_with_checkpoints(item)
+        elif self.deadline is not None:
+            return self.deadline.run(self._get_stages(), item)
+        for create in self._get_stages():
+            item = create(item)
         return item
 
+    def manage_many(
+        self, items: Iterable[Any], chunk_size: int | None = None
+    ) -> list[Any]:
+        """Manages construction and/or modification of each of `items`.
+
+        Items are processed in chunks. Each chunk is passed whole to the
+        `create_batch` method of constructors that have one and item by item
+        to the `create` method of all other constructors.
+
+        If `checkpoints` or `deadline` is set, each item is instead passed to
+        `manage`, so checkpoints are stored and resumed from and time limits
+        are applied exactly as they are for a single item, and `create_batch`
+        methods are not used.
+
+        Args:
+            items: items to be passed to constructors in `contents`.
+            chunk_size: number of items in each chunk. Defaults to `None`. If
+                it is `None`, the `chunk_size` attribute is used.
+
+        Raises:
+            ValueError: if a `create_batch` method does not return one item for
+                each item passed to it.
+
+        Returns:
+            Constructed items in the same order as `items`.
+
+        """
+        if self.checkpoints is not None or self.deadline is not None:
+            return [self.manage(item) for item in items]
+        self._get_stages()
+        stages = self._batches
+        size = chunk_size or self.chunk_size
+        iterator = iter(items)
+        results = []
+        while chunk := list(itertools.islice(iterator, size)):
+            for create, batched in stages:
+                if batched:
+                    length = len(chunk)
+                    chunk = list(create(chunk))
+                    if len(chunk) != length:
+                        raise ValueError(
+                            f"{create} returned {len(chunk)} items for a "
+                            f"batch of {length}"
+                        )
+                else:
+                    chunk = [create(item) for item in chunk]
+            results.extend(chunk)
+        return results
+
     def prepend(self, item: Any | Sequence[Any]) -> None:
         """Prepends `item` to `contents`.
 
@@ -145,8 +311,94 @@ class Assembler(MutableSequence, base.Manager):
             contents = [i for i in contents if i not in exclude]
         new_listing = copy.deepcopy(self)
         new_listing.contents = contents
+        new_listing._invalidate()
         return new_listing
 
+    """ Private Methods """
+
+    def _get_stages(
+        self, *, force: bool = False
+    ) -> tuple[Callable[[Any], Any], ...]:
+        """Returns the bound `create` method of every flattened stage.
+
+        Args:
+            force: whether to rebuild the stages even if the cached ones appear
+                current. Defaults to `False`.
+
+        Returns:
+            Bound `create` methods in the order they should be called.
+
+        """
+        compiled = self._compiled
+        if (
+            force
+            or compiled is None
+            or compiled.contents is not self.contents
+            or compiled.length != len(self.contents)
+            or compiled.generation != trackers.generation(self.contents)
+        ):
+            stages = []
+            for constructor in self.contents:
+                if _is_flattenable(constructor):
+                    stages.extend(constructor._get_stages(force=force))
+                    constructor._parents[id(self)] = self
+                else:
+                    stages.append(constructor.create)
+            self._stages = tuple(stages)
+            self._batches = tuple(_get_batch_stage(s) for s in stages)
+            self._compiled = _Compilation(
+                contents=self.contents,
+                length=len(self.contents),
+                generation=trackers.generation(self.contents),
+            )
+        return self._stages
+
+    def _manage_with_checkpoints(self, item: Any) -> Any:
+        """Manages construction, storing and resuming from checkpoints.
+
+        Args:
+            item: item to be passed to constructors in `contents`.
+
+        Returns:
+            Constructed item.
+
+        """
+        folder = utilities._pathlibify(self.checkpoints)
+        folder.mkdir(parents=True, exist_ok=True)
+        stages = self._get_stages()
+        digest = hashlib.sha256(caches._encode(item))
+        paths = []
+        for create in stages:
+            digest.update(_describe_stage(create))
+            paths.append(folder / f"{digest.hexdigest()}.checkpoint")
+        start = 0
+        for index in reversed(range(len(paths))):
+            found, value = _load_checkpoint(paths[index], codec=self.codec)
+            if found:
+                item = value
+                start = index + 1
+                break
+        if self.deadline is None:
+            for create, path in zip(stages[start:], paths[start:], strict=True):
+                item = create(item)
+                _save_checkpoint(path, item=item, codec=self.codec)
+            return item
+        return self.deadline.run(
+            stages[start:],
+            item,
+            on_stage=lambda i, value: _save_checkpoint(
+                paths[start + i], item=value, codec=self.codec
+            ),
+        )
+
+    def _invalidate(self) -> None:
+        """Discards the compiled pipeline and those it is flattened into."""
+        self._stages = None
+        self._batches = None
+        self._compiled = None
+        for parent in list(self._parents.values()):
+            parent._invalidate()
+
     """ Dunder Methods """
 
     def __getitem__(self, index: int) -> base.Constructor:
@@ -170,6 +422,7 @@ class Assembler(MutableSequence, base.Manager):
 
         """
         self.contents[index] = value
+        self._invalidate()
         return
 
     def __add__(
@@ -184,6 +437,30 @@ class Assembler(MutableSequence, base.Manager):
         self.add(item=other)
         return self
 
+    def __deepcopy__(self, memo: dict[int, Any]) -> Assembler:
+        """Returns a copy that shares `codec` and has no compiled pipeline.
+
+        Args:
+            memo: objects already copied, passed by `copy.deepcopy`.
+
+        Returns:
+            Deep copy of the `Assembler`.
+
+        """
+        kind = type(self)
+        result = kind.__new__(kind)
+        memo[id(self)] = result
+        for name, value in vars(self).items():
+            if name == "_parents":
+                copied = weakref.WeakValueDictionary()
+            elif name == "codec":
+                copied = value
+            else:
+                copied = copy.deepcopy(value, memo)
+            setattr(result, name, copied)
+        result._invalidate()
+        return result
+
     def __delitem__(self, item: int) -> Assembler:
         """Deletes `item` from `contents`.
 
@@ -214,3 +491,377 @@ class Assembler(MutableSequence, base.Manager):
 
         """
         return len(self.contents)
+
+
+@dataclasses.dataclass
+class Deadline:
+    """Time limits and latency tracking for the stages of an `Assembler`.
+
+    A time-limited stage is run on a worker thread while the calling thread
+    waits for its result. Python cannot interrupt a running thread, so a stage
+    that expires keeps running in the background until it returns, but its
+    result is discarded.
+
+    When a stage expires, `expiry` determines what happens next:
+        'raise': a `TimeoutError` is raised.
+        'skip': the stage's result is ignored and the item is passed unchanged
+            to the next stage. So that an expired stage, which keeps running,
+            cannot change the item while later stages use it, each
+            time-limited stage is passed a deep copy of the item.
+        'fallback': `fallback` is returned in place of the constructed item.
+
+    The wall time of every stage call, including expired ones, is recorded in
+    `latencies`, so slow outliers can be traced to a specific constructor.
+    Latencies are only recorded for an `Assembler` with a `deadline`; a
+    `Deadline` without limits records them without running stages on other
+    threads.
+
+    Args:
+        stage: seconds each stage may run. Defaults to `None`, which sets no
+            per-stage limit.
+        total: seconds the whole pipeline may run. Defaults to `None`, which
+            sets no overall limit.
+        expiry: what to do when a limit expires. Defaults to 'raise'.
+        fallback: item returned when a limit expires and `expiry` is
+            'fallback'. Defaults to `None`.
+        executor: executor on which time-limited stages are run. Defaults to
+            `None`. If it is `None`, a thread pool is created on first use.
+        latencies: histograms of stage wall times, keyed by stage name.
+            Defaults to an empty `dict`.
+
+    """
+
+    stage: float | None = None
+    total: float | None = None
+    expiry: Literal["raise", "skip", "fallback"] = "raise"
+    fallback: Any = None
+    executor: concurrent.futures.Executor | None = None
+    latencies: dict[str, Histogram] = dataclasses.field(default_factory=dict)
+    _lock: threading.Lock = dataclasses.field(
+        default_factory=threading.Lock, init=False, repr=False, compare=False
+    )
+
+    """ Instance Methods """
+
+    def run(
+        self,
+        stages: Sequence[Callable[[Any], Any]],
+        item: Any,
+        on_stage: Callable[[int, Any], None] | None = None,
+    ) -> Any:
+        """Passes `item` through `stages` within the time limits.
+
+        Args:
+            stages: bound `create` methods in the order they should be called.
+            item: item to be passed to `stages`.
+            on_stage: function called with the index of each completed stage
+                and its result. It is not called again after a stage is
+                skipped. Defaults to `None`.
+
+        Raises:
+            TimeoutError: if a limit expires and `expiry` is 'raise'.
+
+        Returns:
+            Constructed item or `fallback`.
+
+        """
+        end = None if self.total is None else time.monotonic() + self.total
+        skipped = False
+        for index, create in enumerate(stages):
+            limit = self.stage
+            if end is not None:
+                remaining = end - time.monotonic()
+                limit = remaining if limit is None else min(limit, remaining)
+            argument = item
+            if self.expiry == "skip" and limit is not None:
+                argument = copy.deepcopy(item)
+            started = time.perf_counter()
+            try:
+                result = self._call(create, argument, limit=limit)
+            except TimeoutError:
+                self._record(create, time.perf_counter() - started)
+                if self.expiry == "raise":
+                    raise
+                if self.expiry == "fallback":
+                    return self.fallback
+                skipped = True
+                continue
+            self._record(create, time.perf_counter() - started)
+            item = result
+            if on_stage is not None and not skipped:
+                on_stage(index, item)
+        return item
+
+    """ Private Methods """
+
+    def _call(
+        self, create: Callable[[Any], Any], item: Any, limit: float | None
+    ) -> Any:
+        """Returns `create(item)`, waiting at most `limit` seconds.
+
+        Args:
+            create: stage to call.
+            item: item to pass to `create`.
+            limit: seconds to wait. If it is `None`, `create` is called
+                directly on the calling thread.
+
+        Raises:
+            TimeoutError: if `limit` expires before `create` returns.
+
+        Returns:
+            Result of `create(item)`.
+
+        """
+        if limit is None:
+            return create(item)
+        elif limit <= 0:
+            raise TimeoutError(f"no time remained to run {create}")
+        future = self._get_executor().submit(create, item)
+        try:
+            return future.result(timeout=limit)
+        except TimeoutError as e:
+            future.cancel()
+            raise TimeoutError(f"{create} did not finish in {limit}s") from e
+
+    def _get_executor(self) -> concurrent.futures.Executor:
+        """Returns `executor`, creating a thread pool if it is `None`."""
+        if self.executor is None:
+            with self._lock:
+                if self.executor is None:
+                    self.executor = concurrent.futures.ThreadPoolExecutor(
+                        thread_name_prefix="wonka-deadline"
+                    )
+        return self.executor
+
+    def _record(self, create: Callable[[Any], Any], seconds: float) -> None:
+        """Adds `seconds` to the latency histogram for `create`."""
+        name = utilities._namify(getattr(create, "__self__", create))
+        with self._lock:
+            histogram = self.latencies.setdefault(name, Histogram())
+        histogram.record(seconds)
+
+    """ Dunder Methods """
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> Deadline:
+        """Returns a copy that shares `executor` but not `latencies`."""
+        return dataclasses.replace(
+            self, latencies=copy.deepcopy(self.latencies, memo)
+        )
+
+
+@dataclasses.dataclass
+class Histogram:
+    """Log-scale histogram of latencies.
+
+    Each bucket counts the latencies that are at most double the upper bound
+    of the previous bucket, starting at one microsecond.
+
+    Args:
+        buckets: counts, indexed by bucket. Defaults to an empty `list`.
+
+    """
+
+    buckets: list[int] = dataclasses.field(default_factory=list)
+    _lock: threading.Lock = dataclasses.field(
+        default_factory=threading.Lock, init=False, repr=False, compare=False
+    )
+
+    """ Properties """
+
+    @property
+    def count(self) -> int:
+        """Returns the number of recorded latencies."""
+        with self._lock:
+            return sum(self.buckets)
+
+    """ Instance Methods """
+
+    def percentile(self, percent: float) -> float:
+        """Returns the upper bound of the bucket containing `percent`.
+
+        Args:
+            percent: percentile to find, from 0 to 100.
+
+        Returns:
+            Upper bound, in seconds, of the latencies at or below `percent`.
+                If nothing has been recorded, 0.0 is returned.
+
+        """
+        with self._lock:
+            buckets = list(self.buckets)
+        target = sum(buckets) * percent / 100
+        seen = 0
+        for index, count in enumerate(buckets):
+            seen += count
+            if count and seen >= target:
+                return 2**index / 1e6
+        return 0.0
+
+    def record(self, seconds: float) -> None:
+        """Adds a latency of `seconds` to the histogram."""
+        index = max(math.ceil(math.log2(max(seconds * 1e6, 1))), 0)
+        with self._lock:
+            if index >= len(self.buckets):
+                self.buckets.extend([0] * (index + 1 - len(self.buckets)))
+            self.buckets[index] += 1
+
+    """ Dunder Methods """
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> Histogram:
+        """Returns a copy with its own buckets and lock."""
+        with self._lock:
+            return Histogram(buckets=list(self.buckets))
+
+
+@dataclasses.dataclass(frozen=True)
+class _Compilation:
+    """Record of the state an `Assembler` pipeline was compiled from.
+
+    Args:
+        contents: `contents` of the `Assembler` when it was compiled.
+        length: length of `contents` when it was compiled.
+        generation: generation of `contents` when it was compiled, or 0 if it
+            is not tracked.
+
+    """
+
+    contents: MutableSequence[base.Constructor]
+    length: int
+    generation: int
+
+
+def _describe_stage(create: Callable[[Any], Any]) -> bytes:
+    """Returns bytes identifying a stage for naming checkpoints.
+
+    Args:
+        create: bound `create` method of a constructor.
+
+    Returns:
+        Qualified name of the constructor or its class, its
+            `checkpoint_version` attribute (if any), and a fingerprint of the
+            code of `create`. None of these change between processes.
+
+    """
+    owner = getattr(create, "__self__", None)
+    function = getattr(create, "__func__", create)
+    if owner is None:
+        name = f"{function.__module__}.{function.__qualname__}"
+    else:
+        kind = owner if inspect.isclass(owner) else type(owner)
+        name = f"{kind.__module__}.{kind.__qualname__}.{function.__name__}"
+    version = getattr(
+        function if owner is None else owner, "checkpoint_version", None
+    )
+    code = getattr(function, "__code__", None)
+    return b"\0".join(
+        (
+            name.encode(),
+            repr(version).encode(),
+            b"" if code is None else _fingerprint(code),
+        )
+    )
+
+
+def _fingerprint(value: Any) -> bytes:
+    """Returns bytes identifying `value`, a code object or a constant in one.
+
+    Unlike `marshal.dumps`, the result does not depend on the file name or
+    line numbers of the code or on the iteration order of `frozenset`s.
+
+    Args:
+        value: code object or constant to identify.
+
+    Returns:
+        Bytecode, names, and constants (including nested code objects) of a
+            code object, or the `repr` of any other constant.
+
+    """
+    if isinstance(value, types.CodeType):
+        constants = b",".join(_fingerprint(c) for c in value.co_consts)
+        names = ",".join(value.co_names).encode()
+        return b"code(" + value.co_code + b";" + names + b";" + constants + b")"
+    elif isinstance(value, tuple):
+        return b"(" + b",".join(_fingerprint(v) for v in value) + b")"
+    elif isinstance(value, frozenset):
+        return b"{" + b",".join(sorted(_fingerprint(v) for v in value)) + b"}"
+    return f"{type(value).__name__}:{value!r}".encode()
+
+
+def _get_batch_stage(
+    create: Callable[[Any], Any],
+) -> tuple[Callable[[Any], Any], bool]:
+    """Returns the batch method for a stage, if it has one.
+
+    Args:
+        create: bound `create` method of a constructor.
+
+    Returns:
+        The constructor's `create_batch` method and `True` if it exists.
+            Otherwise, `create` and `False`.
+
+    """
+    owner = getattr(create, "__self__", None)
+    create_batch = getattr(owner, "create_batch", None)
+    if callable(create_batch):
+        return create_batch, True
+    return create, False
+
+
+def _load_checkpoint(path: pathlib.Path, codec: Any) -> tuple[bool, Any]:
+    """Returns whether a valid checkpoint exists at `path` and its item.
+
+    Args:
+        path: path of the checkpoint file.
+        codec: object with a `loads` function to convert `bytes` to the item.
+
+    Returns:
+        `True` and the stored item if the checkpoint exists and its contents
+            match its hash. Otherwise, `False` and `None`.
+
+    """
+    try:
+        data = path.read_bytes()
+    except OSError:
+        return False, None
+    digest, payload = data[:32], data[32:]
+    if hashlib.sha256(payload).digest() != digest:
+        return False, None
+    return True, codec.loads(payload)
+
+
+def _save_checkpoint(path: pathlib.Path, item: Any, codec: Any) -> None:
+    """Atomically stores `item` with a hash of its contents at `path`.
+
+    Args:
+        path: path of the checkpoint file.
+        item: item to store.
+        codec: object with a `dumps` function to convert the item to `bytes`.
+
+    """
+    payload = codec.dumps(item)
+    temporary = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+    temporary.write_bytes(hashlib.sha256(payload).digest() + payload)
+    temporary.replace(path)
+
+
+def _is_flattenable(item: Any) -> bool:
+    """Returns whether `item` is an `Assembler` that can be flattened.
+
+    Args:
+        item: constructor to examine.
+
+    Returns:
+        Whether `item` is an `Assembler` that does not override `create`,
+            `manage`, or `manage_many` and does not use checkpoints or a
+            deadline.
+
+    """
+    kind = type(item)
+    return (
+        isinstance(item, Assembler)
+        and kind.create is Assembler.create
+        and kind.manage is Assembler.manage
+        and kind.manage_many is Assembler.manage_many
+        and item.checkpoints is None
+        and item.deadline is None
+    )
@@ -12,6 +12,7 @@ Contents:
 
 from __future__ import annotations
 
+import weakref
 from collections.abc import Callable
 from typing import Any
 
@@ -19,6 +20,11 @@ from . import utilities
 
 # Default naming function for non-str objects.
 _KEY_NAMER: Callable[[object | type[Any]], str] = utilities._namify
+# Keys computed by `_KEY_NAMER` for classes, each tagged with the namer that
+# computed it.
+_CLASS_KEYS: weakref.WeakKeyDictionary[
+    type[Any], tuple[Callable[[object | type[Any]], str], str]
+] = weakref.WeakKeyDictionary()
 # Default naming convention for dispatcher registry creation methods.
 _METHOD_NAMER: Callable[[object | type[Any]], str] = lambda x: f"from_{x}"
 # Whether to overwrite existing attributes when arguments are passed to create
@@ -61,6 +67,8 @@ def set_keyer(keyer: Callable[[object | type[Any]], str]) -> None:
     """
     if isinstance(keyer, Callable):
         globals()["_KEY_NAMER"] = keyer
+        for kind in list(_CLASS_KEYS):
+            _CLASS_KEYS[kind] = (keyer, keyer(kind))
     else:
         raise TypeError("keyer argument must be a callable")
 
@@ -115,6 +123,30 @@ def set_verbose_rule(verbose: bool) -> None:
         raise TypeError("verbose argument must be boolean")
 
 
+def _get_key(item: object | type[Any]) -> str:
+    """Returns the key for `item` from the global `_KEY_NAMER`.
+
+    The key for a class is computed once and stored until the class is deleted
+    or `set_keyer` changes the namer.
+
+    Args:
+        item: item to name.
+
+    Returns:
+        Key for `item`.
+
+    """
+    if not isinstance(item, type):
+        return _KEY_NAMER(item)
+    namer = _KEY_NAMER
+    stored = _CLASS_KEYS.get(item)
+    if stored is not None and stored[0] is namer:
+        return stored[1]
+    key = namer(item)
+    _CLASS_KEYS[item] = (namer, key)
+    return key
+
+
 # @dataclasses.dataclass
 # class _MISSING_VALUE(object):
 #     """Sentinel object for a missing data or parameter.
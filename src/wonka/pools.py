@@ -0,0 +1,263 @@
+"""Process pools that start with warm registries.
+
+Contents:
+    WarmPool: pool of worker processes that are forked after every stored
+        constructor, and the registries and caches it relies on, have been
+        built, so workers share that state and need no warm-up.
+
+"""
+
+from __future__ import annotations
+
+import concurrent.futures
+import contextlib
+import dataclasses
+import gc
+import inspect
+import multiprocessing
+import os
+from collections.abc import Mapping
+from typing import TYPE_CHECKING, Any, Self
+
+from . import (
+    base,
+    clusters,
+    dispatchers,
+    injectors,
+    managers,
+    options,
+    registries,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable, Iterable, Iterator
+
+
+# Constructor tables of started pools, keyed by pool id. Workers inherit this
+# when they are forked, so tables are never pickled.
+_TABLES: dict[int, Mapping[Hashable, Any]] = {}
+
+
+@dataclasses.dataclass
+class WarmPool:
+    """Pool of forked worker processes that create items.
+
+    When the pool is started, every constructor in `contents` is warmed: keys
+    are computed for the classes in its registries, dispatch tables are built
+    and compiled, and `Assembler` pipelines and `Injector` plans are compiled.
+    Garbage collection is then frozen (see `gc.freeze`) so that workers do not
+    copy the pages holding that state, and every worker is forked at once.
+    Jobs sent to workers hold only the key of a constructor, the item, and the
+    parameters, so the constructors themselves never need to be pickled.
+
+    Workers are forked, so the pool requires the "fork" start method, which is
+    not available on Windows.
+
+    ```python
+    with wonka.WarmPool(manufacturer) as pool:
+        settings = pool.submit("settings", "config.toml").result()
+    ```
+
+    Args:
+        contents: cluster of constructors or mapping with keys that are
+            constructor names and values that are constructors.
+        workers: number of worker processes. Defaults to `None`, which uses
+            the number of processors.
+        freeze: whether to also call the `freeze` method of each constructor
+            that has one (making its registry or sources immutable) before
+            forking. Defaults to `False`.
+
+    """
+
+    contents: base.Cluster | Mapping[Hashable, Any]
+    workers: int | None = None
+    freeze: bool = False
+    _executor: concurrent.futures.ProcessPoolExecutor | None = (
+        dataclasses.field(default=None, init=False, repr=False, compare=False)
+    )
+
+    """ Instance Methods """
+
+    def map(
+        self,
+        jobs: Iterable[tuple[Hashable, Any] | tuple[Hashable, Any, Any]],
+        *,
+        chunksize: int = 1,
+    ) -> Iterator[Any]:
+        """Yields the item created for each of `jobs`, in order.
+
+        Args:
+            jobs: (constructor name, item) or (constructor name, item,
+                parameters) tuples.
+            chunksize: number of jobs sent to a worker at once. Defaults to 1.
+
+        Yields:
+            Created items.
+
+        """
+        executor = self.start()
+        names, items, parameters = [], [], []
+        for job in jobs:
+            names.append(job[0])
+            items.append(job[1])
+            parameters.append(job[2] if len(job) > 2 else None)  # noqa: PLR2004
+        yield from executor.map(
+            _run,
+            [id(self)] * len(names),
+            names,
+            items,
+            parameters,
+            chunksize=chunksize,
+        )
+
+    def shutdown(self, *, wait: bool = True) -> None:
+        """Stops the workers.
+
+        Args:
+            wait: whether to wait for pending jobs to finish. Defaults to
+                `True`.
+
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait)
+            self._executor = None
+            _TABLES.pop(id(self), None)
+        return
+
+    def start(self) -> concurrent.futures.ProcessPoolExecutor:
+        """Warms every constructor and forks the workers, if not yet started.
+
+        Raises:
+            ValueError: if the "fork" start method is not available.
+
+        Returns:
+            Executor running the workers.
+
+        """
+        if self._executor is not None:
+            return self._executor
+        if "fork" not in multiprocessing.get_all_start_methods():
+            raise ValueError("WarmPool requires the 'fork' start method")
+        table = (
+            self.contents.contents
+            if isinstance(self.contents, base.Cluster)
+            else self.contents
+        )
+        for constructor in table.values():
+            _warm(constructor, freeze=self.freeze)
+        _TABLES[id(self)] = table
+        executor = concurrent.futures.ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context("fork"),
+        )
+        gc.collect()
+        gc.freeze()
+        try:
+            # Every worker is forked when the first job is submitted.
+            executor.submit(os.getpid).result()
+        finally:
+            gc.unfreeze()
+        self._executor = executor
+        return executor
+
+    def submit(
+        self,
+        factory: Hashable,
+        item: Any,
+        parameters: base.GenericDict | None = None,
+    ) -> concurrent.futures.Future[Any]:
+        """Sends one job to the workers.
+
+        Args:
+            factory: name of the constructor in `contents` to use.
+            item: data for construction of the returned item.
+            parameters: keyword arguments to pass or add to a created instance.
+                Defaults to `None`.
+
+        Returns:
+            Future for the created item.
+
+        """
+        return self.start().submit(_run, id(self), factory, item, parameters)
+
+    """ Dunder Methods """
+
+    def __enter__(self) -> Self:
+        self.start()
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.shutdown()
+
+
+def _run(
+    pool: int,
+    factory: Hashable,
+    item: Any,
+    parameters: base.GenericDict | None,
+) -> Any:
+    """Returns an item created in a worker.
+
+    Args:
+        pool: id of the `WarmPool` that forked the worker.
+        factory: name of the constructor to use.
+        item: data for construction of the returned item.
+        parameters: keyword arguments to pass or add to a created instance.
+
+    Raises:
+        KeyError: if `factory` is not a stored constructor.
+
+    Returns:
+        Created item.
+
+    """
+    try:
+        constructor = _TABLES[pool][factory]
+    except KeyError as e:
+        raise KeyError(f"{factory} is not a stored constructor") from e
+    if parameters is None:
+        return constructor.create(item)
+    return constructor.create(item, parameters=parameters)
+
+
+def _warm(constructor: Any, *, freeze: bool = False) -> None:
+    """Builds the caches that `constructor` relies on.
+
+    Args:
+        constructor: constructor to warm.
+        freeze: whether to call the `freeze` method of `constructor`, if it
+            has one. Defaults to `False`.
+
+    """
+    kind = constructor if inspect.isclass(constructor) else type(constructor)
+    if freeze and callable(getattr(constructor, "freeze", None)):
+        with contextlib.suppress(TypeError):
+            constructor.freeze()
+    for value in getattr(constructor, "registry", {}).values():
+        if inspect.isclass(value):
+            options._get_key(value)
+    if issubclass(kind, dispatchers.Sourcerer):
+        for value in constructor.sources:
+            if inspect.isclass(value):
+                options._get_key(value)
+    if inspect.isclass(constructor) and issubclass(
+        kind, dispatchers.Arbiter | dispatchers.Delegate | dispatchers.Sourcerer
+    ):
+        with contextlib.suppress(TypeError):
+            constructor.compile()
+    if isinstance(constructor, managers.Assembler):
+        constructor.compile()
+        for stage in constructor.contents:
+            _warm(stage, freeze=freeze)
+    if issubclass(kind, injectors.Injector):
+        for key in list(constructor.registry):
+            with contextlib.suppress(KeyError, ValueError):
+                constructor._get_plan(key)
+    if issubclass(kind, clusters.Keystone):
+        hub = constructor.hub
+        for name in hub.bases:
+            for value in getattr(hub, name, {}).values():
+                options._get_key(value)
+                hub._get_parameters(value)
+    if issubclass(kind, registries.Registrar):
+        options._get_key(kind)
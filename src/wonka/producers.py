@@ -3,6 +3,8 @@
 Contents:
     Classer (`base.Producer`, `abc.ABC`): Producer with an `produce` method that
         always returns a class.
+    Deferrer (`base.Producer`, `abc.ABC`): Producer with an `produce` method
+        that returns a proxy which creates an instance on first use.
     Flexer (`base.Producer`, `abc.ABC`): Producer that conditions return value
         of the `produce` method based on whether `parameters` are passed.
     Instancer (`base.Producer`, `abc.ABC`): Producer with an `produce` method
@@ -13,12 +15,17 @@ Contents:
 from __future__ import annotations
 
 import abc
+import copy
 import dataclasses
 import inspect
-from typing import Any
+import threading
+from typing import TYPE_CHECKING, Any, SupportsIndex
 
 from . import base, shared
 
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+
 
 @dataclasses.dataclass
 class Classer(base.Producer, abc.ABC):
@@ -51,6 +58,53 @@ class Classer(base.Producer, abc.ABC):
         return item if inspect.isclass(item) else item.__class__
 
 
+@dataclasses.dataclass
+class Deferrer(base.Producer, abc.ABC):
+    """Producer with an `produce` method that defers creating an instance.
+
+    When `item` is a class, a lightweight proxy is returned instead of an
+    instance. The instance is created (once, even if the proxy is shared
+    between threads) the first time an attribute of the proxy is accessed or
+    the proxy is called. The proxy reports the class of `item` as its
+    `__class__`, so `isinstance` checks against that class succeed without
+    creating the instance.
+
+    """
+
+    """ Class Methods """
+
+    @classmethod
+    def produce(
+        cls,
+        item: Any,
+        parameters: base.GenericDict | None = None,
+        **kwargs: base.Kwargs,
+    ) -> Any:
+        """Modifies `item` and incorporates `parameters`.
+
+        Args:
+            item: item created by a constructor that may need to be altered
+                before being returned by the constructor `create` method.
+            parameters: keyword arguments to pass or add to a created instance.
+                Defaults to `None`.
+            kwargs: allows subclass to take kwargs.
+
+        Returns:
+            Proxy for an instance of `item` if it is a class. Otherwise, `item`
+                with `parameters` injected.
+
+        """
+        if inspect.isclass(item):
+            parameters = dict(parameters or {})
+            return _Proxy(
+                lambda: shared.instantiate(item, parameters), kind=item
+            )
+        elif parameters is None:
+            return item
+        else:
+            return shared.inject_attributes(item, parameters)
+
+
 @dataclasses.dataclass
 class Flexer(base.Producer, abc.ABC):
     """Producer that conditions return value of the `produce` method.
@@ -86,10 +140,36 @@ class Flexer(base.Producer, abc.ABC):
         if parameters is None:
             return item
         elif inspect.isclass(item):
-            return item(**parameters)
+            return shared.instantiate(item, parameters)
         else:
             return shared.inject_attributes(item, parameters)
 
+    @classmethod
+    def produce_many(
+        cls,
+        items: Iterable[Any],
+        parameters: base.GenericDict | None = None,
+        **kwargs: base.Kwargs,
+    ) -> list[Any]:
+        """Modifies each of `items` and possibly incorporates `parameters`.
+
+        Instances in `items` have `parameters` injected as a single batch.
+
+        Args:
+            items: items created by a constructor that may need to be altered
+                before being returned by the constructor.
+            parameters: keyword arguments to pass or add to each created
+                instance. Defaults to `None`.
+            kwargs: allows subclass to take kwargs.
+
+        Returns:
+            Modified items.
+
+        """
+        if parameters is None:
+            return list(items)
+        return _produce_batch(items, parameters)
+
 
 @dataclasses.dataclass
 class Instancer(base.Producer, abc.ABC):
@@ -122,6 +202,187 @@ class Instancer(base.Producer, abc.ABC):
         elif parameters is None:
             return item
         elif inspect.isclass(item):
-            return item(**parameters)
+            return shared.instantiate(item, parameters)
         else:
             return shared.inject_attributes(item, parameters)
+
+    @classmethod
+    def produce_columns(
+        cls,
+        item: type[Any],
+        columns: Mapping[str, Sequence[Any]],
+        **kwargs: base.Kwargs,
+    ) -> list[Any]:
+        """Creates an instance of `item` for each row in `columns`.
+
+        Args:
+            item: class created by a constructor.
+            columns: keys are parameter names and values are the arguments for
+                that parameter, one for each instance.
+            kwargs: allows subclass to take kwargs.
+
+        Returns:
+            Created instances in row order.
+
+        """
+        return shared.instantiate_columns(item, columns)
+
+    @classmethod
+    def produce_many(
+        cls,
+        items: Iterable[Any],
+        parameters: base.GenericDict | None = None,
+        **kwargs: base.Kwargs,
+    ) -> list[Any]:
+        """Modifies each of `items` and incorporates `parameters`.
+
+        Instances in `items` have `parameters` injected as a single batch.
+
+        Args:
+            items: items created by a constructor that may need to be altered
+                before being returned by the constructor.
+            parameters: keyword arguments to pass or add to each created
+                instance. Defaults to `None`.
+            kwargs: allows subclass to take kwargs.
+
+        Returns:
+            Modified items.
+
+        """
+        return _produce_batch(items, parameters or {})
+
+
+def _produce_batch(
+    items: Iterable[Any], parameters: base.GenericDict
+) -> list[Any]:
+    """Returns `items` with classes instanced and instances injected.
+
+    Args:
+        items: classes and/or instances to modify.
+        parameters: keyword arguments to pass to each class or add to each
+            instance.
+
+    Returns:
+        Instances in the same order as `items`.
+
+    """
+    items = list(items)
+    shared.inject_attributes_many(
+        (i for i in items if not inspect.isclass(i)), parameters
+    )
+    return [
+        shared.instantiate(i, parameters) if inspect.isclass(i) else i
+        for i in items
+    ]
+
+
+# Sentinel for a `_Proxy` target which has not been created yet.
+_MISSING = object()
+
+
+class _Proxy:
+    """Thread-safe stand-in that creates its target on first use.
+
+    Copying or pickling the proxy creates the target and copies or pickles
+    it instead. The proxy's own attributes have a `_wonka_proxy_` prefix, so
+    that attributes of the target with names such as `_target` are not
+    hidden by them.
+
+    Args:
+        factory: callable that creates the target.
+        kind: class of the target, reported as the proxy's `__class__`.
+
+    """
+
+    __slots__ = (
+        "__weakref__",
+        "_wonka_proxy_factory",
+        "_wonka_proxy_kind",
+        "_wonka_proxy_lock",
+        "_wonka_proxy_target",
+    )
+
+    def __init__(self, factory: Callable[[], Any], kind: type[Any]) -> None:
+        object.__setattr__(self, "_wonka_proxy_factory", factory)
+        object.__setattr__(self, "_wonka_proxy_kind", kind)
+        object.__setattr__(self, "_wonka_proxy_lock", threading.Lock())
+        object.__setattr__(self, "_wonka_proxy_target", _MISSING)
+
+    """ Properties """
+
+    @property
+    def __class__(self) -> type[Any]:
+        return object.__getattribute__(self, "_wonka_proxy_kind")
+
+    """ Dunder Methods """
+
+    def __bool__(self) -> bool:
+        return bool(self._wonka_proxy_resolve())
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        return self._wonka_proxy_resolve()(*args, **kwargs)
+
+    def __contains__(self, item: Any) -> bool:
+        return item in self._wonka_proxy_resolve()
+
+    def __copy__(self) -> Any:
+        return copy.copy(self._wonka_proxy_resolve())
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> Any:
+        return copy.deepcopy(self._wonka_proxy_resolve(), memo)
+
+    def __delattr__(self, name: str) -> None:
+        delattr(self._wonka_proxy_resolve(), name)
+
+    def __eq__(self, other: object) -> bool:
+        return self._wonka_proxy_resolve() == other
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._wonka_proxy_resolve(), name)
+
+    def __getitem__(self, key: Any) -> Any:
+        return self._wonka_proxy_resolve()[key]
+
+    def __hash__(self) -> int:
+        return hash(self._wonka_proxy_resolve())
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self._wonka_proxy_resolve())
+
+    def __len__(self) -> int:
+        return len(self._wonka_proxy_resolve())
+
+    def __reduce__(self) -> str | tuple[Any, ...]:
+        return self._wonka_proxy_resolve().__reduce__()
+
+    def __reduce_ex__(self, protocol: SupportsIndex) -> str | tuple[Any, ...]:
+        return self._wonka_proxy_resolve().__reduce_ex__(protocol)
+
+    def __repr__(self) -> str:
+        return repr(self._wonka_proxy_resolve())
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(self._wonka_proxy_resolve(), name, value)
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        self._wonka_proxy_resolve()[key] = value
+
+    def __str__(self) -> str:
+        return str(self._wonka_proxy_resolve())
+
+    """ Private Methods """
+
+    def _wonka_proxy_resolve(self) -> Any:
+        """Returns the target, creating it if it does not exist yet."""
+        target = object.__getattribute__(self, "_wonka_proxy_target")
+        if target is _MISSING:
+            with object.__getattribute__(self, "_wonka_proxy_lock"):
+                target = object.__getattribute__(self, "_wonka_proxy_target")
+                if target is _MISSING:
+                    factory = object.__getattribute__(
+                        self, "_wonka_proxy_factory"
+                    )
+                    target = factory()
+                    object.__setattr__(self, "_wonka_proxy_target", target)
+                    object.__setattr__(self, "_wonka_proxy_factory", None)
+        return target
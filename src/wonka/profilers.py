@@ -0,0 +1,282 @@
+"""Per-stage profiling for construction managers.
+
+Contents:
+    Profile: report of call counts, wall time, CPU time, and allocated memory
+        for each stage of a `base.Manager`, arranged as a tree for nested
+        managers.
+    profile: context manager that profiles every stage of a `base.Manager`
+        (including the stages of nested managers) while it is active.
+
+"""
+
+from __future__ import annotations
+
+import collections
+import contextlib
+import dataclasses
+import threading
+import time
+import tracemalloc
+from collections.abc import Mapping, Sequence
+from typing import TYPE_CHECKING, Any
+
+from . import base, managers, utilities
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Hashable, Iterator
+
+
+@dataclasses.dataclass
+class Profile:
+    """Report of per-stage statistics for a `base.Manager`.
+
+    Args:
+        root: top node of the tree of stages. Its children are the stages of
+            the profiled manager and the children of each stage that is itself
+            a manager are that manager's stages.
+
+    """
+
+    root: _Node
+
+    """ Instance Methods """
+
+    def collapsed(self) -> str:
+        """Returns the profile in collapsed-stack format.
+
+        Each line is a `;`-separated path of stage names followed by the wall
+        time spent in that stage itself (excluding nested stages) in whole
+        microseconds. This is the format read by `flamegraph.pl`, speedscope,
+        and similar tools.
+
+        Returns:
+            Profile in collapsed-stack format.
+
+        """
+        lines = []
+        for path, node in self.root.walk():
+            own = node.wall - sum(c.wall for c in node.children.values())
+            lines.append(f"{';'.join(path)} {max(round(own * 1e6), 0)}")
+        return "\n".join(lines[1:])
+
+    def table(self) -> str:
+        """Returns the profile as a plain text table.
+
+        Nested stages are indented beneath the manager that called them.
+
+        Returns:
+            Table with the calls, wall time, CPU time, and allocated memory for
+                each stage.
+
+        """
+        rows = [("stage", "calls", "wall ms", "cpu ms", "alloc KiB")]
+        for path, node in self.root.walk():
+            if len(path) > 1:
+                rows.append(
+                    (
+                        "  " * (len(path) - 2) + path[-1],
+                        str(node.calls),
+                        f"{node.wall * 1e3:.3f}",
+                        f"{node.cpu * 1e3:.3f}",
+                        f"{node.memory / 1024:.1f}",
+                    )
+                )
+        widths = [max(len(r[i]) for r in rows) for i in range(len(rows[0]))]
+        return "\n".join(
+            "  ".join(
+                c.ljust(w) if i == 0 else c.rjust(w)
+                for i, (c, w) in enumerate(zip(row, widths, strict=True))
+            )
+            for row in rows
+        )
+
+
+@contextlib.contextmanager
+def profile(manager: base.Manager, *, memory: bool = True) -> Iterator[Profile]:
+    """Profiles each stage of `manager` while the context is active.
+
+    The `contents` of `manager` (and of any manager nested in it) is
+    temporarily replaced by a copy in which each constructor is wrapped by a
+    probe that records its statistics. The original `contents`, which is never
+    changed, is restored when the context exits. `contents` must be a sequence
+    or mapping for its stages to be profiled. Each stage has its own node, so
+    a constructor that appears more than once in a sequence is reported
+    separately for each position, with the position appended to its name.
+
+    ```python
+    with wonka.profile(assembler) as report:
+        assembler.manage(item)
+    print(report.table())
+    ```
+
+    Args:
+        manager: manager to profile.
+        memory: whether to measure allocated memory with `tracemalloc`, which
+            noticeably slows construction. Defaults to `True`.
+
+    Yields:
+        Profile that is filled in as `manager` is used.
+
+    """
+    root = _Node(name=utilities._namify(manager))
+    started = memory and not tracemalloc.is_tracing()
+    if started:
+        tracemalloc.start()
+    restore = _attach(manager, parent=root, memory=memory)
+    try:
+        yield Profile(root=root)
+    finally:
+        for undo in reversed(restore):
+            undo()
+        if started:
+            tracemalloc.stop()
+
+
+@dataclasses.dataclass
+class _Node:
+    """Statistics for one stage in a `Profile`.
+
+    Args:
+        name: name of the stage.
+        calls: number of times the stage was called.
+        wall: total wall time, in seconds.
+        cpu: total CPU time of the calling thread, in seconds.
+        memory: net bytes allocated.
+        children: nodes for stages called by this stage, keyed by their
+            position (index or key) in the stage's `contents` and name.
+
+    """
+
+    name: str
+    calls: int = 0
+    wall: float = 0.0
+    cpu: float = 0.0
+    memory: int = 0
+    children: dict[tuple[Hashable, str], _Node] = dataclasses.field(
+        default_factory=dict
+    )
+    lock: threading.Lock = dataclasses.field(
+        default_factory=threading.Lock, repr=False, compare=False
+    )
+
+    """ Instance Methods """
+
+    def child(self, name: str, position: Hashable) -> _Node:
+        """Returns the child node at `position`, creating it if necessary."""
+        with self.lock:
+            return self.children.setdefault((position, name), _Node(name=name))
+
+    def record(self, wall: float, cpu: float, memory: int) -> None:
+        """Adds one call and its measurements to the node."""
+        with self.lock:
+            self.calls += 1
+            self.wall += wall
+            self.cpu += cpu
+            self.memory += memory
+
+    def walk(
+        self, path: tuple[str, ...] = ()
+    ) -> Iterator[tuple[tuple[str, ...], _Node]]:
+        """Yields each node in the tree, depth first, with its path."""
+        path = (*path, self.name)
+        yield path, self
+        for child in self.children.values():
+            yield from child.walk(path)
+
+
+@dataclasses.dataclass
+class _Probe:
+    """Stand-in for a constructor that records statistics for each call.
+
+    Args:
+        constructor: constructor being profiled.
+        node: node in which to record statistics.
+        memory: whether to measure allocated memory.
+
+    """
+
+    constructor: Any
+    node: _Node
+    memory: bool = True
+
+    """ Instance Methods """
+
+    def create(self, item: Any, *args: Any, **kwargs: Any) -> Any:
+        """Calls the wrapped constructor's `create` and records statistics."""
+        traced = self.memory and tracemalloc.is_tracing()
+        before = tracemalloc.get_traced_memory()[0] if traced else 0
+        cpu = time.thread_time()
+        wall = time.perf_counter()
+        try:
+            return self.constructor.create(item, *args, **kwargs)
+        finally:
+            wall = time.perf_counter() - wall
+            cpu = time.thread_time() - cpu
+            after = tracemalloc.get_traced_memory()[0] if traced else 0
+            self.node.record(wall=wall, cpu=cpu, memory=after - before)
+
+    """ Dunder Methods """
+
+    def __getattr__(self, name: str) -> Any:
+        if name == "constructor":
+            raise AttributeError(name)
+        return getattr(self.constructor, name)
+
+
+def _attach(
+    manager: base.Manager, parent: _Node, *, memory: bool
+) -> list[Callable[[], None]]:
+    """Gives `manager` a copy of its `contents` wrapped in `_Probe`s.
+
+    Args:
+        manager: manager whose stages should be profiled.
+        parent: node for `manager`.
+        memory: whether to measure allocated memory.
+
+    Returns:
+        Functions that undo each replacement.
+
+    """
+    contents = manager.contents
+    if isinstance(contents, Mapping):
+        probed = dict(contents)
+        names = {k: utilities._namify(v) for k, v in probed.items()}
+    elif isinstance(contents, Sequence) and not isinstance(contents, str):
+        probed = list(contents)
+        names = dict(enumerate(utilities._namify(v) for v in probed))
+        counts = collections.Counter(names.values())
+        names = {
+            i: f"{n}[{i}]" if counts[n] > 1 else n for i, n in names.items()
+        }
+    else:
+        return []
+    restore = []
+    for key, name in names.items():
+        constructor = probed[key]
+        node = parent.child(name, position=key)
+        if isinstance(constructor, base.Manager):
+            restore.extend(_attach(constructor, parent=node, memory=memory))
+        probed[key] = _Probe(constructor=constructor, node=node, memory=memory)
+    try:
+        manager.contents = probed
+    except AttributeError:
+        return restore
+    _refresh(manager)
+    restore.append(_make_undo(manager, contents=contents))
+    return restore
+
+
+def _make_undo(manager: base.Manager, contents: Any) -> Callable[[], None]:
+    """Returns a function that gives `manager` back its `contents`."""
+
+    def undo() -> None:
+        manager.contents = contents
+        _refresh(manager)
+
+    return undo
+
+
+def _refresh(manager: base.Manager) -> None:
+    """Discards any compiled pipeline cached by `manager`."""
+    if isinstance(manager, managers.Assembler):
+        manager._invalidate()
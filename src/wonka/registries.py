@@ -15,9 +15,79 @@ import abc
 import contextlib
 import copy
 import dataclasses
-from typing import Any, ClassVar
+import types
+import weakref
+from collections.abc import Mapping
+from typing import TYPE_CHECKING, Any, ClassVar
 
-from . import base, options, shared
+from . import base, options, shared, trackers
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable, Iterator, Sequence
+
+# Classes that declare or receive their own `registry`, keyed by qualified class
+# name, so that `trackers.hot_reload` can reuse their registries. Classes are
+# not kept alive by this.
+_ROOTS: weakref.WeakValueDictionary[str, type[Any]] = (
+    weakref.WeakValueDictionary()
+)
+
+
+class _Index(Mapping):
+    """Read-only view of the registries of `AutoRegistrar` roots.
+
+    Roots are held by weak references, so a root and its registry are dropped
+    from the index once nothing else refers to them.
+
+    """
+
+    def __init__(self) -> None:
+        """Starts without any roots."""
+        self._roots: list[weakref.ref[type[Any]]] = []
+
+    """ Properties """
+
+    @property
+    def maps(self) -> list[Mapping[Hashable, Any]]:
+        """Returns the registries of the roots that are alive, in order."""
+        registries = []
+        for reference in self._roots:
+            root = reference()
+            if root is not None:
+                registries.append(vars(root)["registry"])
+        return registries
+
+    """ Dunder Methods """
+
+    def __contains__(self, key: object) -> bool:
+        return any(key in m for m in self.maps)
+
+    def __getitem__(self, key: Hashable) -> Any:
+        for registry in self.maps:
+            with contextlib.suppress(KeyError):
+                return registry[key]
+        raise KeyError(key)
+
+    def __iter__(self) -> Iterator[Hashable]:
+        return iter(dict.fromkeys(k for m in self.maps for k in m))
+
+    def __len__(self) -> int:
+        return len(dict.fromkeys(k for m in self.maps for k in m))
+
+    """ Private Methods """
+
+    def _add(self, root: type[Any]) -> None:
+        """Adds the registry of `root` after those of earlier roots."""
+        self._roots = [r for r in self._roots if r() is not None]
+        self._roots.append(weakref.ref(root))
+
+    def _replace(self, old: type[Any], new: type[Any]) -> None:
+        """Puts the registry of `new` in the place of that of `old`."""
+        for index, reference in enumerate(self._roots):
+            if reference() is old:
+                self._roots[index] = weakref.ref(new)
+                return
+        self._add(new)
 
 
 @dataclasses.dataclass
@@ -30,7 +100,7 @@ class Registrar(base.Factory):
 
     """
 
-    registry: ClassVar[base.GenericDict] = {}
+    registry: ClassVar[base.GenericDict] = trackers.TrackedDict()
 
     """ Class Methods """
 
@@ -55,29 +125,139 @@ class Registrar(base.Factory):
         item = _get_from_registry(item=item, registry=cls.registry)
         return shared.finalize(item=item, parameters=parameters)
 
+    @classmethod
+    def create_columns(
+        cls, item: str, columns: Mapping[str, Sequence[Any]]
+    ) -> list[Any]:
+        """Creates an instance of the class in `registry` for each row.
+
+        The registry lookup is done once for all rows and the created items are
+        finalized by `shared.finalize_columns`. Unless the registered item has
+        a `produce` method without a matching `produce_columns` method, no
+        `dict` is created for each row. This is equivalent to, but usually much
+        faster than, calling `create` with a `parameters` `dict` for each row in
+        `columns`.
+
+        Args:
+            item (Hashable): name corresponding to a key in `registry`.
+            columns: keys are parameter names and values are the arguments for
+                that parameter, one for each instance.
+
+        Raises:
+            KeyError: If a corresponding item in `registry` does not exist for
+                `item.`
+
+        Returns:
+            Created instances in row order.
+
+        """
+        item = _get_from_registry(item=item, registry=cls.registry)
+        return shared.finalize_columns(item=item, columns=columns)
+
+    @classmethod
+    def freeze(cls) -> None:
+        """Replaces `registry` with an immutable copy.
+
+        The copy replaces `registry` on the class that defines it (the class
+        itself or the nearest ancestor that does), so every class sharing that
+        registry sees the frozen copy. A frozen registry may be read safely
+        from many threads without locks. Any later attempt to add, change, or
+        delete an entry raises a `TypeError`, and a module that defines a
+        class with a frozen registry cannot be reloaded with
+        `trackers.hot_reload`. A weak registry remains weak after it is frozen,
+        so entries are still removed when the stored class or instance is
+        collected.
+
+        """
+        owner = next(k for k in cls.__mro__ if "registry" in vars(k))
+        registry = vars(owner)["registry"]
+        if not isinstance(registry, types.MappingProxyType):
+            owner.registry = types.MappingProxyType(copy.copy(registry))
+        return
+
 
 @dataclasses.dataclass
 class AutoRegistrar(Registrar, abc.ABC):
     """Mixin for core package base classes.
 
+    Each direct subclass of `AutoRegistrar` (a root) automatically receives its
+    own registry, which is then shared by all of its descendants. So, unrelated
+    hierarchies do not share a table and their keys cannot collide. A root may
+    still declare its own `registry` class attribute, which is used instead.
+
+    The `registry` of `AutoRegistrar` itself is a read-only index of every
+    root registry. It spans all hierarchies but stores no entries of its own,
+    and it does not keep roots alive. If the same key exists in more than one
+    hierarchy, the earliest defined root takes precedence.
+
+    Subclasses may opt into a weak registry by passing `weak=True` as a class
+    keyword argument. That subclass and all of its descendants then share a new
+    `weakref.WeakValueDictionary` registry, so classes created at runtime are
+    removed from it automatically once nothing else refers to them:
+
+    ```python
+    class Plugin(AutoRegistrar, weak=True):
+        pass
+    ```
+
     Attributes:
         registry: stores classes and/or instances to be used in item
-            construction. Defaults to an empty `dict`.
+            construction. Defaults to a read-only index of the registries of
+            all roots.
 
     """
 
-    registry: ClassVar[base.GenericDict] = {}
+    registry: ClassVar[base.GenericDict] = _Index()
 
     """ Initialization Methods """
 
     @classmethod
-    def __init_subclass__(cls, *args: Any, **kwargs: Any):
-        """Automatically registers subclasses."""
+    def __init_subclass__(cls, *args: Any, weak: bool = False, **kwargs: Any):
+        """Automatically registers subclasses.
+
+        Args:
+            args: positional arguments passed to other `__init_subclass__`
+                methods.
+            weak: whether to give the subclass and its descendants a new weak
+                registry. Defaults to `False`.
+            kwargs: keyword arguments passed to other `__init_subclass__`
+                methods.
+
+        """
         with contextlib.suppress(AttributeError):
             super().__init_subclass__(*args, **kwargs)
-        keyer = options._KEY_NAMER
-        key = keyer(cls)
-        cls.registry[key] = cls
+        is_root = AutoRegistrar in cls.__bases__ and "registry" not in vars(cls)
+        if weak or is_root:
+            cls.registry = (
+                weakref.WeakValueDictionary()
+                if weak
+                else trackers.TrackedDict()
+            )
+        if "registry" in vars(cls):
+            name = f"{cls.__module__}.{cls.__qualname__}"
+            previous = _ROOTS.get(name)
+            index = vars(AutoRegistrar)["registry"]
+            if trackers._is_reloading() and previous is not None:
+                # Entries from the reloaded class replace those of the old one
+                # in its registry when the reload finishes.
+                registry = vars(previous)["registry"]
+                if isinstance(registry, types.MappingProxyType):
+                    raise TypeError(
+                        f"{name} cannot be reloaded because its registry is "
+                        f"frozen"
+                    )
+                registry.update(cls.registry)
+                cls.registry = registry
+                if isinstance(index, _Index):
+                    index._replace(previous, cls)
+            elif isinstance(index, _Index):
+                index._add(cls)
+            _ROOTS[name] = cls
+        if isinstance(cls.registry, types.MappingProxyType):
+            raise TypeError(
+                f"{cls.__name__} cannot be registered in a frozen registry"
+            )
+        cls.registry[options._get_key(cls)] = cls
 
 
 @dataclasses.dataclass
@@ -122,9 +302,8 @@ class Subclasser(base.Factory, abc.ABC):
             Any: created item.
 
         """
-        keyer = options._KEY_NAMER
         all_subclasses = _get_all_subclasses(cls)
-        registry = {keyer(s): s for s in all_subclasses}
+        registry = {options._get_key(s): s for s in all_subclasses}
         item = _get_from_registry(item=item, registry=registry)
         return shared.finalize(item=item, parameters=parameters)
 
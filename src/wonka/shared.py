@@ -3,8 +3,16 @@
 Contents:
     finalize: finalizes construction before returning a value, including calling
         the `produce` method of the passed item.
+    finalize_columns: finalizes construction of an instance of a class for each
+        row of a mapping of parameter names to columns of arguments.
     inject_attributes: adds keys and values of a mapping to a class or instance
         as attributes.
+    inject_attributes_many: adds keys and values of a mapping, or a row of
+        columns, to each of many classes or instances as attributes.
+    instantiate: creates an instance of a class, passing the parameters its
+        constructor accepts and injecting the rest as attributes.
+    instantiate_columns: creates instances of a class from a mapping of
+        parameter names to columns of arguments.
     is_constructor: returns `bool` as to whether an item is a `wonka`-compatible
         constructor.
 
@@ -12,11 +20,35 @@ Contents:
 
 from __future__ import annotations
 
+import dataclasses
 import inspect
-from typing import Any
+import itertools
+import keyword
+import weakref
+from typing import TYPE_CHECKING, Any
 
 from . import base, options
 
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Mapping, Sequence
+
+    _Setter = Callable[[Any, Any], None]
+
+# Generated constructors for `instantiate_columns`, stored by the `tuple` of
+# parameter names. Each constructor takes the class as its first argument, so
+# one is shared by every class.
+_COLUMN_CONSTRUCTORS: dict[tuple[str, ...], Callable[..., list[Any]]] = {}
+# Names of parameters that are not accepted by a class constructor, stored by
+# class and then by the `tuple` of parameter names passed.
+_UNBOUND: weakref.WeakKeyDictionary[
+    type[Any], dict[tuple[str, ...], frozenset[str]]
+] = weakref.WeakKeyDictionary()
+# Compiled setter plans for `inject_attributes_many`, stored by type and then by
+# the `tuple` of attribute names and the overwrite rule.
+_SETTER_PLANS: weakref.WeakKeyDictionary[
+    type[Any], dict[tuple[tuple[str, ...], bool], tuple[_Setter, ...]]
+] = weakref.WeakKeyDictionary()
+
 
 def finalize(
     item: Any,
@@ -46,6 +78,50 @@ def finalize(
         return item if parameters is None else item(**parameters)
 
 
+def finalize_columns(
+    item: Any, columns: Mapping[str, Sequence[Any]]
+) -> list[Any]:
+    """Creates an item for each row in `columns` as `finalize` would.
+
+    If `item` has a `produce_columns` method (as `producers.Instancer` does), it
+    is called once for all rows, unless `produce` is overridden in a subclass of
+    the class that defines `produce_columns`. Otherwise, if `item` has a
+    `produce` method, it is called with a `dict` for each row. If it has
+    neither, `instantiate_columns` is used.
+
+    Args:
+        item: class or instance created by a factory.
+        columns: keys are parameter names and values are the arguments for
+            that parameter, one for each created item.
+
+    Raises:
+        TypeError: if `item` has no `produce` method and is not a class.
+        ValueError: if `columns` is empty or the values of `columns` are not
+            equal in length.
+
+    Returns:
+        Created items in row order.
+
+    """
+    kind = item if inspect.isclass(item) else type(item)
+    produce_columns = getattr(item, "produce_columns", None)
+    produce = getattr(item, "produce", None)
+    if inspect.ismethod(produce_columns) and issubclass(
+        _get_definer(kind, "produce_columns"), _get_definer(kind, "produce")
+    ):
+        return list(produce_columns(item, columns))
+    elif inspect.ismethod(produce):
+        if not columns:
+            raise ValueError("columns must contain at least one parameter")
+        names = tuple(columns)
+        return [
+            produce(item, dict(zip(names, row, strict=True)))
+            for row in zip(*columns.values(), strict=True)
+        ]
+    else:
+        return instantiate_columns(item, columns)
+
+
 def inject_attributes(
     item: Any,
     parameters: base.GenericDict | None = None,
@@ -72,6 +148,131 @@ def inject_attributes(
     return item
 
 
+def inject_attributes_many(
+    items: Iterable[Any],
+    parameters: base.GenericDict | None = None,
+    columns: Mapping[str, Sequence[Any]] | None = None,
+    overwrite: bool | None = None,
+) -> list[Any]:
+    """Adds `parameters` or a row of `columns` to each of `items`.
+
+    For each type in `items`, a setter plan is compiled once for the attribute
+    names and overwrite rule and then reused. The plan drops attributes that
+    the type already defines when `overwrite` is `False` and rejects names that
+    cannot be stored on instances of frozen dataclasses or of classes using
+    `__slots__`. Rejections happen before any item is changed.
+
+    Args:
+        items: classes or instances to have attributes injected.
+        parameters: keyword arguments to add to every item. Defaults to `None`.
+        columns: keys are attribute names and values are the arguments for
+            that attribute, one for each item in `items`. Defaults to `None`.
+        overwrite (Optional[bool]): whether to overwrite existing attributes,
+            if they exist. Defaults to `None`. If the value is `None`, the
+            global `_OVERWRITE` setting will be used.
+
+    Raises:
+        AttributeError: if an attribute name cannot be set on a type in `items`
+            because of `__slots__`.
+        dataclasses.FrozenInstanceError: if an attribute would be set on an
+            instance of a frozen dataclass.
+        ValueError: if both `parameters` and `columns` are passed or the values
+            of `columns` are not equal in length to `items`.
+
+    Returns:
+        Modified items.
+
+    """
+    if parameters and columns:
+        raise ValueError("parameters and columns cannot both be passed")
+    items = list(items)
+    overwrite = options._OVERWRITE if overwrite is None else overwrite
+    if parameters:
+        names = tuple(parameters)
+        rows = itertools.repeat(tuple(parameters.values()))
+    elif columns:
+        names = tuple(columns)
+        rows = zip(*columns.values(), strict=True)
+    else:
+        return items
+    plans = {
+        kind: _get_setter_plan(kind, names, overwrite)
+        for kind in {type(item) for item in items}
+    }
+    for item, row in zip(items, rows, strict=not parameters):
+        for setter, value in zip(plans[type(item)], row, strict=True):
+            setter(item, value)
+    return items
+
+
+def instantiate(item: type[Any], parameters: base.GenericDict) -> Any:
+    """Creates an instance of `item` with `parameters`.
+
+    Parameters accepted by the constructor of `item` are passed to it and the
+    rest are injected into the new instance as attributes. Which parameters
+    are accepted is determined from the signature of `item` once for each set
+    of parameter names and then cached, so no exception is raised and caught
+    when `parameters` mixes both kinds.
+
+    Args:
+        item: class to instance.
+        parameters: keyword arguments to pass or add to the created instance.
+
+    Returns:
+        Created instance.
+
+    """
+    names = tuple(parameters)
+    try:
+        unbound = _UNBOUND[item][names]
+    except KeyError:
+        unbound = _get_unbound(item, names)
+        _UNBOUND.setdefault(item, {})[names] = unbound
+    if not unbound:
+        return item(**parameters)
+    arguments = {k: v for k, v in parameters.items() if k not in unbound}
+    attributes = {k: v for k, v in parameters.items() if k in unbound}
+    return inject_attributes(item(**arguments), attributes)
+
+
+def instantiate_columns(
+    item: type[Any], columns: Mapping[str, Sequence[Any]]
+) -> list[Any]:
+    """Creates an instance of `item` for each row in `columns`.
+
+    No `dict` is created for each row. Instead, a constructor specialized to
+    `item` and the names in `columns` is generated once and reused. Columns may
+    be any equal-length iterables, such as `list`, `array.array`, or 1-d
+    `memoryview` objects.
+
+    Args:
+        item: class to instance.
+        columns: keys are parameter names and values are the arguments for
+            that parameter, one for each instance.
+
+    Raises:
+        TypeError: if `item` is not a class.
+        ValueError: if `columns` is empty, the values of `columns` are not equal
+            in length, or a key in `columns` is not a valid parameter name.
+
+    Returns:
+        Created instances in row order.
+
+    """
+    if not inspect.isclass(item):
+        raise TypeError(f"{item} must be a class to instantiate columns")
+    if not columns:
+        raise ValueError("columns must contain at least one parameter")
+    names = tuple(columns)
+    try:
+        constructor = _COLUMN_CONSTRUCTORS[names]
+    except KeyError:
+        constructor = _COLUMN_CONSTRUCTORS[names] = _make_column_constructor(
+            names
+        )
+    return constructor(item, *columns.values())
+
+
 def is_constructor(item: Any) -> bool:
     """Returns if `item` is a wonka-compatible constructor.
 
@@ -95,3 +296,151 @@ def is_constructor(item: Any) -> bool:
         ) or isinstance(item, base.Manager | base.Factory)
     else:
         return hasattr(item, "create") and inspect.ismethod(item.create)
+
+
+def _get_definer(kind: type[Any], name: str) -> type[Any]:
+    """Returns the class in the MRO of `kind` that defines `name`.
+
+    Args:
+        kind: class to search.
+        name: name of the attribute.
+
+    Returns:
+        First class in the MRO of `kind` with `name` in its namespace, or
+            `object` if there is none.
+
+    """
+    return next((k for k in kind.__mro__ if name in vars(k)), object)
+
+
+def _get_unbound(item: type[Any], names: tuple[str, ...]) -> frozenset[str]:
+    """Returns which of `names` the constructor of `item` does not accept.
+
+    Args:
+        item: class to examine.
+        names: parameter names to be passed when instancing `item`.
+
+    Returns:
+        Names which must be injected as attributes instead of passed.
+
+    """
+    try:
+        signature = inspect.signature(item)
+    except (TypeError, ValueError):
+        return frozenset()
+    accepted = set()
+    for parameter in signature.parameters.values():
+        if parameter.kind is parameter.VAR_KEYWORD:
+            return frozenset()
+        elif parameter.kind is not parameter.POSITIONAL_ONLY:
+            accepted.add(parameter.name)
+    return frozenset(names).difference(accepted)
+
+
+def _get_setter_plan(
+    kind: type[Any], names: tuple[str, ...], overwrite: bool
+) -> tuple[_Setter, ...]:
+    """Returns a cached setter for each of `names` on instances of `kind`.
+
+    Args:
+        kind: type of the items that will have attributes injected.
+        names: attribute names, in the order their values will be passed.
+        overwrite: whether to overwrite existing attributes.
+
+    Raises:
+        AttributeError: if one of `names` cannot be set on instances of `kind`
+            because of `__slots__`.
+        dataclasses.FrozenInstanceError: if one of `names` would be set on
+            instances of `kind` and `kind` is a frozen dataclass.
+
+    Returns:
+        Functions taking an item and a value, one for each of `names`.
+
+    """
+    key = (names, overwrite)
+    try:
+        return _SETTER_PLANS[kind][key]
+    except KeyError:
+        pass
+    frozen = dataclasses.is_dataclass(kind) and kind.__dataclass_params__.frozen
+    # Every instance of a frozen dataclass already has each of its fields.
+    fields = {f.name for f in dataclasses.fields(kind)} if frozen else set()
+    has_dict = kind.__dictoffset__ != 0
+    plan = []
+    for name in names:
+        attribute = inspect.getattr_static(kind, name, None)
+        if not has_dict and not inspect.isdatadescriptor(attribute):
+            raise AttributeError(f"{name} cannot be set on {kind.__name__}")
+        if not overwrite and (
+            name in fields
+            or (hasattr(kind, name) and not inspect.isdatadescriptor(attribute))
+        ):
+            setter = _skip
+        elif frozen:
+            raise dataclasses.FrozenInstanceError(
+                f"cannot assign to field {name!r} of {kind.__name__}"
+            )
+        elif overwrite:
+            setter = _make_setter(name)
+        else:
+            setter = _make_guarded_setter(name)
+        plan.append(setter)
+    plan = tuple(plan)
+    _SETTER_PLANS.setdefault(kind, {})[key] = plan
+    return plan
+
+
+def _make_guarded_setter(name: str) -> _Setter:
+    """Returns a setter for `name` that skips items that already have it."""
+
+    def setter(item: Any, value: Any) -> None:
+        if not hasattr(item, name):
+            setattr(item, name, value)
+
+    return setter
+
+
+def _make_setter(name: str) -> _Setter:
+    """Returns a setter for `name` that always sets the value."""
+
+    def setter(item: Any, value: Any) -> None:
+        setattr(item, name, value)
+
+    return setter
+
+
+def _skip(item: Any, value: Any) -> None:
+    """Setter for an attribute that is never overwritten."""
+
+
+def _make_column_constructor(
+    names: tuple[str, ...],
+) -> Callable[..., list[Any]]:
+    """Returns a generated function that instances a class from columns.
+
+    Args:
+        names: parameter names, in the order the columns will be passed.
+
+    Raises:
+        ValueError: if any of `names` is not a valid parameter name.
+
+    Returns:
+        Function taking a class followed by one column for each of `names`.
+
+    """
+    for name in names:
+        if not name.isidentifier() or keyword.iskeyword(name):
+            raise ValueError(f"{name} is not a valid parameter name")
+    columns = "".join(f", c{i}" for i in range(len(names)))
+    values = "".join(f"v{i}, " for i in range(len(names)))
+    arguments = ", ".join(f"{n}=v{i}" for i, n in enumerate(names))
+    source = (
+        f"def construct(cls{columns}):\n"
+        f"    return [\n"
+        f"        cls({arguments})\n"
+        f"        for {values}in zip({columns[2:]}, strict=True)\n"
+        f"    ]\n"
+    )
+    namespace: dict[str, Any] = {}
+    exec(source, namespace)  # noqa: S102
+    return namespace["construct"]
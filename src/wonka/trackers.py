@@ -0,0 +1,400 @@
+"""Containers that record when they change.
+
+Contents:
+    TrackedDict (`dict`): `dict` with a `generation` that changes with every
+        mutation.
+    TrackedList (`list`): `list` with a `generation` that changes with every
+        mutation.
+    generation: returns the latest generation of one or more containers.
+    hot_reload: reloads modules, replacing the entries they register in
+        `TrackedDict` registries all at once.
+
+Every generation is drawn from a single counter shared by all tracked
+containers. So, a cache that records the generation of the containers it was
+built from only needs to compare one integer per container to know whether it
+is stale, and the largest generation of several containers increases whenever
+any of them changes.
+
+"""
+
+from __future__ import annotations
+
+import functools
+import importlib
+import itertools
+import threading
+from typing import TYPE_CHECKING, Any, Self
+
+if TYPE_CHECKING:
+    import types
+    from collections.abc import Hashable, Iterable, Iterator
+
+
+# Source of every generation, shared by all tracked containers.
+_GENERATIONS = itertools.count(1)
+# Per-thread staged copies of the `TrackedDict`s written while `hot_reload` is
+# running, keyed by the id of each `TrackedDict`.
+_STAGED = threading.local()
+
+
+class TrackedDict(dict):
+    """`dict` with a `generation` that changes with every mutation.
+
+    Reads are as fast as a plain `dict`. Every method that changes the `dict`
+    assigns a new, larger `generation`.
+
+    While `hot_reload` is running in the current thread, every change to a
+    `TrackedDict` is made to a staged copy instead, which replaces its contents
+    after the reload. Reads in that thread see the staged copy, and reads in
+    other threads see the original contents until then.
+
+    Attributes:
+        generation: number that increases whenever the `dict` changes.
+
+    """
+
+    __slots__ = ("generation",)
+
+    """ Initialization Methods """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Stores the items passed, like `dict`, and starts a generation."""
+        super().__init__(*args, **kwargs)
+        self.generation = next(_GENERATIONS)
+
+    """ Instance Methods """
+
+    def clear(self) -> None:
+        """Removes every item."""
+        staged = _stage(self)
+        if staged is None:
+            super().clear()
+        else:
+            staged.clear()
+        self.generation = next(_GENERATIONS)
+
+    def pop(self, *args: Any) -> Any:
+        """Removes and returns the value for a key, like `dict.pop`."""
+        staged = _stage(self)
+        value = super().pop(*args) if staged is None else staged.pop(*args)
+        self.generation = next(_GENERATIONS)
+        return value
+
+    def popitem(self) -> tuple[Hashable, Any]:
+        """Removes and returns the last inserted item."""
+        staged = _stage(self)
+        item = super().popitem() if staged is None else staged.popitem()
+        self.generation = next(_GENERATIONS)
+        return item
+
+    def setdefault(self, key: Hashable, default: Any = None) -> Any:
+        """Returns the value for `key`, first setting it to `default`."""
+        if key in self:
+            return self[key]
+        self[key] = default
+        return default
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        """Sets the items passed, like `dict.update`."""
+        staged = _stage(self)
+        if staged is None:
+            super().update(*args, **kwargs)
+        else:
+            staged.update(*args, **kwargs)
+        self.generation = next(_GENERATIONS)
+
+    """ Private Methods """
+
+    def _replace(self, entries: dict[Hashable, Any]) -> None:
+        """Replaces the contents with `entries`.
+
+        New and changed items are written in one step before items missing
+        from `entries` are removed.
+
+        """
+        dict.update(self, entries)
+        for key in [k for k in dict.keys(self) if k not in entries]:
+            dict.__delitem__(self, key)
+        self.generation = next(_GENERATIONS)
+
+    """ Dunder Methods """
+
+    def __delitem__(self, key: Hashable) -> None:
+        staged = _stage(self)
+        if staged is None:
+            super().__delitem__(key)
+        else:
+            del staged[key]
+        self.generation = next(_GENERATIONS)
+
+    def __ior__(self, other: Any) -> Self:
+        self.update(other)
+        return self
+
+    def __setitem__(self, key: Hashable, value: Any) -> None:
+        staged = _stage(self)
+        if staged is None:
+            super().__setitem__(key, value)
+        else:
+            staged[key] = value
+        self.generation = next(_GENERATIONS)
+
+
+class _Staging:
+    """Mixin that reads a `TrackedDict` from its staged copy.
+
+    While `hot_reload` stages changes to a `TrackedDict`, the class of the
+    `TrackedDict` is swapped for a subclass with this mixin, so that reads in
+    the reloading thread see the staged copy. Reads in other threads, and
+    reads of every `TrackedDict` that is not being staged, are unaffected.
+
+    """
+
+    __slots__ = ()
+
+    """ Instance Methods """
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Returns the value for `key` or `default`."""
+        return dict.get(_view(self), key, default)
+
+    def items(self) -> Any:
+        """Returns a view of the items."""
+        return dict.items(_view(self))
+
+    def keys(self) -> Any:
+        """Returns a view of the keys."""
+        return dict.keys(_view(self))
+
+    def values(self) -> Any:
+        """Returns a view of the values."""
+        return dict.values(_view(self))
+
+    """ Dunder Methods """
+
+    def __contains__(self, key: object) -> bool:
+        return dict.__contains__(_view(self), key)
+
+    def __getitem__(self, key: Hashable) -> Any:
+        return dict.__getitem__(_view(self), key)
+
+    def __iter__(self) -> Iterator[Hashable]:
+        return dict.__iter__(_view(self))
+
+    def __len__(self) -> int:
+        return dict.__len__(_view(self))
+
+
+class TrackedList(list):
+    """`list` with a `generation` that changes with every mutation.
+
+    Reads are as fast as a plain `list`. Every method that changes the `list`
+    assigns a new, larger `generation`.
+
+    Attributes:
+        generation: number that increases whenever the `list` changes.
+
+    """
+
+    __slots__ = ("generation",)
+
+    """ Initialization Methods """
+
+    def __init__(self, *args: Any) -> None:
+        """Stores the items passed, like `list`, and starts a generation."""
+        super().__init__(*args)
+        self.generation = next(_GENERATIONS)
+
+    """ Instance Methods """
+
+    def append(self, item: Any) -> None:
+        """Adds `item` to the end."""
+        super().append(item)
+        self.generation = next(_GENERATIONS)
+
+    def clear(self) -> None:
+        """Removes every item."""
+        super().clear()
+        self.generation = next(_GENERATIONS)
+
+    def extend(self, items: Iterable[Any]) -> None:
+        """Adds each of `items` to the end."""
+        super().extend(items)
+        self.generation = next(_GENERATIONS)
+
+    def insert(self, index: int, item: Any) -> None:
+        """Adds `item` before `index`."""
+        super().insert(index, item)
+        self.generation = next(_GENERATIONS)
+
+    def pop(self, index: int = -1) -> Any:
+        """Removes and returns the item at `index`."""
+        item = super().pop(index)
+        self.generation = next(_GENERATIONS)
+        return item
+
+    def remove(self, item: Any) -> None:
+        """Removes the first occurrence of `item`."""
+        super().remove(item)
+        self.generation = next(_GENERATIONS)
+
+    def reverse(self) -> None:
+        """Reverses the items in place."""
+        super().reverse()
+        self.generation = next(_GENERATIONS)
+
+    def sort(self, *args: Any, **kwargs: Any) -> None:
+        """Sorts the items in place, like `list.sort`."""
+        super().sort(*args, **kwargs)
+        self.generation = next(_GENERATIONS)
+
+    """ Dunder Methods """
+
+    def __delitem__(self, index: Any) -> None:
+        super().__delitem__(index)
+        self.generation = next(_GENERATIONS)
+
+    def __iadd__(self, other: Iterable[Any]) -> Self:
+        result = super().__iadd__(other)
+        self.generation = next(_GENERATIONS)
+        return result
+
+    def __imul__(self, other: int) -> Self:
+        result = super().__imul__(other)
+        self.generation = next(_GENERATIONS)
+        return result
+
+    def __setitem__(self, index: Any, value: Any) -> None:
+        super().__setitem__(index, value)
+        self.generation = next(_GENERATIONS)
+
+
+def generation(*containers: Any) -> int:
+    """Returns the latest generation of `containers`.
+
+    Args:
+        containers: containers to check. Containers that are not tracked have
+            a generation of 0.
+
+    Returns:
+        Largest generation of `containers`.
+
+    """
+    return max((getattr(c, "generation", 0) for c in containers), default=0)
+
+
+def hot_reload(*modules: types.ModuleType) -> list[types.ModuleType]:
+    """Reloads `modules` and then replaces their registry entries at once.
+
+    Every change that the reloaded modules make to a `TrackedDict` (such as a
+    registry filled by `AutoRegistrar` subclasses) is made to a staged copy
+    until all of `modules` have been reloaded. The reloaded modules see their
+    own changes, but other threads do not. Then each `TrackedDict` is updated
+    in one step, so other threads never see a mix of old and new entries
+    (items that were removed are dropped just after). If a module fails to
+    reload, no changes are made.
+
+    Args:
+        modules: modules to reload.
+
+    Raises:
+        TypeError: if a reloaded module defines an `AutoRegistrar` root
+            whose registry was frozen with `Registrar.freeze`.
+
+    Returns:
+        Reloaded modules.
+
+    """
+    entries: dict[int, tuple[TrackedDict, dict[Hashable, Any], type]] = {}
+    _STAGED.entries = entries
+    try:
+        reloaded = [importlib.reload(m) for m in modules]
+    except BaseException:
+        for container, _, kind in entries.values():
+            container.__class__ = kind
+            container.generation = next(_GENERATIONS)
+        raise
+    finally:
+        _STAGED.entries = None
+    for container, staged, kind in entries.values():
+        container.__class__ = kind
+        container._replace(staged)
+    return reloaded
+
+
+def _is_reloading() -> bool:
+    """Returns whether `hot_reload` is running in the current thread."""
+    return getattr(_STAGED, "entries", None) is not None
+
+
+def _next_generation() -> int:
+    """Returns a generation larger than any that has been assigned."""
+    return next(_GENERATIONS)
+
+
+def _stamp(*containers: Any) -> tuple[int, ...]:
+    """Returns a value that changes when any of `containers` changes.
+
+    Replacing or resizing a container changes the value whether or not it is
+    tracked, but changing an item of a container in place only does so if the
+    container is tracked.
+
+    Args:
+        containers: containers to check.
+
+    Returns:
+        Identity, length, and generation of each of `containers`.
+
+    """
+    return tuple(
+        part
+        for c in containers
+        for part in (id(c), len(c), getattr(c, "generation", 0))
+    )
+
+
+def _stage(container: TrackedDict) -> dict[Hashable, Any] | None:
+    """Returns the staged copy of `container`, if `hot_reload` is running.
+
+    The first call for `container` during a reload copies its contents and
+    swaps its class for one that reads from the copy in the reloading thread.
+
+    Args:
+        container: `TrackedDict` about to be changed.
+
+    Returns:
+        Staged copy to change instead of `container`, or `None` if
+            `hot_reload` is not running in the current thread.
+
+    """
+    entries = getattr(_STAGED, "entries", None)
+    if entries is None:
+        return None
+    try:
+        return entries[id(container)][1]
+    except KeyError:
+        kind = type(container)
+        staged = dict(dict.items(container))
+        entries[id(container)] = (container, staged, kind)
+        container.__class__ = _get_staging_class(kind)
+        return staged
+
+
+@functools.cache
+def _get_staging_class(kind: type[TrackedDict]) -> type[TrackedDict]:
+    """Returns a subclass of `kind` that reads from staged copies."""
+    return type(kind.__name__, (_Staging, kind), {"__slots__": ()})
+
+
+def _view(container: TrackedDict) -> dict[Hashable, Any]:
+    """Returns the staged copy of `container` or `container` itself.
+
+    The staged copy is only returned in the thread that is reloading.
+
+    """
+    entries = getattr(_STAGED, "entries", None)
+    if entries is not None:
+        found = entries.get(id(container))
+        if found is not None:
+            return found[1]
+    return container
@@ -0,0 +1,95 @@
+""" Tests wonka persistent caches. """
+
+from __future__ import annotations
+import dataclasses
+import os
+import subprocess
+import sys
+import time
+from typing import Any, ClassVar
+
+import wonka
+
+
+@dataclasses.dataclass
+class Parsed(wonka.Cacher, wonka.Delegate):
+
+    contents: dict[str, Any] = dataclasses.field(default_factory = dict)
+    builds: ClassVar[int] = 0
+
+    @classmethod
+    def from_dict(cls, item: dict[str, Any]) -> Parsed:
+        cls.builds += 1
+        return cls(contents = dict(item))
+
+
+def test_cacher(tmp_path):
+    Parsed.builds = 0
+    Parsed.cache = wonka.DiskCache(tmp_path / 'cache')
+    try:
+        first = Parsed.create({'tree': 'house'})
+        second = Parsed.create({'tree': 'house'})
+        assert first == second == Parsed(contents = {'tree': 'house'})
+        assert Parsed.builds == 1
+        Parsed.create({'ghost': 'town'})
+        assert Parsed.builds == 2
+        # A new cache on the same folder is shared, as by another process.
+        Parsed.cache = wonka.DiskCache(tmp_path / 'cache')
+        Parsed.create({'tree': 'house'})
+        assert Parsed.builds == 2
+    finally:
+        Parsed.cache = None
+    return
+
+def test_disk_cache_eviction(tmp_path):
+    cache = wonka.DiskCache(tmp_path, max_bytes = 600)
+    keys = [cache.key(Parsed, str(i)) for i in range(5)]
+    assert len(set(keys)) == 5
+    assert cache.key(Parsed, 'x', {'a': 1}) != cache.key(Parsed, 'x')
+    for key in keys:
+        cache.set(key, 'x' * 200)
+        time.sleep(0.01)
+    found = [cache.get(key)[0] for key in keys]
+    assert found[-1] and not found[0]
+    assert sum(p.stat().st_size for p in tmp_path.glob('*.cache')) <= 600
+    assert cache.get(keys[-1]) == (True, 'x' * 200)
+    cache.clear()
+    assert cache.get(keys[-1]) == (False, None)
+    return
+
+def test_disk_cache_robustness(tmp_path):
+    script = (
+        'import wonka; '
+        'print(wonka.DiskCache(%r).key(wonka.Delegate, {"a", "b", "c"}, '
+        '{"tags": frozenset({"x", "y", "z"})}))' % str(tmp_path))
+    keys = {
+        subprocess.run(
+            [sys.executable, '-c', script],
+            capture_output = True,
+            check = True,
+            env = {
+                **os.environ,
+                'PYTHONHASHSEED': seed,
+                'PYTHONPATH': os.path.dirname(os.path.dirname(wonka.__file__))},
+            text = True).stdout
+        for seed in ('1', '2', '3')}
+    assert len(keys) == 1
+    cache = wonka.DiskCache(tmp_path)
+    key = cache.key(Parsed, 'truncated')
+    cache.set(key, list(range(100)))
+    path = cache._get_path(key)
+    path.write_bytes(path.read_bytes()[:10])
+    assert cache.get(key) == (False, None)
+    cache = wonka.DiskCache(tmp_path / 'sized')
+    cache.set(key, 'x' * 100)
+    cache.set(key, 'x' * 100)
+    assert cache._size == cache._get_path(key).stat().st_size
+    return
+
+
+if __name__ == '__main__':
+    import pathlib
+    import tempfile
+    test_cacher(pathlib.Path(tempfile.mkdtemp()))
+    test_disk_cache_eviction(pathlib.Path(tempfile.mkdtemp()))
+    test_disk_cache_robustness(pathlib.Path(tempfile.mkdtemp()))
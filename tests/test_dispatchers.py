@@ -1,13 +1,21 @@
 """ Tests wonka dispatcher factories. """
 
 from __future__ import annotations
+import array
 from collections.abc import MutableMapping
 import dataclasses
+import types
 from typing import Any, ClassVar
 
+import pytest
+
 import wonka
 
 
+class Routed_Base:
+    pass
+
+
 @dataclasses.dataclass
 class Settings(wonka.Delegate):
 
@@ -29,6 +37,247 @@ class Configuration(wonka.Sourcerer):
         return cls(contents = item)
 
 
+@dataclasses.dataclass
+class Frozen_Configuration(wonka.Sourcerer):
+
+    contents: dict[str, Any] = dataclasses.field(default_factory = dict)
+    sources: ClassVar[dict[str, Any]] = {MutableMapping: 'dictionary'}
+
+    @classmethod
+    def from_dictionary(cls, item: dict[str, Any]) -> Frozen_Configuration:
+        return cls(contents = item)
+
+
+@dataclasses.dataclass
+class Batch_Settings(wonka.Delegate):
+
+    contents: Any = None
+    batches: ClassVar[list[int]] = []
+
+    @classmethod
+    def from_dict(cls, item: dict[str, Any]) -> Batch_Settings:
+        return cls(contents = item)
+
+    @classmethod
+    def from_list_batch(cls, items: list[list[Any]]) -> list[Batch_Settings]:
+        cls.batches.append(len(items))
+        return [cls(contents = tuple(item)) for item in items]
+
+
+@dataclasses.dataclass
+class Batch_Configuration(wonka.Flexer, wonka.Sourcerer):
+
+    contents: Any = None
+    sources: ClassVar[dict[str, Any]] = {
+        MutableMapping: 'dictionary', list: 'sequence'}
+    produced: ClassVar[list[int]] = []
+
+    @classmethod
+    def from_dictionary(cls, item: dict[str, Any]) -> Batch_Configuration:
+        return cls(contents = item)
+
+    @classmethod
+    def from_sequence_batch(
+        cls, items: list[list[Any]]) -> list[Batch_Configuration]:
+        return [cls(contents = len(item)) for item in items]
+
+    @classmethod
+    def produce_many(
+        cls,
+        items: list[Any],
+        parameters: dict[str, Any] | None = None) -> list[Any]:
+        cls.produced.append(len(items))
+        return super().produce_many(items, parameters)
+
+
+@dataclasses.dataclass
+class Tagged_Configuration(Batch_Configuration):
+
+    @classmethod
+    def produce(
+        cls,
+        item: Any,
+        parameters: dict[str, Any] | None = None,
+        **kwargs: Any) -> Any:
+        item = super().produce(item, parameters, **kwargs)
+        item.tagged = True
+        return item
+
+
+def alpha() -> None:
+    pass
+
+
+def beta() -> None:
+    pass
+
+
+def make_named() -> type[wonka.Delegate]:
+
+    class Named(wonka.Delegate):
+
+        @classmethod
+        def from_alpha(cls, item: Any) -> str:
+            return 'alpha'
+
+        @classmethod
+        def from_beta(cls, item: Any) -> str:
+            return 'beta'
+
+        @classmethod
+        def from_array(cls, item: Any) -> str:
+            return 'array'
+
+        @classmethod
+        def from_dataclasses(cls, item: Any) -> str:
+            return 'dataclasses'
+
+    return Named
+
+
+@dataclasses.dataclass
+class Shape(wonka.Arbiter):
+
+    contents: Any = None
+    rules: ClassVar[list[tuple[wonka.Rule, str]]] = [
+        (wonka.Rule(kind = dict, keys = frozenset({'radius'})), 'circle'),
+        (wonka.Rule(kind = list, length = (3, 3)), 'triangle'),
+        (wonka.Rule(kind = list, length = (4, 4)), 'square'),
+        (wonka.Rule(kind = list), 'polygon')]
+    reorder_every: ClassVar[int] = 4
+
+    @classmethod
+    def from_circle(cls, item: dict[str, Any]) -> Shape:
+        return cls(contents = 'circle')
+
+    @classmethod
+    def from_triangle(cls, item: list[Any]) -> Shape:
+        return cls(contents = 'triangle')
+
+    @classmethod
+    def from_square(cls, item: list[Any]) -> Shape:
+        return cls(contents = 'square')
+
+    @classmethod
+    def from_polygon(cls, item: list[Any]) -> Shape:
+        return cls(contents = 'polygon')
+
+
+class Kind_Arbiter(wonka.Arbiter):
+
+    rules: ClassVar[list[tuple[wonka.Rule, str]]] = [
+        (wonka.Rule(kind = type), 'klass'),
+        (wonka.Rule(kind = Routed_Base), 'base')]
+
+    @classmethod
+    def from_klass(cls, item: type[Any]) -> str:
+        return 'klass'
+
+    @classmethod
+    def from_base(cls, item: Routed_Base) -> str:
+        return 'base'
+
+
+@dataclasses.dataclass
+class Signal(wonka.Sourcerer):
+
+    contents: Any = None
+    sources: ClassVar[dict[Any, str]] = {bytes: 'raw'}
+    layouts: ClassVar[dict[wonka.Layout, str]] = {
+        wonka.Layout(format = 'd', ndim = 1): 'doubles',
+        wonka.Layout(itemsize = 4): 'words'}
+
+    @classmethod
+    def from_doubles(cls, item: memoryview) -> Signal:
+        return cls(contents = item)
+
+    @classmethod
+    def from_words(cls, item: memoryview) -> Signal:
+        return cls(contents = item)
+
+    @classmethod
+    def from_raw(cls, item: bytes) -> Signal:
+        return cls(contents = item)
+
+
+@dataclasses.dataclass
+class Compiled_Settings(wonka.Flexer, wonka.Delegate):
+
+    contents: Any = None
+
+    @classmethod
+    def from_dict(cls, item: dict[str, Any]) -> Compiled_Settings:
+        return cls(contents = item)
+
+    @classmethod
+    def from_list(cls, item: list[Any]) -> Compiled_Settings:
+        return cls(contents = tuple(item))
+
+
+@dataclasses.dataclass
+class Compiled_Configuration(wonka.Sourcerer):
+
+    contents: Any = None
+    sources: ClassVar[dict[Any, str]] = {MutableMapping: 'dictionary'}
+
+    @classmethod
+    def from_dictionary(cls, item: dict[str, Any]) -> Compiled_Configuration:
+        return cls(contents = item)
+
+    @classmethod
+    def from_sequence(cls, item: list[Any]) -> Compiled_Configuration:
+        return cls(contents = len(item))
+
+
+@dataclasses.dataclass
+class Counted_Settings(Compiled_Settings):
+
+    calls: ClassVar[list[Any]] = []
+
+    @classmethod
+    def create(
+        cls,
+        item: Any,
+        parameters: dict[str, Any] | None = None,
+        **kwargs: Any) -> Counted_Settings:
+        cls.calls.append(item)
+        return super().create(item, parameters, **kwargs)
+
+
+@dataclasses.dataclass
+class Cached_Settings(wonka.Cacher, Compiled_Settings):
+    pass
+
+
+def make_router() -> type[wonka.Sourcerer]:
+
+    class Router(wonka.Sourcerer):
+
+        sources: ClassVar[dict[Any, str]] = {
+            type: 'klass',
+            Routed_Base: 'base',
+            object: 'anything',
+            int: 'integer'}
+
+        @classmethod
+        def from_klass(cls, item: type[Any]) -> str:
+            return 'klass'
+
+        @classmethod
+        def from_base(cls, item: Routed_Base) -> str:
+            return 'base'
+
+        @classmethod
+        def from_anything(cls, item: Any) -> str:
+            return 'anything'
+
+        @classmethod
+        def from_integer(cls, item: int) -> str:
+            return 'integer'
+
+    return Router
+
+
 def test_delegate():
     contents = {'tree': 'house', 'ghost': 'town'}
     settings = Settings.create(contents)
@@ -47,6 +296,162 @@ def test_sourcerer():
     return
 
 
+def test_sourcerer_freeze():
+    Frozen_Configuration.freeze()
+    for _ in range(2):
+        configuration = Frozen_Configuration.create({'tree': 'house'})
+        assert configuration.contents['tree'] == 'house'
+    with pytest.raises(TypeError):
+        Frozen_Configuration.sources[list] = 'list'
+    # Frozen dispatch finds the same builder as the first match in `sources`.
+    items = [5, Routed_Base, Routed_Base(), Routed_Base, 5]
+    expected = ['anything', 'klass', 'base', 'klass', 'anything']
+    assert [make_router().create(i) for i in items] == expected
+    router = make_router()
+    router.freeze()
+    assert [router.create(i) for i in items] == expected
+    assert router.create_many(items) == expected
+    return
+
+
+def test_create_many():
+    Batch_Settings.batches.clear()
+    Batch_Configuration.produced.clear()
+    items = [{'a': 1}, [1, 2], {'b': 2}, [3]]
+    settings = Batch_Settings.create_many(items)
+    assert [s.contents for s in settings] == [
+        {'a': 1}, (1, 2), {'b': 2}, (3,)]
+    assert Batch_Settings.batches == [2]
+    configurations = Batch_Configuration.create_many(
+        items, parameters = {'extra': True})
+    assert [c.contents for c in configurations] == [{'a': 1}, 2, {'b': 2}, 1]
+    assert all(c.extra for c in configurations)
+    assert Batch_Configuration.produced == [2, 2]
+    items = [Routed_Base, Routed_Base(), 5]
+    assert make_router().create_many(items) == ['klass', 'base', 'anything']
+    # Functions are named individually rather than by their type.
+    assert make_named().create_many([alpha, beta]) == ['alpha', 'beta']
+    # An overridden produce is not skipped by the batch path.
+    tagged = Tagged_Configuration.create_many([{'a': 1}, {'b': 2}])
+    assert all(c.tagged for c in tagged)
+    with pytest.raises(KeyError):
+        Batch_Configuration.create_many([1.5])
+    return
+
+
+def test_arbiter():
+    assert Shape.create({'radius': 1}).contents == 'circle'
+    for _ in range(8):
+        assert Shape.create([1, 2, 3, 4]).contents == 'square'
+    # The square rule is moved ahead of the triangle rule, which can never
+    # match the same items.
+    assert Shape._decisions.find([1, 2, 3, 4]) == 'from_square'
+    assert Shape._decisions.tables[False][list][0] == 2
+    assert Shape.create([1, 2, 3]).contents == 'triangle'
+    assert Shape.create([1]).contents == 'polygon'
+    with pytest.raises(KeyError):
+        Shape.create({'side': 1})
+    # A class and an instance of it are routed independently of which is
+    # seen first.
+    for items in ([Routed_Base, Routed_Base()], [Routed_Base(), Routed_Base]):
+        Kind_Arbiter.compile()
+        results = [Kind_Arbiter.create(i) for i in items]
+        assert results == [
+            'klass' if isinstance(i, type) else 'base' for i in items]
+    rule = wonka.Rule(attributes = {'real': 2})
+    assert rule.matches(2) and not rule.matches(3)
+    assert not rule.overlaps(wonka.Rule(attributes = {'real': 3}))
+    return
+
+
+def test_sourcerer_layouts():
+    samples = array.array('d', [1.0, 2.0])
+    signal = Signal.create(samples)
+    assert isinstance(signal.contents, memoryview)
+    assert signal.contents.obj is samples
+    signal.contents[0] = 5.0
+    assert samples[0] == 5.0
+    words = Signal.create(array.array('i', [1, 2]))
+    assert words.contents.format == 'i'
+    assert Signal.create(b'abc').contents == b'abc'
+
+    class Frozen_Signal(Signal):
+        pass
+
+    Frozen_Signal.freeze()
+    created = Frozen_Signal.create_many([samples, b'abc', samples])
+    assert created[0].contents.obj is samples
+    assert created[1].contents == b'abc'
+    with pytest.raises(TypeError):
+        Frozen_Signal.layouts[wonka.Layout()] = 'raw'
+    assert not isinstance(Signal.layouts, types.MappingProxyType)
+    return
+
+
+def test_compile():
+    Compiled_Settings.compile()
+    assert Compiled_Settings.create({'a': 1}).contents == {'a': 1}
+    assert Compiled_Settings.create([1, 2]).contents == (1, 2)
+    created = Compiled_Settings.create([1], parameters = {'extra': True})
+    assert created.extra
+    Compiled_Configuration.compile()
+    assert Compiled_Configuration.create({'a': 1}).contents == {'a': 1}
+    with pytest.raises(KeyError):
+        Compiled_Configuration.create([1, 2])
+    # Adding a source regenerates the compiled code on the next call.
+    Compiled_Configuration.sources[list] = 'sequence'
+    original = Compiled_Configuration.from_sequence
+    try:
+        assert Compiled_Configuration.create([1, 2]).contents == 2
+        # Replaced builder methods are called without recompiling.
+        Compiled_Configuration.from_sequence = classmethod(
+            lambda cls, item: cls(contents = 'replaced'))
+        assert Compiled_Configuration.create([1]).contents == 'replaced'
+    finally:
+        Compiled_Configuration.from_sequence = original
+        del Compiled_Configuration.sources[list]
+    return
+
+
+def test_compile_subclass():
+    Counted_Settings.calls.clear()
+    Compiled_Settings.compile()
+    created = Counted_Settings.create([1, 2])
+    assert isinstance(created, Counted_Settings)
+    assert created.contents == (1, 2)
+    assert Counted_Settings.calls == [[1, 2]]
+    created = Cached_Settings.create({'a': 1})
+    assert isinstance(created, Cached_Settings)
+    assert created.contents == {'a': 1}
+    # The parent keeps its compiled code.
+    assert Compiled_Settings.create([3]).contents == (3,)
+    # Classes whose metaclass is a source are matched as classes.
+    router = make_router()
+    router.compile()
+    assert router.create(Routed_Base) == 'klass'
+    assert router.create(Routed_Base()) == 'base'
+    assert router.create(int) == 'klass'
+    return
+
+def test_compile_named_items():
+    items = [alpha, beta, array, dataclasses, beta, alpha]
+    expected = [make_named().create(item) for item in items]
+    assert expected == [
+        'alpha', 'beta', 'array', 'dataclasses', 'beta', 'alpha']
+    compiled = make_named()
+    compiled.compile()
+    assert [compiled.create(item) for item in items] == expected
+    assert compiled.create_many(items) == expected
+    return
+
+
 if __name__ == '__main__':
     test_delegate()
     test_sourcerer()
+    test_sourcerer_freeze()
+    test_create_many()
+    test_arbiter()
+    test_sourcerer_layouts()
+    test_compile()
+    test_compile_subclass()
+    test_compile_named_items()
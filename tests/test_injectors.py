@@ -0,0 +1,143 @@
+""" Tests wonka dependency injection. """
+
+from __future__ import annotations
+import dataclasses
+
+import pytest
+
+import wonka
+
+
+@dataclasses.dataclass
+class Database:
+
+    url: str = 'memory'
+
+
+@dataclasses.dataclass
+class Repository:
+
+    database: Database
+
+
+@dataclasses.dataclass
+class Session:
+
+    pass
+
+
+@dataclasses.dataclass
+class Service:
+
+    repository: Repository
+    session: Session
+    database: Database
+    retries: int = 3
+
+
+@dataclasses.dataclass
+class Chicken:
+
+    egg: Egg
+
+
+@dataclasses.dataclass
+class Egg:
+
+    chicken: Chicken
+
+
+@dataclasses.dataclass
+class Greeter:
+
+    name: str
+    greeting: object = None
+    times: int = 1
+
+
+def make_services() -> type[wonka.Injector]:
+
+    class Services(wonka.Injector):
+
+        pass
+
+    Services.register(Database, lifetime = 'singleton')
+    Services.register(Repository)
+    Services.register(Session, lifetime = 'scoped')
+    Services.register(Service)
+    return Services
+
+
+def test_injector():
+    services = make_services()
+    with services.scope():
+        service = services.create('service')
+        other = services.create('service')
+        assert service.session is other.session
+    assert isinstance(service.repository, Repository)
+    assert service.repository is not other.repository
+    assert service.database is service.repository.database
+    assert service.database is other.database
+    assert services.create('database') is service.database
+    assert service.retries == 3
+    with services.scope():
+        assert services.create('service').session is not service.session
+    with pytest.raises(ValueError):
+        services.create('service')
+    assert services.create('repository', {'database': 1}).database == 1
+    return
+
+def test_injector_registry_changes():
+    services = make_services()
+    services.create('repository')
+    services.register(Database(url = 'disk'), name = 'database')
+    assert services.create('repository').database.url == 'disk'
+    with pytest.raises(KeyError):
+        services.create('missing')
+    with pytest.raises(ValueError):
+        services.register(Session, lifetime = 'forever')
+    # Editing the registry directly also discards a stale singleton.
+    services = make_services()
+    first = services.create('database')
+    services.registry['database'] = Database(url = 'edited')
+    assert services.create('database').url == 'edited'
+    services.registry['database'] = Database
+    assert services.create('database') is not first
+    return
+
+def test_injector_isolation():
+
+    class Cyclic(wonka.Injector):
+
+        pass
+
+    class Greetings(wonka.Injector):
+
+        pass
+
+    Cyclic.register(Chicken)
+    Cyclic.register(Egg)
+    with pytest.raises(ValueError):
+        Cyclic.create('chicken')
+    services = make_services()
+    assert 'chicken' not in services.registry
+    assert 'service' not in Cyclic.registry
+    assert services.registry is not wonka.Injector.registry
+    Greetings.register('hello', name = 'greeting')
+    Greetings.register('world', name = 'name')
+    Greetings.register(Greeter)
+    greeter = Greetings.create('greeter')
+    assert (greeter.name, greeter.greeting) == ('world', 'hello')
+    assert greeter.times == 1
+    Greetings.register(Database, lifetime = 'singleton')
+    first = Greetings.create('database')
+    assert Greetings.create('database') is first
+    Greetings.register(Database, lifetime = 'singleton')
+    assert Greetings.create('database') is not first
+    return
+
+
+if __name__ == '__main__':
+    test_injector()
+    test_injector_registry_changes()
+    test_injector_isolation()
@@ -0,0 +1,69 @@
+""" Tests wonka recipe loaders. """
+
+from __future__ import annotations
+import concurrent.futures
+import dataclasses
+import json
+from typing import Any, ClassVar
+
+import pytest
+
+import wonka
+
+
+@dataclasses.dataclass
+class Recipe_Settings(wonka.Flexer, wonka.Delegate):
+
+    contents: Any = None
+
+    @classmethod
+    def from_dict(cls, item: dict[str, Any]) -> Recipe_Settings:
+        return cls(contents = item)
+
+    @classmethod
+    def from_int(cls, item: int) -> Recipe_Settings:
+        return cls(contents = item * 2)
+
+
+@dataclasses.dataclass
+class Recipe_Registry(wonka.Registrar):
+
+    registry: ClassVar[dict[str, Any]] = {'alpha': 'a', 'beta': 'b'}
+
+
+def write_recipes(path, count):
+    with open(path, 'w') as file:
+        for i in range(count):
+            recipe = {'factory': 'settings', 'item': i}
+            if i % 2:
+                recipe['parameters'] = {'odd': True}
+            file.write(json.dumps(recipe) + '\n')
+        file.write('\n')
+    return path
+
+
+def test_load_recipes(tmp_path):
+    path = write_recipes(tmp_path / 'recipes.jsonl', 50)
+    manufacturer = wonka.Manufacturer(contents = {'settings': Recipe_Settings})
+    items = list(wonka.load_recipes(path, manufacturer))
+    assert [i.contents for i in items] == [i * 2 for i in range(50)]
+    assert items[1].odd
+    mapped = wonka.load_recipes(path, manufacturer, memory_map = True)
+    assert [i.contents for i in mapped] == [i * 2 for i in range(50)]
+    with concurrent.futures.ThreadPoolExecutor(4) as executor:
+        pooled = wonka.load_recipes(
+            path, manufacturer, executor = executor, window = 3)
+        assert [i.contents for i in pooled] == [i * 2 for i in range(50)]
+    lines = ['{"item": "beta"}', '{"item": "alpha"}']
+    assert list(wonka.load_recipes(lines, Recipe_Registry)) == ['b', 'a']
+    with pytest.raises(ValueError, match = 'line 2'):
+        list(wonka.load_recipes(['{"item": "alpha"}', '[]'], Recipe_Registry))
+    with pytest.raises(KeyError):
+        list(wonka.load_recipes(['{"factory": "x", "item": 1}'], manufacturer))
+    return
+
+
+if __name__ == '__main__':
+    import pathlib
+    import tempfile
+    test_load_recipes(pathlib.Path(tempfile.mkdtemp()))
@@ -1,9 +1,18 @@
 """ Tests wonka construction managers."""
 
 from __future__ import annotations
+import concurrent.futures
 import dataclasses
+import os
+import pathlib
+import subprocess
+import sys
+import tempfile
+import threading
 from typing import Any, ClassVar
 
+import pytest
+
 import wonka
 
 
@@ -51,5 +60,250 @@ def test_assembler():
     assembly_line.add(setup)
     return
 
+@dataclasses.dataclass
+class Doubler(wonka.Factory):
+
+    @classmethod
+    def create(cls, item: int) -> int:
+        return item * 2
+
+
+@dataclasses.dataclass
+class Incrementer(wonka.Factory):
+
+    @classmethod
+    def create(cls, item: int) -> int:
+        return item + 1
+
+
+@dataclasses.dataclass
+class Batch_Doubler(wonka.Factory):
+
+    batches: ClassVar[list[int]] = []
+
+    @classmethod
+    def create(cls, item: int) -> int:
+        return item * 2
+
+    @classmethod
+    def create_batch(cls, items: list[int]) -> list[int]:
+        cls.batches.append(len(items))
+        return [item * 2 for item in items]
+
+
+@dataclasses.dataclass
+class Counter(wonka.Factory):
+
+    calls: ClassVar[int] = 0
+
+    @classmethod
+    def create(cls, item: int) -> int:
+        cls.calls += 1
+        return item + 100
+
+
+@dataclasses.dataclass
+class Negating_Assembler(wonka.Assembler):
+
+    def create(self, item: int) -> int:
+        return -super().create(item)
+
+
+def test_assembler_compile():
+    inner = wonka.Assembler([Doubler, Incrementer])
+    outer = wonka.Assembler([Incrementer, inner, inner])
+    pipeline = outer.compile()
+    assert pipeline(1) == outer.manage(1) == 11
+    assert len(outer._get_stages()) == 5
+    assert outer._get_stages() is outer._get_stages()
+    inner.insert(0, Incrementer)
+    assert outer.manage(1) == 17
+    outer.delete(0)
+    assert outer.manage(1) == 13
+    outer.prepend(Doubler)
+    assert outer.manage(1) == 17
+    # An Assembler that overrides create is called rather than inlined.
+    negating = Negating_Assembler([Incrementer])
+    assert wonka.Assembler([negating, Doubler]).manage(1) == -4
+    return
+
+def test_assembler_subset():
+    assembly_line = wonka.Assembler([Doubler, Incrementer])
+    assert assembly_line.manage(1) == 3
+    subset = assembly_line.subset(exclude = [Incrementer])
+    assert list(subset) == [Doubler]
+    assert subset.codec is assembly_line.codec
+    assert subset.manage(1) == 2
+    assert list(wonka.Assembler([]).subset(exclude = [1])) == []
+    return
+
+def test_assembler_batches():
+    Batch_Doubler.batches.clear()
+    assembly_line = wonka.Assembler(
+        [Incrementer, Batch_Doubler, Incrementer], chunk_size = 4)
+    results = assembly_line.manage_many(range(10))
+    assert results == [assembly_line.manage(i) for i in range(10)]
+    assert Batch_Doubler.batches == [4, 4, 2]
+    return
+
+def test_assembler_checkpoints(tmp_path):
+    Counter.calls = 0
+    assembly_line = wonka.Assembler(
+        [Counter, Doubler], checkpoints = tmp_path)
+    assert assembly_line.manage(1) == 202
+    assert Counter.calls == 1
+    assert assembly_line.manage(1) == 202
+    assert Counter.calls == 1
+    assembly_line.add(Incrementer)
+    assert assembly_line.manage(1) == 203
+    assert Counter.calls == 1
+    assert assembly_line.manage(2) == 205
+    assert Counter.calls == 2
+    assert assembly_line.manage_many([1, 2, 3]) == [203, 205, 207]
+    assert Counter.calls == 3
+    assert assembly_line.manage(3) == 207
+    assert Counter.calls == 3
+    return
+
+def make_adder(large: bool) -> type[wonka.Factory]:
+
+    if large:
+        class Adder(wonka.Factory):
+            @classmethod
+            def create(cls, item: int) -> int:
+                return item + 100
+    else:
+        class Adder(wonka.Factory):
+            @classmethod
+            def create(cls, item: int) -> int:
+                return item + 1
+    Adder.__qualname__ = 'Adder'
+    return Adder
+
+
+def test_assembler_checkpoint_fingerprints(tmp_path):
+    small = wonka.Assembler([make_adder(False)], checkpoints = tmp_path)
+    assert small.manage(1) == 2
+    large = wonka.Assembler([make_adder(True)], checkpoints = tmp_path)
+    # A changed constant in create is not served from the stale checkpoint.
+    assert large.manage(1) == 101
+
+    @dataclasses.dataclass
+    class Versioned(wonka.Factory):
+
+        checkpoint_version: ClassVar[int] = 1
+        amount: ClassVar[int] = 1
+
+        @classmethod
+        def create(cls, item: int) -> int:
+            return cls.add(item)
+
+        @classmethod
+        def add(cls, item: int) -> int:
+            return item + cls.amount
+
+    versioned = wonka.Assembler([Versioned], checkpoints = tmp_path)
+    assert versioned.manage(1) == 2
+    Versioned.amount = 5
+    assert versioned.manage(1) == 2
+    Versioned.checkpoint_version = 2
+    assert versioned.manage(1) == 6
+    return
+
+def test_assembler_checkpoints_restart(tmp_path):
+    script = (
+        'import sys\n'
+        'import wonka\n'
+        'class Sorter(wonka.Factory):\n'
+        '    @classmethod\n'
+        '    def create(cls, item):\n'
+        '        with open(sys.argv[2], "a") as log:\n'
+        '            log.write("x")\n'
+        '        return sorted(item)\n'
+        'assembly_line = wonka.Assembler([Sorter], checkpoints = sys.argv[1])\n'
+        'print(assembly_line.manage({"a": frozenset("abcdefgh")}["a"]))\n')
+    log = tmp_path / 'log.txt'
+    outputs = {
+        subprocess.run(
+            [sys.executable, '-c', script, str(tmp_path / 'checkpoints'),
+             str(log)],
+            capture_output = True,
+            check = True,
+            env = {
+                **os.environ,
+                'PYTHONHASHSEED': seed,
+                'PYTHONPATH': os.path.dirname(os.path.dirname(wonka.__file__))},
+            text = True).stdout
+        for seed in ('1', '2', '3')}
+    assert len(outputs) == 1
+    # Only the first process ran the stage; the others resumed.
+    assert log.read_text() == 'x'
+    return
+
+def make_blocker(release: threading.Event) -> type[wonka.Factory]:
+
+    class Blocker(wonka.Factory):
+
+        @classmethod
+        def create(cls, item: list[int]) -> list[int]:
+            release.wait(5)
+            item.append(1000)
+            return item
+
+    return Blocker
+
+
+def test_assembler_deadline():
+    release = threading.Event()
+    executor = concurrent.futures.ThreadPoolExecutor()
+    deadline = wonka.Deadline(
+        stage = 0.05, expiry = 'skip', executor = executor)
+    assembly_line = wonka.Assembler(
+        [make_blocker(release), Doubler], deadline = deadline)
+    item = [1]
+    try:
+        assert assembly_line.manage(item) == [1, 1]
+    finally:
+        release.set()
+        executor.shutdown(wait = True)
+    # The expired stage only changed its own copy of the item.
+    assert item == [1]
+    assert deadline.latencies['blocker'].count == 1
+    assert deadline.latencies['doubler'].count == 1
+    release = threading.Event()
+    executor = concurrent.futures.ThreadPoolExecutor()
+    deadline = wonka.Deadline(
+        stage = 0.05, expiry = 'fallback', fallback = -1, executor = executor)
+    assembly_line = wonka.Assembler(
+        [make_blocker(release), Doubler], deadline = deadline)
+    try:
+        assert assembly_line.manage([1]) == -1
+        deadline.expiry = 'raise'
+        with pytest.raises(TimeoutError):
+            assembly_line.manage([1])
+        with pytest.raises(TimeoutError):
+            assembly_line.manage_many([[1], [2]])
+    finally:
+        release.set()
+        executor.shutdown(wait = True)
+    return
+
+def test_histogram_threads():
+    histogram = wonka.Histogram()
+    with concurrent.futures.ThreadPoolExecutor(max_workers = 8) as executor:
+        for _ in range(8):
+            executor.submit(
+                lambda: [histogram.record(i / 1e6) for i in range(2000)])
+    assert histogram.count == 16000
+    return
+
 if __name__ == '__main__':
     test_assembler()
+    test_assembler_compile()
+    test_assembler_subset()
+    test_assembler_batches()
+    test_assembler_checkpoints(pathlib.Path(tempfile.mkdtemp()))
+    test_assembler_checkpoint_fingerprints(pathlib.Path(tempfile.mkdtemp()))
+    test_assembler_checkpoints_restart(pathlib.Path(tempfile.mkdtemp()))
+    test_assembler_deadline()
+    test_histogram_threads()
@@ -0,0 +1,72 @@
+""" Tests wonka warm process pools. """
+
+from __future__ import annotations
+import dataclasses
+from typing import Any, ClassVar
+
+import pytest
+
+import wonka
+
+
+@dataclasses.dataclass
+class Pool_Settings(wonka.Flexer, wonka.Delegate):
+
+    contents: Any = None
+
+    @classmethod
+    def from_dict(cls, item: dict[str, Any]) -> Pool_Settings:
+        return cls(contents = item)
+
+    @classmethod
+    def from_int(cls, item: int) -> Pool_Settings:
+        return cls(contents = item * 2)
+
+
+@dataclasses.dataclass
+class Pool_Registry(wonka.Registrar):
+
+    registry: ClassVar[dict[str, Any]] = {'alpha': 'a', 'beta': 'b'}
+
+
+def test_warm_pool():
+    # Neither the local class nor the entry added at runtime could be found by
+    # a worker that was not forked from this process.
+    class Tripler:
+        @classmethod
+        def create(cls, item: int) -> int:
+            return item * 3
+    Pool_Registry.registry['gamma'] = 'c'
+    manufacturer = wonka.Manufacturer(
+        contents = {'settings': Pool_Settings, 'registry': Pool_Registry})
+    manufacturer.contents['tripler'] = Tripler
+    with wonka.WarmPool(manufacturer, workers = 2) as pool:
+        assert pool.submit('registry', 'gamma').result() == 'c'
+        settings = pool.submit('settings', 4, {'odd': True}).result()
+        assert settings.contents == 8
+        assert settings.odd
+        jobs = [('tripler', i) for i in range(20)]
+        assert list(pool.map(jobs, chunksize = 4)) == [i * 3 for i in range(20)]
+        with pytest.raises(KeyError):
+            pool.submit('missing', 1).result()
+    assert pool._executor is None
+    del Pool_Registry.registry['gamma']
+    return
+
+
+def test_warm_pool_freeze():
+    class Frozen_Registry(wonka.Registrar):
+        registry: ClassVar[dict[str, Any]] = {'alpha': 'a'}
+    pool = wonka.WarmPool({'frozen': Frozen_Registry}, workers = 1, freeze = True)
+    try:
+        assert pool.submit('frozen', 'alpha').result() == 'a'
+    finally:
+        pool.shutdown()
+    with pytest.raises(TypeError):
+        Frozen_Registry.registry['beta'] = 'b'
+    return
+
+
+if __name__ == '__main__':
+    test_warm_pool()
+    test_warm_pool_freeze()
@@ -6,9 +6,14 @@ ToDo:
 
 """
 from __future__ import annotations
+import concurrent.futures
+import copy
 import dataclasses
 import inspect
-from typing import Any
+import pickle
+from typing import Any, ClassVar
+
+import pytest
 
 import wonka
 
@@ -43,6 +48,41 @@ class Setup(wonka.Instancer, wonka.Delegate):
         return cls(contents = item)
 
 
+@dataclasses.dataclass(frozen = True)
+class Frozen:
+
+    tree: str = 'house'
+
+
+@dataclasses.dataclass(slots = True)
+class Slotted:
+
+    tree: str = 'house'
+
+
+@dataclasses.dataclass
+class Expensive(wonka.Deferrer):
+
+    builds: ClassVar[int] = 0
+    contents: dict[str, Any] = dataclasses.field(default_factory = dict)
+
+    def __post_init__(self) -> None:
+        Expensive.builds += 1
+
+
+@dataclasses.dataclass
+class Shadowed(wonka.Deferrer):
+
+    _target: str = 'mine'
+    _lock: str = 'mine'
+
+
+@dataclasses.dataclass
+class Lazy(wonka.Registrar):
+
+    registry: ClassVar[dict[str, Any]] = {'expensive': Expensive}
+
+
 def test_classer():
     contents = {'tree': 'house', 'ghost': 'town'}
     config = Configuration.create(contents)
@@ -61,8 +101,89 @@ def test_instancer():
     assert not inspect.isclass(config)
     return
 
+def test_deferrer():
+    Expensive.builds = 0
+    proxy = Lazy.create('expensive', parameters = {'contents': {'a': 1}})
+    assert isinstance(proxy, Expensive)
+    assert Expensive.builds == 0
+    with concurrent.futures.ThreadPoolExecutor() as executor:
+        results = list(executor.map(lambda _: proxy.contents, range(8)))
+    assert all(r == {'a': 1} for r in results)
+    assert Expensive.builds == 1
+    parameters = {'contents': {'b': 2}}
+    proxy = Lazy.create('expensive', parameters = parameters)
+    parameters['contents'] = {'c': 3}
+    assert copy.copy(proxy) == Expensive(contents = {'b': 2})
+    assert copy.deepcopy(proxy) == proxy
+    assert type(pickle.loads(pickle.dumps(proxy))) is Expensive
+    shadowed = Shadowed.produce(Shadowed)
+    assert (shadowed._target, shadowed._lock) == ('mine', 'mine')
+    # A proxy stored in a registry is copied when it is created from it.
+
+    class Stored(wonka.Registrar):
+
+        registry: ClassVar[dict[str, Any]] = {'proxy': proxy}
+
+    assert Stored.create('proxy') == Expensive(contents = {'b': 2})
+    return
+
+def test_instancer_binding():
+    parameters = {'contents': {'tree': 'house'}, 'ghost': 'town'}
+    for _ in range(2):
+        setup = Setup.produce(Setup, parameters)
+        assert setup.contents['tree'] == 'house'
+        assert setup.ghost == 'town'
+    return
+
+def test_instancer_columns():
+    columns = {'contents': [{'tree': 'house'}, {'ghost': 'town'}]}
+    setups = Setup.produce_columns(Setup, columns)
+    assert [s.contents for s in setups] == columns['contents']
+    return
+
+def test_inject_attributes_many():
+    items = [Slotted(), Slotted(), Setup()]
+    wonka.inject_attributes_many(items, {'tree': 'fort'})
+    assert [i.tree for i in items] == ['fort', 'fort', 'fort']
+    wonka.inject_attributes_many(items, columns = {'tree': ['a', 'b', 'c']})
+    assert [i.tree for i in items] == ['a', 'b', 'c']
+    wonka.inject_attributes_many(items, {'tree': 'hut'}, overwrite = False)
+    assert [i.tree for i in items] == ['a', 'b', 'c']
+    with pytest.raises(AttributeError):
+        wonka.inject_attributes_many([Slotted()], {'ghost': 'town'})
+    with pytest.raises(ValueError):
+        wonka.inject_attributes_many(
+            items,
+            {'tree': 'hut'},
+            columns = {'tree': ['d', 'e', 'f']})
+    # Frozen instances are never changed, and nothing is changed if they are.
+    frozen = [Setup(), Frozen()]
+    wonka.inject_attributes_many(frozen, {'tree': 'hut'}, overwrite = False)
+    assert frozen[1].tree == 'house'
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        wonka.inject_attributes_many(frozen, {'ghost': 'town'})
+    assert not hasattr(frozen[0], 'ghost')
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        wonka.inject_attributes_many(frozen, {'tree': 'fort'})
+    assert frozen[1].tree == 'house'
+    assert hash(frozen[1]) == hash(Frozen())
+    return
+
+def test_producer_batches():
+    parameters = {'contents': {'ghost': 'town'}}
+    setups = Setup.produce_many([Setup, Setup()], parameters)
+    assert all(s.contents == parameters['contents'] for s in setups)
+    settings = Settings.produce_many([Settings])
+    assert settings == [Settings]
+    return
+
 
 if __name__ == '__main__':
     test_classer()
     test_flexer()
     test_instancer()
+    test_deferrer()
+    test_instancer_binding()
+    test_instancer_columns()
+    test_inject_attributes_many()
+    test_producer_batches()
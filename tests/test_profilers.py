@@ -0,0 +1,56 @@
+""" Tests wonka stage profiling. """
+
+from __future__ import annotations
+import dataclasses
+
+import wonka
+
+
+@dataclasses.dataclass
+class Doubler(wonka.Factory):
+
+    @classmethod
+    def create(cls, item: int) -> int:
+        return item * 2
+
+
+@dataclasses.dataclass
+class Incrementer(wonka.Factory):
+
+    @classmethod
+    def create(cls, item: int) -> int:
+        return item + 1
+
+
+def test_profile():
+    inner = wonka.Assembler([Doubler, Incrementer])
+    outer = wonka.Assembler([Incrementer, inner])
+    with wonka.profile(outer) as report:
+        for i in range(3):
+            assert outer.manage(i) == 2 * (i + 1) + 1
+    assert outer.contents[0] is Incrementer
+    assert outer.manage(0) == 3
+    nodes = {path: node for path, node in report.root.walk()}
+    assert nodes[('assembler', 'incrementer')].calls == 3
+    assert nodes[('assembler', 'assembler', 'doubler')].calls == 3
+    assert 'assembler;assembler;doubler ' in report.collapsed()
+    assert report.table().splitlines()[0].startswith('stage')
+    return
+
+def test_profile_repeated_stages():
+    assembler = wonka.Assembler([Incrementer, Doubler, Incrementer])
+    contents = assembler.contents
+    with wonka.profile(assembler) as report:
+        assert list(contents) == [Incrementer, Doubler, Incrementer]
+        assert assembler.manage(1) == 5
+    assert assembler.contents is contents
+    nodes = {path: node for path, node in report.root.walk()}
+    assert nodes[('assembler', 'incrementer[0]')].calls == 1
+    assert nodes[('assembler', 'incrementer[2]')].calls == 1
+    assert nodes[('assembler', 'doubler')].calls == 1
+    return
+
+
+if __name__ == '__main__':
+    test_profile()
+    test_profile_repeated_stages()
@@ -1,8 +1,13 @@
 """ Tests wonka registry factories. """
 from __future__ import annotations
+import array
 import dataclasses
+import gc
+import weakref
 from typing import Any, ClassVar
 
+import pytest
+
 import wonka
 
 
@@ -35,6 +40,40 @@ class Registration_Desk(wonka.Registrar):
         'setup': Setup}
 
 
+@dataclasses.dataclass
+class Point:
+
+    x: float = 0.0
+    y: float = 0.0
+
+
+@dataclasses.dataclass
+class Geometry_Desk(wonka.Registrar):
+
+    registry: ClassVar[dict[str, Any]] = {'point': Point}
+
+
+@dataclasses.dataclass
+@dataclasses.dataclass
+class Plugin(wonka.registries.AutoRegistrar, weak = True):
+    pass
+
+
+@dataclasses.dataclass
+class Loader(wonka.registries.AutoRegistrar):
+    pass
+
+
+@dataclasses.dataclass
+class Exporter(wonka.registries.AutoRegistrar):
+    pass
+
+
+@dataclasses.dataclass
+class Widget(Loader):
+    pass
+
+
 def test_registrar():
     dictionary = {'verbose': True, 'processors': 8}
     config = Registration_Desk.create(
@@ -53,6 +92,129 @@ def test_subclasser():
     assert isinstance(setup, Configuration)
     return
 
+def test_registrar_freeze():
+
+    class Frozen_Desk(wonka.Registrar):
+
+        registry: ClassVar[dict[str, Any]] = {'setup': Setup}
+
+    class Frozen_Child(Frozen_Desk):
+        pass
+
+    Frozen_Child.freeze()
+    assert isinstance(Frozen_Child.create('setup', parameters = {}), Setup)
+    # The registry is frozen on the class that defines it.
+    assert Frozen_Desk.registry is Frozen_Child.registry
+    with pytest.raises(TypeError):
+        Frozen_Desk.registry['configuration'] = Configuration
+    Frozen_Child.freeze()
+    return
+
+def test_registrar_columns():
+    columns = {
+        'x': array.array('d', [1.0, 2.0, 3.0]),
+        'y': memoryview(array.array('d', [4.0, 5.0, 6.0]))}
+    points = Geometry_Desk.create_columns('point', columns)
+    assert points == [Point(1.0, 4.0), Point(2.0, 5.0), Point(3.0, 6.0)]
+    with pytest.raises(ValueError):
+        Geometry_Desk.create_columns('point', {'x': [1.0], 'y': [1.0, 2.0]})
+
+    @dataclasses.dataclass
+    class Vector(wonka.Instancer):
+
+        x: float = 0.0
+        y: float = 0.0
+
+    @dataclasses.dataclass
+    class Labeled(Vector):
+
+        label: str = ''
+
+        @classmethod
+        def produce(
+            cls,
+            item: Any,
+            parameters: dict[str, Any] | None = None,
+            **kwargs: Any) -> Any:
+            instance = super().produce(item, parameters)
+            instance.label = f'{instance.x}, {instance.y}'
+            return instance
+
+    @dataclasses.dataclass
+    class Vector_Desk(wonka.Registrar):
+
+        registry: ClassVar[dict[str, Any]] = {
+            'vector': Vector,
+            'labeled': Labeled}
+
+    columns = {'x': [1.0, 2.0], 'y': [3.0, 4.0]}
+    vectors = Vector_Desk.create_columns('vector', columns)
+    assert vectors == [Vector(1.0, 3.0), Vector(2.0, 4.0)]
+    labeled = Vector_Desk.create_columns('labeled', columns)
+    assert [v.label for v in labeled] == ['1.0, 3.0', '2.0, 4.0']
+    assert labeled == [
+        Vector_Desk.create('labeled', parameters = {'x': 1.0, 'y': 3.0}),
+        Vector_Desk.create('labeled', parameters = {'x': 2.0, 'y': 4.0})]
+    with pytest.raises(ValueError):
+        Vector_Desk.create_columns('labeled', {'x': [1.0], 'y': [1.0, 2.0]})
+    return
+
+def test_weak_registry():
+    baseline = len(Plugin.registry)
+    dynamic = [type(f'Dynamic{i}', (Plugin,), {}) for i in range(1000)]
+    assert len(Plugin.registry) == baseline + 1000
+    reference = weakref.ref(Plugin.registry['dynamic999'])
+    del dynamic
+    gc.collect()
+    assert reference() is None
+    assert len(Plugin.registry) == baseline
+    assert 'plugin' in Plugin.registry
+    assert 'plugin' in wonka.registries.AutoRegistrar.registry
+    return
+
+def test_registry_isolation():
+    other = type('Widget', (Exporter,), {})
+    assert Loader.registry['widget'] is Widget
+    assert Exporter.registry['widget'] is other
+    assert 'exporter' not in Loader.registry
+    assert Widget.registry is Loader.registry
+    index = wonka.registries.AutoRegistrar.registry
+    assert index['loader'] is Loader
+    assert index['exporter'] is Exporter
+    with pytest.raises(TypeError):
+        index['widget'] = other
+    maps = len(index.maps)
+    temporary = type('Temporary', (wonka.registries.AutoRegistrar,), {})
+    assert index['temporary'] is temporary
+    assert len(index.maps) == maps + 1
+    reference = weakref.ref(temporary)
+    del temporary
+    gc.collect()
+    assert reference() is None
+    assert 'temporary' not in index
+    assert len(index.maps) == maps
+    return
+
+def test_cached_keys():
+    keys = wonka.options._CLASS_KEYS
+    assert wonka.options._get_key(Loader) == 'loader'
+    assert keys[Loader][1] == 'loader'
+    default = wonka.options._KEY_NAMER
+    wonka.set_keyer(lambda item: item.__name__.upper())
+    try:
+        # Every stored key is recomputed when the namer changes.
+        assert keys[Loader][1] == 'LOADER'
+        assert wonka.options._get_key(Exporter) == 'EXPORTER'
+    finally:
+        wonka.set_keyer(default)
+    assert wonka.options._get_key(Loader) == 'loader'
+    return
+
 if __name__ == '__main__':
     test_registrar()
+    test_registrar_freeze()
+    test_registrar_columns()
+    test_weak_registry()
+    test_registry_isolation()
+    test_cached_keys()
     test_subclasser()
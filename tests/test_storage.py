@@ -1,9 +1,12 @@
 """ Tests wonka constructor storage classes. """
 from __future__ import annotations
+import abc
+import concurrent.futures
 import dataclasses
 from typing import Any, ClassVar
 
 import wonka
+from wonka.clusters import Hub, Keystone
 
 
 @dataclasses.dataclass
@@ -35,6 +38,53 @@ class Registration_Desk(wonka.Registrar):
         'setup': Setup}
 
 
+class Batch_Desk(Registration_Desk):
+
+    batches: ClassVar[list[list[str]]] = []
+
+    @classmethod
+    def create_many(
+        cls,
+        items: list[str],
+        parameters: dict[str, Any] | None = None) -> list[Any]:
+        cls.batches.append(list(items))
+        return [cls.create(item, parameters) for item in items]
+
+
+@dataclasses.dataclass
+class Reader(Keystone, abc.ABC):
+    pass
+
+
+@dataclasses.dataclass
+class TextReader(Reader):
+    pass
+
+
+@dataclasses.dataclass
+class Writer(Keystone, abc.ABC):
+    pass
+
+
+@dataclasses.dataclass
+class TextWriter(Writer):
+
+    reader: Reader | None = None
+
+
+@dataclasses.dataclass
+class Project:
+
+    reader: Any = None
+    writer: Any = 'text_writer'
+
+
+Hub.add(Reader)
+Hub.add(Writer)
+Hub.register(TextReader)
+Hub.register(TextWriter)
+
+
 def test_manufacturer():
     dictionary = {'verbose': True, 'processors': 8}
     other_dictionary = {'tree': 'house', 'ghost': 'town'}
@@ -53,5 +103,117 @@ def test_manufacturer():
     assert isinstance(registration, Configuration)
     return
 
+def test_manufacturer_views():
+    depot = wonka.Manufacturer()
+    depot.add({'options': Options, 'registration': Registration_Desk})
+    keys = depot.keys()
+    subset = depot.subset(exclude = 'options')
+    assert list(subset.keys()) == ['registration']
+    depot.add({'settings': Settings})
+    assert 'settings' in keys
+    assert len(depot.values()) == 3
+    assert 'settings' in subset
+    assert 'options' not in subset
+    assert len(subset) == 2
+    assert len(depot.subset(include = ['options', 'missing'])) == 1
+    # The view compares and prints like a dict of its own items.
+    expected = {'registration': Registration_Desk, 'settings': Settings}
+    assert subset.contents == expected
+    assert 'options' not in repr(subset.contents)
+    return
+
+def test_manufacturer_create_many():
+    depot = wonka.Manufacturer()
+    depot.add(Options)
+    depot.add({'registration': Registration_Desk})
+    requests = [
+        ('options', 'configuration', {'contents': {'tree': 'house'}}),
+        ('registration', 'setup', None),
+        ('options', 'setup', {})]
+    created = depot.create_many(requests)
+    assert created[0].contents['tree'] == 'house'
+    assert created[1] is Setup
+    assert isinstance(created[2], Setup)
+    with concurrent.futures.ThreadPoolExecutor() as executor:
+        created = depot.create_many(
+            {'registration': ['setup', 'configuration']},
+            executor = executor)
+    assert created == [Setup, Configuration]
+    depot.add({'batch': Batch_Desk})
+    Batch_Desk.batches.clear()
+    created = depot.create_many({'batch': ['setup', 'configuration']})
+    assert created == [Setup, Configuration]
+    assert Batch_Desk.batches == [['setup', 'configuration']]
+    return
+
+def test_hub_validate_all():
+    projects = [Project(), Project()]
+    for project in projects:
+        Hub.validate_all(project, parameters = {'writer': {'reader': None}})
+        assert isinstance(project.reader, TextReader)
+        assert isinstance(project.writer, TextWriter)
+        assert project.writer.reader is None
+    return
+
+def test_hub_validate_graph():
+    project = Project(reader = TextReader)
+    Hub.validate_graph(project)
+    assert isinstance(project.reader, TextReader)
+    assert isinstance(project.writer, TextWriter)
+    assert project.writer.reader is project.reader
+    resolved = []
+
+    class Counting_Hub(Hub):
+
+        @classmethod
+        def _resolve(cls, attribute: str, value: Any) -> type[Keystone]:
+            resolved.append(attribute)
+            return super()._resolve(attribute = attribute, value = value)
+
+    Counting_Hub.validate_graph(Project())
+    assert sorted(resolved) == ['reader', 'writer']
+    with concurrent.futures.ThreadPoolExecutor() as executor:
+        project = Counting_Hub.validate_graph(Project(), executor = executor)
+    assert project.writer.reader is project.reader
+    return
+
+def test_hub_subclass_lookups():
+
+    class Other_Hub(Hub):
+        pass
+
+    Hub.validate(Project(), 'writer')
+    assert Other_Hub._lookups is not Hub._lookups
+    assert not Other_Hub._lookups
+    project = Other_Hub.validate(Project(), 'writer')
+    assert isinstance(project.writer, TextWriter)
+    assert ('writer', 'text_writer') in Other_Hub._lookups
+    return
+
+def test_hub_subclass_registries():
+
+    class Other_Hub(Hub):
+        pass
+
+    class OtherReader(Reader):
+        pass
+
+    Other_Hub.register(OtherReader)
+    Other_Hub.set_default(OtherReader)
+    assert 'other_reader' in Other_Hub.reader
+    assert 'other_reader' not in Hub.reader
+    assert Hub.defaults['reader'] == 'text_reader'
+    project = Other_Hub.validate(Project(), 'reader')
+    assert isinstance(project.reader, OtherReader)
+    project = Hub.validate(Project(), 'reader')
+    assert isinstance(project.reader, TextReader)
+    return
+
 if __name__ == '__main__':
     test_manufacturer()
+    test_manufacturer_views()
+    test_manufacturer_create_many()
+    test_hub_validate_all()
+    test_hub_validate_graph()
+    test_hub_subclass_lookups()
+    test_hub_subclass_registries()
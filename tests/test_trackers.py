@@ -0,0 +1,190 @@
+""" Tests wonka tracked containers. """
+
+from __future__ import annotations
+import copy
+import dataclasses
+import importlib
+import pickle
+import sys
+from collections.abc import MutableMapping
+from typing import Any, ClassVar
+
+import pytest
+
+import wonka
+
+
+@dataclasses.dataclass
+class Adder(wonka.Factory):
+
+    amount: int = 1
+
+    def create(self, item: int) -> int:
+        return item + self.amount
+
+
+@dataclasses.dataclass
+class Tracked_Configuration(wonka.Sourcerer):
+
+    contents: Any = None
+    sources: ClassVar[dict[Any, str]] = wonka.TrackedDict(
+        {MutableMapping: 'dictionary'})
+
+    @classmethod
+    def from_dictionary(cls, item: dict[str, Any]) -> Tracked_Configuration:
+        return cls(contents = 'dictionary')
+
+    @classmethod
+    def from_other(cls, item: dict[str, Any]) -> Tracked_Configuration:
+        return cls(contents = 'other')
+
+
+def test_tracked_containers():
+    registry = wonka.TrackedDict(a = 1)
+    seen = registry.generation
+    assert registry['a'] == 1
+    assert registry.generation == seen
+    registry['b'] = 2
+    assert registry.generation > seen
+    seen = registry.generation
+    registry.setdefault('b', 3)
+    assert registry.generation == seen
+    registry |= {'c': 3}
+    del registry['a']
+    assert registry.generation > seen
+    assert copy.deepcopy(registry) == pickle.loads(pickle.dumps(registry))
+    sequence = wonka.TrackedList([1])
+    seen = sequence.generation
+    sequence.append(2)
+    sequence[0] = 3
+    assert sequence == [3, 2] and sequence.generation > seen
+    assert wonka.trackers.generation(registry, sequence, {}) == max(
+        registry.generation, sequence.generation)
+    return
+
+def test_tracked_caches():
+    assembler = wonka.Assembler(
+        contents = wonka.TrackedList([Adder(), Adder()]))
+    assert assembler.manage(0) == 2
+    assembler.contents[0] = Adder(amount = 10)
+    assert assembler.manage(0) == 11
+    assert isinstance(wonka.Manufacturer().contents, wonka.TrackedDict)
+    Tracked_Configuration.compile()
+    assert Tracked_Configuration.create({}).contents == 'dictionary'
+    # Changing a value in place is detected by the compiled code.
+    Tracked_Configuration.sources[MutableMapping] = 'other'
+    try:
+        assert Tracked_Configuration.create({}).contents == 'other'
+    finally:
+        Tracked_Configuration.sources[MutableMapping] = 'dictionary'
+    return
+
+def test_caller_containers():
+    shared = {}
+    manufacturer = wonka.Manufacturer(contents = shared)
+    shared['adder'] = Adder()
+    assert manufacturer.contents is shared
+    assert 'adder' in manufacturer.contents
+    stages = [Adder()]
+    assembler = wonka.Assembler(contents = stages)
+    assert assembler.contents is stages
+    assert assembler.manage(0) == 1
+    stages.append(Adder())
+    assert assembler.manage(0) == 2
+
+    class Aliased(wonka.registries.Registrar):
+        registry = shared
+
+    assert Aliased.registry is shared
+    shared_lifetimes = {}
+
+    class Aliased_Injector(wonka.Injector):
+        lifetimes = shared_lifetimes
+
+    assert Aliased_Injector.lifetimes is shared_lifetimes
+    return
+
+def test_hot_reload_staging(tmp_path, monkeypatch):
+    (tmp_path / 'staged_registry.py').write_text(
+        'import wonka\n'
+        'REGISTRY = wonka.TrackedDict(old = 1, kept = 1)\n')
+    (tmp_path / 'staging.py').write_text(
+        'import threading\n'
+        'from staged_registry import REGISTRY\n'
+        'REGISTRY["new"] = 2\n'
+        'SEEN = REGISTRY["new"], REGISTRY.get("new"), "new" in REGISTRY\n'
+        'REGISTRY.pop("old", None)\n'
+        'KEYS = sorted(REGISTRY)\n'
+        'OTHER = []\n'
+        'thread = threading.Thread(\n'
+        '    target = lambda: OTHER.append(sorted(REGISTRY)))\n'
+        'thread.start()\n'
+        'thread.join()\n'
+        'if REGISTRY.get("fail"):\n'
+        '    raise RuntimeError("failed")\n')
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.setattr(sys, 'dont_write_bytecode', True)
+    registry = importlib.import_module('staged_registry').REGISTRY
+    module = importlib.import_module('staging')
+    try:
+        registry['old'] = 1
+        del registry['new']
+        wonka.hot_reload(module)
+        assert module.SEEN == (2, 2, True)
+        assert module.KEYS == ['kept', 'new']
+        # Other threads see the original entries until the reload finishes.
+        assert module.OTHER == [['kept', 'old']]
+        assert type(registry) is wonka.TrackedDict
+        assert sorted(registry) == ['kept', 'new']
+        registry['old'] = 1
+        registry['fail'] = True
+        del registry['new']
+        with pytest.raises(RuntimeError):
+            wonka.hot_reload(module)
+        assert sorted(registry) == ['fail', 'kept', 'old']
+        assert type(registry) is wonka.TrackedDict
+    finally:
+        sys.modules.pop('staging', None)
+        sys.modules.pop('staged_registry', None)
+    return
+
+def test_hot_reload(tmp_path, monkeypatch):
+    (tmp_path / 'reloadable.py').write_text(
+        'import wonka\n'
+        'VERSION = 1\n'
+        'class ReloadableRoot(wonka.registries.AutoRegistrar):\n'
+        '    pass\n'
+        'class ReloadableChild(ReloadableRoot):\n'
+        '    version = VERSION\n'
+        'CHILD = ReloadableRoot.registry["reloadable_child"]\n')
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.setattr(sys, 'dont_write_bytecode', True)
+    module = importlib.import_module('reloadable')
+    try:
+        registry = module.ReloadableRoot.registry
+        index = wonka.registries.AutoRegistrar.registry
+        maps = len(index.maps)
+        assert registry['reloadable_child'].version == 1
+        (tmp_path / 'reloadable.py').write_text(
+            (tmp_path / 'reloadable.py').read_text().replace(
+                'VERSION = 1', 'VERSION = 2'))
+        importlib.invalidate_caches()
+        seen = registry.generation
+        wonka.hot_reload(module)
+        assert module.ReloadableRoot.registry is registry
+        assert registry['reloadable_child'].version == 2
+        assert module.CHILD is module.ReloadableChild
+        assert registry.generation > seen
+        assert len(index.maps) == maps
+        module.ReloadableChild.freeze()
+        with pytest.raises(TypeError, match = 'frozen'):
+            wonka.hot_reload(module)
+    finally:
+        sys.modules.pop('reloadable', None)
+    return
+
+
+if __name__ == '__main__':
+    test_tracked_containers()
+    test_tracked_caches()
+    test_caller_containers()